@@ -133,4 +133,10 @@ class App():
                 raise NothingScheduledError("Can't run application with the empty screen stack! "
                                             "To avoid this please see should_run_with_empty_stack "
                                             "global configuration option.")
-        App.get_event_loop().run()
+        try:
+            App.get_event_loop().run()
+        finally:
+            # keep the end of the session when the application is killed by an exception
+            recorder = cls.__app.scheduler.recorder
+            if recorder is not None:
+                recorder.flush()
@@ -27,9 +27,11 @@ import sys
 
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
+from time import monotonic
 
 from simpleline.errors import SimplelineError
 from simpleline.event_loop.ticket_machine import TicketMachine
+from simpleline.event_loop.timers import TimerHandle
 from simpleline.logging import get_simpleline_logger
 
 log = get_simpleline_logger()
@@ -48,16 +50,39 @@ class AbstractEventLoop(metaclass=ABCMeta):
     def __init__(self):
         super().__init__()
         self._handlers = {}
+        # handlers resolved along the MRO of the signal class
+        self._handlers_cache = {}
         self._processed_signals = TicketMachine()
         self._quit_callback = None
         # end most inner loop politely by setting to False
         self._run_loop = True
         self._force_quit = False
+        self._tracer = None
+
+    @property
+    def tracer(self):
+        """Tracer recording the signal processing.
+
+        :returns: Instance of `simpleline.event_loop.tracing.EventLoopTracer` or None if
+                  the tracing is disabled.
+        """
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, tracer):
+        """Set tracer recording the signal processing.
+
+        :param tracer: Tracer to use or None to disable the tracing.
+        :type tracer: Instance of `simpleline.event_loop.tracing.EventLoopTracer` or None.
+        """
+        self._tracer = tracer
 
     def register_signal_handler(self, signal, callback, data=None):
         """Register a callback which will be called when message "event"
         is encountered during process_events.
 
+        Handlers registered to a signal class are called also for signals of its subclasses.
+
         The callback has to accept two arguments:
         - the received message in the form of (type, [arguments])
         - the data registered with the handler
@@ -70,12 +95,45 @@ class AbstractEventLoop(metaclass=ABCMeta):
 
         :param data: Optional data to pass to callback.
         :type data: Anything.
+
+        :returns: Registered handler.
+        :rtype: `simpleline.event_loop.EventHandler` instance.
         """
         if signal not in self._handlers:
             self._handlers[signal] = []
 
         event_handler = self._create_event_handler(callback, data)
         self._handlers[signal].append(event_handler)
+        self._handlers_cache.clear()
+
+        return event_handler
+
+    def unregister_signal_handler(self, signal, callback):
+        """Unregister handlers of the signal class with this callback.
+
+        :param signal: Signal class used for the registration.
+        :type signal: Class based on the simpleline.event_loop.AbstractSignal class.
+
+        :param callback: The callback function or the handler returned by
+                         `register_signal_handler()`.
+        :type callback: func(event_message, data) or `simpleline.event_loop.EventHandler`.
+
+        :returns: True if any handler was removed, False otherwise.
+        :rtype: bool
+        """
+        handlers = self._handlers.get(signal, [])
+        remaining = [h for h in handlers if h is not callback and h.callback != callback]
+
+        if len(remaining) == len(handlers):
+            return False
+
+        if remaining:
+            self._handlers[signal] = remaining
+        else:
+            del self._handlers[signal]
+
+        self._handlers_cache.clear()
+        return True
 
     @abstractmethod
     def register_signal_source(self, signal_source):
@@ -96,6 +154,135 @@ class AbstractEventLoop(metaclass=ABCMeta):
                   signal,
                   signal.source.__class__.__name__)
 
+        if self._tracer is not None:
+            self._tracer.signal_enqueued(signal)
+
+    def enqueue_signals(self, signals):
+        """Enqueue multiple signals for processing at once.
+
+        Signals are enqueued in the given order. Event loop implementations should override
+        this method to enqueue the whole batch with less locking and waking up of the loop.
+        This default implementation just calls `enqueue_signal()` for every signal.
+
+        :param signals: Signals which you want to add to the event queue for processing.
+        :type signals: Iterable of instances based on AbstractEvent class.
+        """
+        for signal in signals:
+            self.enqueue_signal(signal)
+
+    @staticmethod
+    def time():
+        """Return the actual time of the event loop timers in seconds.
+
+        This is a monotonic clock; use it to compute deadlines for the `call_at()` method.
+        """
+        return monotonic()
+
+    def call_at(self, when, callback, *args):
+        """Call the callback from the event loop at the given time.
+
+        The callback is called by the thread running the event loop. Exception raised
+        by the callback is processed the same way as an exception raised by a signal handler.
+
+        This method is thread safe.
+
+        :param when: Time when the callback should be called, see the `time()` method.
+        :type when: float
+
+        :param callback: Function to call.
+        :type callback: func(*args)
+
+        :param args: Arguments passed to the callback.
+
+        :returns: Handle to cancel the call.
+        :rtype: `simpleline.event_loop.timers.TimerHandle` instance.
+        """
+        handle = TimerHandle(when, callback, args)
+        self._add_timer(handle)
+        return handle
+
+    def call_later(self, delay, callback, *args):
+        """Call the callback from the event loop after `delay` seconds.
+
+        See the `call_at()` method.
+
+        :param delay: Delay in seconds.
+        :type delay: float
+
+        :returns: Handle to cancel the call.
+        :rtype: `simpleline.event_loop.timers.TimerHandle` instance.
+        """
+        return self.call_at(self.time() + delay, callback, *args)
+
+    def call_every(self, interval, callback, *args):
+        """Call the callback from the event loop every `interval` seconds.
+
+        The first call is after `interval` seconds. When the loop is late, missed calls are
+        skipped instead of being called in a row. Use the returned handle to stop the calls.
+
+        See the `call_at()` method.
+
+        :param interval: Period of the calls in seconds.
+        :type interval: float greater than 0
+
+        :returns: Handle to cancel the calls.
+        :rtype: `simpleline.event_loop.timers.TimerHandle` instance.
+        """
+        if interval <= 0:
+            raise ValueError("Interval of the repeating timer must be greater than 0.")
+
+        handle = TimerHandle(self.time() + interval, callback, args, interval=interval)
+        self._add_timer(handle)
+        return handle
+
+    @abstractmethod
+    def _add_timer(self, handle):
+        """Schedule the timer in the event loop.
+
+        The loop has to pass the expired timer to the `_run_timer()` method and schedule it
+        again if that method returns True. This method has to be thread safe.
+
+        :param handle: Timer to schedule.
+        :type handle: `simpleline.event_loop.timers.TimerHandle` instance.
+        """
+
+    def _run_timer(self, handle):
+        """Call the callback of the expired timer.
+
+        Exceptions other than `ExitMainLoop` are passed to the `ExceptionSignal` handlers.
+
+        Timers cancelled by a callback of other timer expired at the same time are skipped.
+
+        :returns: True if the timer is repeating and should be scheduled again.
+        :rtype: bool
+        """
+        if handle.cancelled:
+            return False
+
+        log.debug("Running timer %s", handle)
+
+        try:
+            handle.run()
+        except ExitMainLoop:  # pylint: disable=try-except-raise
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # signals module depends on this module
+            from simpleline.event_loop.signals import ExceptionSignal # pylint: disable=import-outside-toplevel
+            self.enqueue_signal(ExceptionSignal(self))
+
+        return handle.interval is not None and not handle.cancelled
+
+    def create_input_reader(self):
+        """Create reader used to get user input with this event loop.
+
+        Override this method if the event loop can wait on user input without threads.
+
+        :returns: Instance of class based on `simpleline.input.input_threading.InputReader` or
+                  None to use the default `SingleThreadInputReader` which reads input for all
+                  the requests in one long-lived thread.
+        """
+        return None
+
     def run(self):
         """Starts the event loop."""
         log.debug("Starting main loop")
@@ -199,6 +386,71 @@ class AbstractEventLoop(metaclass=ABCMeta):
         log.debug("Killing application!")
         sys.exit(1)
 
+    def _get_handlers(self, signal_class):
+        """Get handlers registered to the signal class or any of its base classes.
+
+        Handlers registered to the most specific class are returned first. The result is cached
+        until a handler is registered or unregistered.
+
+        :param signal_class: Class of the processed signal.
+        :type signal_class: Class based on `simpleline.event_loop.AbstractSignal`.
+
+        :returns: Handlers to call.
+        :rtype: tuple of `simpleline.event_loop.EventHandler` instances
+        """
+        try:
+            return self._handlers_cache[signal_class]
+        except KeyError:
+            pass
+
+        handlers = []
+        for cls in signal_class.__mro__:
+            handlers.extend(self._handlers.get(cls, ()))
+
+        handlers = tuple(handlers)
+        self._handlers_cache[signal_class] = handlers
+        return handlers
+
+    def _find_handlers(self, signal):
+        """Find handlers which should be called for this signal.
+
+        Unhandled `ExceptionSignal` will kill the application.
+        """
+        handlers = self._get_handlers(type(signal))
+
+        if not handlers:
+            # signals module depends on this module
+            from simpleline.event_loop.signals import ExceptionSignal # pylint: disable=import-outside-toplevel
+            if isinstance(signal, ExceptionSignal):
+                handlers = (self._create_event_handler(self.kill_app_with_traceback, None),)
+
+        return handlers
+
+    def _trace_enqueued_signals(self, signals):
+        """Stamp the signals enqueued in a batch if the tracing is enabled."""
+        tracer = self._tracer
+        if tracer is not None:
+            for signal in signals:
+                tracer.signal_enqueued(signal)
+
+    def _trace_processed_signal(self, signal):
+        """Record queue wait of the signal if the tracing is enabled."""
+        if self._tracer is not None:
+            self._tracer.signal_processed(signal)
+
+    def _call_handler(self, handler, signal):
+        """Call the handler and record the call if the tracing is enabled."""
+        tracer = self._tracer
+        if tracer is None:
+            handler.callback(signal, handler.data)
+            return
+
+        start = tracer.clock()
+        try:
+            handler.callback(signal, handler.data)
+        finally:
+            tracer.handler_finished(signal, handler, start)
+
     @staticmethod
     def _create_event_handler(callback, data):
         """Create event handler data object and return it."""
@@ -237,6 +489,8 @@ class AbstractEventLoop(metaclass=ABCMeta):
 class EventHandler():
     """Data class to save event handlers."""
 
+    __slots__ = ("callback", "data")
+
     def __init__(self, callback, data):
         self.callback = callback
         self.data = data
@@ -247,11 +501,22 @@ class AbstractSignal(metaclass=ABCMeta):
 
     .. NOTE:
             Ordering and equality is based on priority.
+
+    Set the `mergeable` class attribute to True if processing one signal has the same effect
+    as processing more signals of this class with the same source. Event loops will then keep
+    at most one such signal waiting for processing, see `merge_key`.
     """
 
+    mergeable = False
+
+    # Subclasses should define `__slots__` too, otherwise every signal gets its own `__dict__`.
+    __slots__ = ("_source", "_priority", "enqueue_time")
+
     def __init__(self, source, priority=0):
         self._source = source
         self._priority = priority
+        # set by the event loop tracer
+        self.enqueue_time = None
 
     def __lt__(self, other):
         """Order Signal classes by priority."""
@@ -279,3 +544,16 @@ class AbstractSignal(metaclass=ABCMeta):
     def source(self):
         """Source which emitted this event."""
         return self._source
+
+    @property
+    def merge_key(self):
+        """Key of signals which can be merged to one.
+
+        A new signal is dropped if a signal with the same key is already waiting for processing.
+
+        :return: Tuple of the signal class and source for mergeable signals, otherwise `None`.
+        """
+        if not self.mergeable:
+            return None
+
+        return (self.__class__, self._source)
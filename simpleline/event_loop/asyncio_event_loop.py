@@ -0,0 +1,281 @@
+# Event loop using asyncio.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import asyncio
+import os
+import sys
+
+from simpleline import App
+from simpleline.event_loop.main_loop import MainLoop
+from simpleline.event_loop.signals import InputReceivedSignal
+from simpleline.input.input_threading import InputReader, SingleThreadInputReader
+from simpleline.logging import get_simpleline_logger
+
+log = get_simpleline_logger()
+
+__all__ = ["AsyncioEventLoop", "AsyncioInputReader"]
+
+
+class AsyncioEventLoop(MainLoop):
+    """Event loop running on top of an asyncio event loop.
+
+    Signals are queued and processed the same way as by the `MainLoop`. However, when there
+    is no signal to process, the asyncio loop is running so other asyncio tasks and callbacks
+    registered to the same loop are processed meanwhile. User input is read by the asyncio loop
+    too, see `AsyncioInputReader`.
+
+    The asyncio loop is driven by this class. It must not be running when the Simpleline event
+    loop is started. Asyncio code can communicate with Simpleline by the `enqueue_signal()`
+    method which is thread safe.
+    """
+
+    def __init__(self, loop=None):
+        """Create the event loop.
+
+        :param loop: Asyncio event loop to use; if not specified a new loop is created.
+        :type loop: `asyncio.AbstractEventLoop` instance.
+        """
+        super().__init__()
+        if loop is None:
+            loop = asyncio.new_event_loop()
+
+        self._loop = loop
+        self._waiting = False
+        self._wake_up_future = None
+        log.debug("Asyncio event loop is used!")
+
+    @property
+    def asyncio_loop(self):
+        """Asyncio event loop used by this event loop."""
+        return self._loop
+
+    def create_input_reader(self):
+        """Create reader which reads user input by the asyncio loop."""
+        return AsyncioInputReader(self._loop)
+
+    def enqueue_signal(self, signal):
+        """Enqueue new event for processing.
+
+        This method is thread safe.
+
+        :param signal: Event which you want to add to the event queue for processing.
+        :type signal: Instance based on AbstractEvent class.
+        """
+        super().enqueue_signal(signal)
+        self._wake_up()
+
+    def enqueue_signals(self, signals):
+        """Enqueue multiple signals for processing at once.
+
+        This method is thread safe.
+
+        :param signals: Signals which you want to add to the event queue for processing.
+        :type signals: Iterable of instances based on AbstractEvent class.
+        """
+        super().enqueue_signals(signals)
+        self._wake_up()
+
+    def _add_timer(self, handle):
+        """Schedule the timer in the event loop.
+
+        This method is thread safe.
+
+        :param handle: Timer to schedule.
+        :type handle: `simpleline.event_loop.timers.TimerHandle` instance.
+        """
+        super()._add_timer(handle)
+        self._wake_up()
+
+    def force_quit(self):
+        """Force quit all running event loops.
+
+        Kill all loop including inner loops (modal window).
+        None of the Simpleline events will be processed anymore.
+        """
+        super().force_quit()
+        self._wake_up()
+
+    def _wake_up(self):
+        """Stop waiting in the asyncio loop if the loop is waiting on signals."""
+        if not self._waiting:
+            return
+
+        try:
+            self._loop.call_soon_threadsafe(self._resolve_wake_up_future)
+        except RuntimeError:
+            # the loop is already closed
+            pass
+
+    def _resolve_wake_up_future(self):
+        future = self._wake_up_future
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def _wait_for_signal(self):
+        """Run the asyncio loop until a signal is available in the active queue.
+
+        The asyncio loop is stopped also when the next Simpleline timer expires.
+
+        :returns: Signal or None if the loop was quit during waiting.
+        """
+        while True:
+            self._run_expired_timers()
+            signal = self._active_queue.peek()
+            if signal is not None or not self._run_loop:
+                break
+
+            self._wake_up_future = self._loop.create_future()
+            # set the flag before the last check, signal enqueued after the check will wake us up
+            self._waiting = True
+            timer = None
+            try:
+                if self._active_queue.empty() and self._run_loop:
+                    timeout = self._get_timer_timeout()
+                    if timeout is not None:
+                        timer = self._loop.call_later(timeout, self._resolve_wake_up_future)
+
+                    self._loop.run_until_complete(self._wake_up_future)
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+                self._waiting = False
+                self._wake_up_future = None
+
+        if not self._run_loop:
+            return None
+
+        return self._active_queue.get()
+
+
+class AsyncioInputReader(InputReader):
+    """Read user input by the asyncio loop without starting a thread for every prompt.
+
+    Requests which are not simple line inputs (e.g. passwords) and inputs which can't be
+    watched by the asyncio loop (e.g. replaced `sys.stdin` or loops without the `add_reader`
+    support) are read by the `SingleThreadInputReader` instead.
+    """
+
+    def __init__(self, loop):
+        """Create the reader.
+
+        :param loop: Asyncio loop watching the standard input.
+        :type loop: `asyncio.AbstractEventLoop` instance.
+        """
+        super().__init__()
+        self._loop = loop
+        self._thread_reader = SingleThreadInputReader()
+        # request read by the thread reader
+        self._thread_request = None
+        self._request = None
+        self._fd = None
+        self._pending_data = b""
+
+    def start(self, input_request):
+        fd = self._get_stdin_fd() if input_request.line_input else None
+
+        if fd is None:
+            self._start_thread_reader(input_request)
+            return
+
+        self._print_prompt(input_request)
+
+        if self._deliver_pending_line(input_request):
+            return
+
+        try:
+            self._loop.add_reader(fd, self._read_stdin)
+        except NotImplementedError:
+            log.debug("Asyncio loop can't watch stdin, using thread instead.")
+            self._start_thread_reader(input_request)
+            return
+
+        self._request = input_request
+        self._fd = fd
+
+    def finish(self, input_request):
+        if input_request is self._request:
+            self._stop_watching()
+
+        self._thread_reader.finish(input_request)
+
+    def is_reading(self, input_request):
+        # reading by the asyncio loop is stopped by `finish()`
+        if input_request is not self._thread_request:
+            return False
+
+        return self._thread_reader.is_reading(input_request)
+
+    def close(self):
+        self._stop_watching()
+        self._thread_reader.close()
+
+    def _start_thread_reader(self, input_request):
+        self._thread_request = input_request
+        self._thread_reader.start(input_request)
+
+    @staticmethod
+    def _get_stdin_fd():
+        try:
+            return sys.stdin.fileno()
+        except (AttributeError, ValueError, OSError):
+            return None
+
+    @staticmethod
+    def _print_prompt(input_request):
+        App.get_configuration().output_sink.write(input_request.text_prompt())
+
+    def _stop_watching(self):
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+
+        self._request = None
+        self._fd = None
+
+    def _read_stdin(self):
+        data = os.read(self._fd, 4096)
+        request = self._request
+
+        if not data:
+            # nothing more can be read, report the input as failed
+            self._stop_watching()
+            self._emit_input(request, "", success=False)
+            return
+
+        self._pending_data += data
+
+        if self._deliver_pending_line(request):
+            self._stop_watching()
+
+    def _deliver_pending_line(self, input_request):
+        """Emit the first complete line read from the input if available."""
+        line, separator, rest = self._pending_data.partition(b"\n")
+        if not separator:
+            return False
+
+        self._pending_data = rest
+        encoding = getattr(sys.stdin, "encoding", None) or "utf-8"
+        self._emit_input(input_request, line.decode(encoding, "replace"))
+        return True
+
+    @staticmethod
+    def _emit_input(input_request, data, success=True):
+        App.get_event_loop().enqueue_signal(InputReceivedSignal(input_request, data,
+                                                                success=success))
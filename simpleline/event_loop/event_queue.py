@@ -23,8 +23,9 @@
 #
 
 
-from queue import PriorityQueue
-from threading import Lock
+import heapq
+from itertools import count
+from threading import Lock, Condition
 
 from simpleline.errors import SimplelineError
 
@@ -43,10 +44,22 @@ class EventQueue():
     * sorting by priority of signals
     * managing sources for this event queue
     * enqueuing signals
+
+    Signals are stored in a heap together with a sequence number so signals with the same
+    priority are always returned in the FIFO order.
+
+    Mergeable signals (see `AbstractSignal.merge_key`) are coalesced. If a signal with the same
+    merge key is already waiting in the queue, the new signal is dropped.
     """
 
     def __init__(self):
-        self._queue = PriorityQueue()
+        # heap of (priority, sequence number, signal) items
+        self._queue = []
+        self._sequence = count()
+        # merge keys of mergeable signals waiting in the queue
+        self._pending_keys = set()
+        self._woken_up = False
+        self._condition = Condition(Lock())
         self._contained_screens = set()
         self._lock = Lock()
 
@@ -55,7 +68,10 @@ class EventQueue():
 
         :return: True if empty, False otherwise.
         """
-        return self._queue.empty()
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._condition:
+            return not self._queue
 
     def enqueue(self, signal):
         """Enqueue signal to this queue.
@@ -63,7 +79,29 @@ class EventQueue():
         :param signal: Signal which should be enqueued to this queue.
         :type signal: Signal class based on `simpleline.event_loop.signals.AbstractSignal`.
         """
-        self._queue.put(signal)
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._condition:
+            if self._push(signal):
+                self._condition.notify()
+
+    def enqueue_signals(self, signals):
+        """Enqueue multiple signals to this queue at once.
+
+        The consumer waiting in the `get()` method is woken up only once.
+
+        :param signals: Signals which should be enqueued to this queue.
+        :type signals: List of signals based on `simpleline.event_loop.signals.AbstractSignal`.
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._condition:
+            pushed = False
+            for signal in signals:
+                pushed = self._push(signal) or pushed
+
+            if pushed:
+                self._condition.notify()
 
     def enqueue_if_source_belongs(self, signal, source):
         """Enqueue signal to this queue if the signal source belongs to this queue.
@@ -79,37 +117,112 @@ class EventQueue():
         :rtype: bool
         """
         if self.contains_source(source):
-            self._queue.put(signal)
+            self.enqueue(signal)
             return True
 
         return False
 
-    def get(self):
+    def get(self, timeout=None):
         """Return enqueued signal with the highest priority.
 
         This is FIFO implementation for the same priority.
         If the queue is empty this method will wait for the input signal.
 
-        :return: Queued signal.
-        :rtype: Signal based on class `simpleline.event_loop.signals.AbstractSignal`.
+        Waiting ends also after the `wake_up()` call and, when `timeout` is specified, after
+        `timeout` seconds. `None` is returned if no signal was enqueued meanwhile.
+
+        :param timeout: Maximal time to wait in seconds or None to wait for a signal.
+        :type timeout: float
+
+        :return: Queued signal or `None` when the wait ended without a signal.
+        :rtype: Signal based on class `simpleline.event_loop.signals.AbstractSignal` or `None`.
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._condition:
+            if timeout is None:
+                while not self._queue and not self._woken_up:
+                    self._condition.wait()
+            elif not self._queue and not self._woken_up and timeout > 0:
+                self._condition.wait(timeout)
+
+            self._woken_up = False
+
+            if not self._queue:
+                return None
+
+            return self._pop()
+
+    def wake_up(self):
+        """Stop waiting of the `get()` call.
+
+        The next `get()` call returns immediately when this is called while nobody is waiting.
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._condition:
+            self._woken_up = True
+            self._condition.notify()
+
+    def peek(self):
+        """Return enqueued signal with the highest priority without removing it.
+
+        This method never waits.
+
+        :return: Queued signal or `None` if the queue is empty.
+        :rtype: Signal based on class `simpleline.event_loop.signals.AbstractSignal` or `None`.
         """
-        return self._queue.get()
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._condition:
+            if not self._queue:
+                return None
+
+            return self._queue[0][2]
 
     def get_top_event_if_priority(self, priority):
         """Return top enqueued signal if priority is equal to `priority`. Otherwise `None`.
 
+        This method never waits. `None` is returned also when the queue is empty.
+
         :param priority: Requested event priority.
         :type priority: int
 
         :return: Queued signal if it has requested priority. Otherwise `None`.
         :rtype: Signal based on class `simpleline.event_loop.signals.AbstractSignal` or `None`.
         """
-        event = self._queue.get()
-        if event.priority == priority:
-            return event
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._condition:
+            if self._queue and self._queue[0][0] == priority:
+                return self._pop()
+
+            return None
+
+    def _push(self, signal):
+        """Push signal to the heap if it can't be merged. Must be called with the lock held.
+
+        :return: True if the signal was pushed, False if it was merged.
+        """
+        key = signal.merge_key
+        if key is not None:
+            if key in self._pending_keys:
+                return False
+
+            self._pending_keys.add(key)
+
+        heapq.heappush(self._queue, (signal.priority, next(self._sequence), signal))
+        return True
 
-        self._queue.put(event)
-        return None
+    def _pop(self):
+        """Pop the top signal from the heap. Must be called with the lock held."""
+        signal = heapq.heappop(self._queue)[2]
+
+        key = signal.merge_key
+        if key is not None:
+            self._pending_keys.discard(key)
+
+        return signal
 
     def add_source(self, signal_source):
         """Add new source of signals to this queue.
@@ -151,3 +264,17 @@ class EventQueue():
         # pylint: disable=not-context-manager
         with self._lock:
             return signal_source in self._contained_screens
+
+    def contained_sources(self, signal_sources):
+        """Return sources from `signal_sources` which belong to this queue.
+
+        :param signal_sources: Sources of signals to test.
+        :type signal_sources: Iterable of signal sources.
+
+        :return: Sources contained in this queue.
+        :rtype: set
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            return self._contained_screens.intersection(signal_sources)
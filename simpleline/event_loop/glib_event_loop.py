@@ -21,12 +21,16 @@
 #
 # Author(s): Jiri Konecny <jkonecny@redhat.com>
 #
+import math
+
 from collections import namedtuple
+from threading import Lock
 
 import gi
 
 from simpleline.event_loop import AbstractEventLoop, ExitMainLoop
 from simpleline.event_loop.signals import ExceptionSignal
+from simpleline.event_loop.timers import TimerHeap
 from simpleline.logging import get_simpleline_logger
 
 gi.require_version("GLib", "2.0")
@@ -35,7 +39,7 @@ from gi.repository import GLib # pylint: disable=wrong-import-order, wrong-impor
 
 log = get_simpleline_logger()
 
-CallbackArgs = namedtuple("CallbackArgs", ["signal", "source", "handlers"])
+CallbackArgs = namedtuple("CallbackArgs", ["signal", "source", "loop_data"])
 
 
 __all__ = ["GLibEventLoop"]
@@ -48,6 +52,12 @@ class GLibEventLoop(AbstractEventLoop):
         # Create first loop
         loop = GLib.MainLoop()
         self._event_loops = [EventLoopData(loop)]
+        # guard merge keys of signals waiting in the loops
+        self._lock = Lock()
+        # timers of all the loops and the GLib source waking up the active loop for them
+        self._timers = TimerHeap()
+        self._timer_source = None
+        self._timer_lock = Lock()
         log.debug("GLib event loop is used!")
 
     @property
@@ -77,7 +87,48 @@ class GLibEventLoop(AbstractEventLoop):
         super().enqueue_signal(signal)
 
         loop_data = self._find_loop_data_for_source(signal.source)
-        self._register_handlers_to_loop(loop_data.loop, signal)
+        if self._reserve_merge_key(loop_data, signal):
+            self._register_handlers_to_loop(loop_data, signal)
+
+    def enqueue_signals(self, signals):
+        """Enqueue multiple signals for processing at once.
+
+        Signals with the same priority going to the same event loop are processed by one
+        GLib idle source so the loop is woken up only once for them.
+
+        :param signals: Signals which you want to add to the event queue for processing.
+        :type signals: Iterable of instances based on AbstractEvent class.
+        """
+        if self._force_quit:
+            return
+
+        signals = list(signals)
+        if not signals:
+            return
+
+        log.debug("%d signals enqueued in a batch", len(signals))
+        self._trace_enqueued_signals(signals)
+
+        loops_by_source = {}
+        batches = {}
+
+        for signal in signals:
+            source = signal.source
+            if source not in loops_by_source:
+                loops_by_source[source] = self._find_loop_data_for_source(source)
+
+            loop_data = loops_by_source[source]
+            if not self._reserve_merge_key(loop_data, signal):
+                continue
+
+            key = (id(loop_data), signal.priority)
+            if key not in batches:
+                batches[key] = (loop_data, [])
+
+            batches[key][1].append(signal)
+
+        for (_loop_id, priority), (loop_data, batch) in batches.items():
+            self._register_batch_to_loop(loop_data, priority, batch)
 
     def _find_loop_data_for_source(self, source):
         """Find event loop belonging to this signal source."""
@@ -87,47 +138,168 @@ class GLibEventLoop(AbstractEventLoop):
 
         return self._event_loops[-1]
 
-    def _register_handlers_to_loop(self, event_loop, signal):
-        """Register handlers to the event loop."""
-        context = event_loop.get_context()
-        handlers = []
+    def _reserve_merge_key(self, loop_data, signal):
+        """Reserve merge key of the signal in the loop.
 
-        if type(signal) in self._handlers: # pylint: disable=unidiomatic-typecheck
-            handlers = self._handlers[type(signal)]
-        elif isinstance(signal, ExceptionSignal):
-            handler_data = self._create_event_handler(self.kill_app_with_traceback, None)
-            handlers = [handler_data]
+        :return: False if the same mergeable signal is already waiting in the loop.
+        :rtype: bool
+        """
+        key = signal.merge_key
+        if key is None:
+            return True
+
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            if key in loop_data.pending_keys:
+                return False
+
+            loop_data.pending_keys.add(key)
+            return True
+
+    def _release_merge_key(self, loop_data, signal):
+        """Signal is going to be processed, new signals with the same key can be enqueued."""
+        key = signal.merge_key
+        if key is None:
+            return
+
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            loop_data.pending_keys.discard(key)
+
+    def _register_handlers_to_loop(self, loop_data, signal):
+        """Register handlers to the event loop."""
+        context = loop_data.loop.get_context()
 
         # GLib event source which contains handler callback
         # Every source can hold only one callback
         source = GLib.idle_source_new()
         source.set_priority(signal.priority)
-        data = CallbackArgs(signal, source, handlers)
+        data = CallbackArgs(signal, source, loop_data)
 
         source.set_callback(self._run_handlers, data)
         # attach source to the event loop
         source.attach(context)
 
+    def _register_batch_to_loop(self, loop_data, priority, signals):
+        """Register handlers of multiple signals with the same priority to one event source."""
+        context = loop_data.loop.get_context()
+
+        source = GLib.idle_source_new()
+        source.set_priority(priority)
+        batch = [CallbackArgs(signal, source, loop_data) for signal in signals]
+
+        source.set_callback(self._run_batch_handlers, batch)
+        source.attach(context)
+
     def _run_handlers(self, data):
         """Run handlers attached to this signal and clean source afterwards."""
-        signal = data.signal
-        source = data.source
-        handlers = data.handlers
-
-        if not self._force_quit:
-            try:
-                for handler in handlers:
-                    handler.callback(signal, handler.data)
-            except ExitMainLoop:
-                self._quit_all_loops()
-            except Exception:  # pylint: disable=broad-except
-                self.enqueue_signal(ExceptionSignal(self))
+        self._release_merge_key(data.loop_data, data.signal)
+        self._call_handlers(data.signal)
 
         # based on GLib documentation we should clean source
         # source will be removed from event loop context this way
-        source.destroy()
+        data.source.destroy()
+
+        self._mark_signal_processed(data.signal)
+
+    def _run_batch_handlers(self, batch):
+        """Run handlers of all signals in the batch and clean source afterwards."""
+        for data in batch:
+            self._release_merge_key(data.loop_data, data.signal)
+            loop_quit = not self._call_handlers(data.signal)
+            self._mark_signal_processed(data.signal)
+
+            if loop_quit:
+                break
+
+        batch[0].source.destroy()
+
+    def _call_handlers(self, signal):
+        """Call handlers of the signal.
+
+        Handlers are resolved when the signal is processed so handlers unregistered in the
+        meantime are not called.
+
+        :returns: False if the loops were quit by a handler, True otherwise.
+        :rtype: bool
+        """
+        if self._force_quit:
+            return False
+
+        self._trace_processed_signal(signal)
+
+        try:
+            for handler in self._find_handlers(signal):
+                self._call_handler(handler, signal)
+        except ExitMainLoop:
+            self._quit_all_loops()
+            return False
+        except Exception:  # pylint: disable=broad-except
+            self.enqueue_signal(ExceptionSignal(self))
+
+        return True
+
+    def _add_timer(self, handle):
+        """Schedule the timer in the event loop.
+
+        Timers are kept in one heap for all the loops, so they are running also in a nested
+        loop of a modal screen. Only one GLib timeout source waking up the active loop at
+        the next deadline exists.
+
+        This method is thread safe.
+
+        :param handle: Timer to schedule.
+        :type handle: `simpleline.event_loop.timers.TimerHandle` instance.
+        """
+        if self._force_quit:
+            return
 
-        self._mark_signal_processed(signal)
+        if self._timers.push(handle):
+            self._schedule_timer_source()
+
+    def _schedule_timer_source(self):
+        """Attach the timeout source for the next timer deadline to the active loop."""
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._timer_lock:
+            if self._timer_source is not None:
+                self._timer_source.destroy()
+                self._timer_source = None
+
+            deadline = self._timers.next_deadline()
+            if deadline is None or self._force_quit:
+                return
+
+            delay = max(deadline - self.time(), 0)
+            source = GLib.timeout_source_new(math.ceil(delay * 1000))
+            source.set_callback(self._run_glib_timers)
+            source.attach(self._event_loops[-1].loop.get_context())
+            self._timer_source = source
+
+    def _run_glib_timers(self, *_args):
+        """Run the expired timers and schedule the repeating ones again."""
+        now = self.time()
+
+        try:
+            for handle in self._timers.pop_expired(now):
+                if not self._run_timer(handle):
+                    continue
+
+                # skip the missed periods if the loop is late
+                handle.deadline += handle.interval
+                if handle.deadline <= now:
+                    handle.deadline = now + handle.interval
+
+                self._timers.push(handle)
+        except ExitMainLoop:
+            self._quit_all_loops()
+            return GLib.SOURCE_REMOVE
+
+        # replaces this source by the source for the next deadline
+        self._schedule_timer_source()
+        return GLib.SOURCE_REMOVE
 
     def _quit_all_loops(self):
         for loop_data in reversed(self._event_loops):
@@ -147,6 +319,8 @@ class GLibEventLoop(AbstractEventLoop):
         None of the Simpleline events will be processed anymore.
         """
         super().force_quit()
+        self._timers.clear()
+        self._schedule_timer_source()
         self._quit_all_loops()
 
     def execute_new_loop(self, signal):
@@ -166,6 +340,8 @@ class GLibEventLoop(AbstractEventLoop):
         new_loop = GLib.MainLoop(new_context)
         loop_data = EventLoopData(new_loop)
         self._event_loops.append(loop_data)
+        # timers have to run in the new loop
+        self._schedule_timer_source()
 
         self.enqueue_signal(signal)
         new_loop.run()
@@ -178,6 +354,8 @@ class GLibEventLoop(AbstractEventLoop):
         super().close_loop()
         old_loop_data = self._event_loops.pop()
         old_loop_data.loop.quit()
+        # the timeout source of the closed loop won't be dispatched anymore
+        self._schedule_timer_source()
 
     def process_signals(self, return_after=None):
         """This method processes incoming async messages.
@@ -222,3 +400,5 @@ class EventLoopData():
         super().__init__()
         self.loop = loop
         self.sources = set()
+        # merge keys of mergeable signals waiting in this loop
+        self.pending_keys = set()
@@ -25,6 +25,7 @@ from threading import Lock
 from simpleline.event_loop import AbstractEventLoop, ExitMainLoop
 from simpleline.event_loop.event_queue import EventQueue
 from simpleline.event_loop.signals import ExceptionSignal
+from simpleline.event_loop.timers import TimerHeap
 from simpleline.logging import get_simpleline_logger
 
 log = get_simpleline_logger()
@@ -44,6 +45,7 @@ class MainLoop(AbstractEventLoop):
         self._active_queue = EventQueue()
         self._event_queues = [self._active_queue]
         self._lock = Lock()
+        self._timers = TimerHeap()
 
     def register_signal_source(self, signal_source):
         """Register source of signal for actual event queue.
@@ -75,6 +77,7 @@ class MainLoop(AbstractEventLoop):
         """
         super().force_quit()
         self._event_queues.clear()
+        self._timers.clear()
         self._run_loop = False
 
     def execute_new_loop(self, signal):
@@ -146,6 +149,105 @@ class MainLoop(AbstractEventLoop):
 
         self._active_queue.enqueue(signal)
 
+    def enqueue_signals(self, signals):
+        """Enqueue multiple signals for processing at once.
+
+        Every signal goes to the same queue as it would by the `enqueue_signal()` method.
+        However, target queue is resolved only once for every distinct source and every
+        queue is locked and woken up only once for the whole batch.
+
+        This method is thread safe.
+
+        :param signals: Signals which you want to add to the event queue for processing.
+        :type signals: Iterable of instances based on AbstractEvent class.
+        """
+        if self._force_quit:
+            return
+
+        signals = list(signals)
+        if not signals:
+            return
+
+        log.debug("%d signals enqueued in a batch", len(signals))
+        self._trace_enqueued_signals(signals)
+
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            target_queues = self._find_queues_for_sources({s.source for s in signals})
+
+            batches = {}
+            for signal in signals:
+                queue = target_queues[signal.source]
+                batches.setdefault(queue, []).append(signal)
+
+            for queue, batch in batches.items():
+                queue.enqueue_signals(batch)
+
+    def _add_timer(self, handle):
+        """Schedule the timer in the event loop.
+
+        The loop waiting on signals is woken up if the new timer expires first.
+
+        This method is thread safe.
+
+        :param handle: Timer to schedule.
+        :type handle: `simpleline.event_loop.timers.TimerHandle` instance.
+        """
+        if self._force_quit:
+            return
+
+        if self._timers.push(handle):
+            self._active_queue.wake_up()
+
+    def _run_expired_timers(self):
+        """Call callbacks of all the expired timers and schedule the repeating ones again."""
+        now = self.time()
+
+        for handle in self._timers.pop_expired(now):
+            if not self._run_timer(handle):
+                continue
+
+            # skip the missed periods if the loop is late
+            handle.deadline += handle.interval
+            if handle.deadline <= now:
+                handle.deadline = now + handle.interval
+
+            self._timers.push(handle)
+
+    def _get_timer_timeout(self):
+        """Return time in seconds to the next timer deadline or None if there is no timer."""
+        deadline = self._timers.next_deadline()
+        if deadline is None:
+            return None
+
+        return max(deadline - self.time(), 0)
+
+    def _find_queues_for_sources(self, sources):
+        """Find the most inner queue for every source.
+
+        Sources which doesn't belong to any queue will use the active queue.
+
+        :return: Dictionary with source as key and queue as value.
+        """
+        target_queues = {}
+        pending = set(sources)
+
+        for queue in reversed(self._event_queues):
+            if not pending:
+                break
+
+            contained = queue.contained_sources(pending)
+            for source in contained:
+                target_queues[source] = queue
+
+            pending -= contained
+
+        for source in pending:
+            target_queues[source] = self._active_queue
+
+        return target_queues
+
     def _mainloop(self):
         """Single mainloop. Do not use directly, start the application using run()."""
         # run infinite loop
@@ -189,7 +291,9 @@ class MainLoop(AbstractEventLoop):
         unique_id = self._register_wait_on_signal(return_after)
 
         while self._run_loop:
-            signal = self._active_queue.get()
+            signal = self._wait_for_signal()
+            if signal is None:
+                return
 
             # do the signal processing (call handlers)
             self._process_signal(signal)
@@ -199,7 +303,8 @@ class MainLoop(AbstractEventLoop):
                 return
 
     def _process_signals_iteration(self):
-        """Process queued signal and then return."""
+        """Process expired timers and queued signal and then return."""
+        self._run_expired_timers()
         priority = None
 
         while not self._active_queue.empty() and self._run_loop:
@@ -220,21 +325,41 @@ class MainLoop(AbstractEventLoop):
     def _process_signals_loop(self):
         """Process signal until the event loop quited."""
         while self._run_loop:
-            signal = self._active_queue.get()
+            signal = self._wait_for_signal()
+            if signal is None:
+                return
+
             self._process_signal(signal)
 
+    def _wait_for_signal(self):
+        """Wait until a signal is available in the active queue and return it.
+
+        Timers expiring meanwhile are processed; the loop sleeps only until the next
+        timer deadline.
+
+        :returns: Signal or None if the loop was quit during waiting.
+        """
+        while self._run_loop:
+            self._run_expired_timers()
+            if not self._run_loop:
+                break
+
+            signal = self._active_queue.get(self._get_timer_timeout())
+            if signal is not None:
+                return signal
+
+        return None
+
     def _process_signal(self, signal):
         log.debug("Processing signal %s", signal)
 
         self._mark_signal_processed(signal)
+        self._trace_processed_signal(signal)
 
-        if type(signal) in self._handlers: # pylint: disable=unidiomatic-typecheck
-            for handler_data in self._handlers[type(signal)]:
-                try:
-                    handler_data.callback(signal, handler_data.data)
-                except ExitMainLoop:  # pylint: disable=try-except-raise
-                    raise
-                except Exception:  # pylint: disable=broad-except
-                    self.enqueue_signal(ExceptionSignal(self))
-        elif isinstance(signal, ExceptionSignal):
-            self.kill_app_with_traceback(signal)
+        for handler_data in self._find_handlers(signal):
+            try:
+                self._call_handler(handler_data, signal)
+            except ExitMainLoop:  # pylint: disable=try-except-raise
+                raise
+            except Exception:  # pylint: disable=broad-except
+                self.enqueue_signal(ExceptionSignal(self))
@@ -24,7 +24,7 @@ from sys import exc_info
 from simpleline.event_loop import AbstractSignal
 
 __all__ = ["ExceptionSignal", "InputReadySignal", "RenderScreenSignal", "CloseScreenSignal",
-           "InputReceivedSignal"]
+           "InputReceivedSignal", "ProgressSignal"]
 
 
 class ExceptionSignal(AbstractSignal):
@@ -37,6 +37,8 @@ class ExceptionSignal(AbstractSignal):
     is disabled!
     """
 
+    __slots__ = ("exception_info",)
+
     def __init__(self, source, exception_info=None):
         """Create exception signal with higher priority (-20) than other signals.
 
@@ -57,6 +59,9 @@ class ExceptionSignal(AbstractSignal):
 
 class InputReadySignal(AbstractSignal):
     """Input from user is ready for processing."""
+
+    __slots__ = ("input_handler_source", "data", "success")
+
     def __init__(self, source, input_handler_source, data, priority=0, success=True):
         """Store user input inside of this signal
 
@@ -97,14 +102,40 @@ class InputReceivedSignal(AbstractSignal):
     This signal will be further processed and InputReadySignal should be enqueued soon.
     Most probably you are looking for InputReadySignal instead.
     """
-    def __init__(self, source, data, priority=0):
+
+    __slots__ = ("data", "success")
+
+    def __init__(self, source, data, priority=0, success=True):
         super().__init__(source, priority=priority)
         self.data = data
+        self.success = success
 
 
 class RenderScreenSignal(AbstractSignal):
-    """Render UIScreen to terminal."""
+    """Render UIScreen to terminal.
+
+    Only one render signal from the same source is waiting for processing. Rendering the
+    screen more times in a row wouldn't change anything.
+    """
+
+    __slots__ = ()
+
+    mergeable = True
 
 
 class CloseScreenSignal(AbstractSignal):
     """Close current screen."""
+
+    __slots__ = ()
+
+
+class ProgressSignal(AbstractSignal):
+    """State of a progress widget changed.
+
+    The source of this signal is the widget. The state itself is kept by the widget, so only
+    one signal from the same widget is waiting for processing.
+    """
+
+    __slots__ = ()
+
+    mergeable = True
@@ -0,0 +1,155 @@
+# Timers of the event loops.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import heapq
+from itertools import count
+from threading import Lock
+
+__all__ = ["TimerHandle", "TimerHeap"]
+
+
+class TimerHandle():
+    """Callback scheduled by `call_later()`, `call_at()` or `call_every()` of an event loop.
+
+    Use the `cancel()` method to stop the timer.
+    """
+
+    __slots__ = ("deadline", "interval", "callback", "args", "_cancelled")
+
+    def __init__(self, deadline, callback, args=(), interval=None):
+        """Create the timer handle.
+
+        :param deadline: Time when the callback should be called, see `AbstractEventLoop.time()`.
+        :type deadline: float
+
+        :param callback: Function called when the timer expires.
+        :type callback: func(*args)
+
+        :param args: Arguments passed to the callback.
+        :type args: tuple
+
+        :param interval: Period of a repeating timer in seconds or None for a one shot timer.
+        :type interval: float
+        """
+        self.deadline = deadline
+        self.interval = interval
+        self.callback = callback
+        self.args = args
+        self._cancelled = False
+
+    @property
+    def cancelled(self):
+        """Was the timer cancelled?"""
+        return self._cancelled
+
+    def cancel(self):
+        """Cancel the timer; the callback won't be called anymore.
+
+        Cancelling of an expired or already cancelled timer does nothing.
+        """
+        self._cancelled = True
+
+    def run(self):
+        """Call the callback of the timer."""
+        self.callback(*self.args)
+
+    def __repr__(self):
+        return "TimerHandle(deadline={}, interval={}, callback={})".format(self.deadline,
+                                                                          self.interval,
+                                                                          self.callback)
+
+
+class TimerHeap():
+    """Thread safe heap of timers sorted by their deadlines.
+
+    Cancelled timers are not removed immediately; they are dropped when they get
+    to the top of the heap.
+    """
+
+    def __init__(self):
+        # heap of (deadline, sequence number, timer handle) items
+        self._heap = []
+        self._sequence = count()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, handle):
+        """Add timer to the heap.
+
+        :param handle: Timer to add.
+        :type handle: `TimerHandle` instance.
+
+        :returns: True if the timer is the first to expire now.
+        :rtype: bool
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            heapq.heappush(self._heap, (handle.deadline, next(self._sequence), handle))
+            return self._heap[0][2] is handle
+
+    def next_deadline(self):
+        """Return deadline of the first timer to expire.
+
+        :returns: Deadline or None if there is no timer.
+        :rtype: float or None
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            self._drop_cancelled()
+            if not self._heap:
+                return None
+
+            return self._heap[0][0]
+
+    def pop_expired(self, now):
+        """Remove and return timers with deadline before or equal to `now`.
+
+        :param now: Actual time.
+        :type now: float
+
+        :returns: Expired timers sorted by their deadlines.
+        :rtype: list of `TimerHandle` instances
+        """
+        expired = []
+
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                handle = heapq.heappop(self._heap)[2]
+                if not handle.cancelled:
+                    expired.append(handle)
+
+        return expired
+
+    def clear(self):
+        """Remove all the timers."""
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            self._heap.clear()
+
+    def _drop_cancelled(self):
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
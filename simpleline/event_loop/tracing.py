@@ -0,0 +1,143 @@
+# Tracing of the event loop signal processing.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+import threading
+
+from collections import deque
+from itertools import count
+from time import perf_counter
+
+__all__ = ["EventLoopTracer"]
+
+
+class EventLoopTracer():
+    """Record how long signals wait in the queue and how long their handlers run.
+
+    Set the tracer to an event loop by the `AbstractEventLoop.tracer` property. Recorded events
+    can be saved in the Chrome trace event format by the `dump()` method and opened in
+    a profiler UI (e.g. chrome://tracing or Perfetto).
+
+    Time spent in the queue is recorded as an asynchronous event of the signal class name,
+    every handler call is recorded as a complete event of the callback name on the thread
+    processing the signal.
+    """
+
+    def __init__(self, max_events=100000):
+        """Create the tracer.
+
+        :param max_events: Maximal number of recorded events; the oldest events are dropped.
+        :type max_events: int
+        """
+        super().__init__()
+        self._events = deque(maxlen=max_events)
+        self._ids = count(1)
+        self._pid = os.getpid()
+
+    @staticmethod
+    def clock():
+        """Return the actual time in seconds used for all the events."""
+        return perf_counter()
+
+    @property
+    def events(self):
+        """Recorded events in the Chrome trace event format.
+
+        :returns: List of dictionaries.
+        """
+        return list(self._events)
+
+    def clear(self):
+        """Drop all the recorded events."""
+        self._events.clear()
+
+    def signal_enqueued(self, signal):
+        """Stamp the signal with the time of enqueuing.
+
+        :param signal: Signal enqueued.
+        :type signal: Instance based on `simpleline.event_loop.AbstractSignal`.
+        """
+        signal.enqueue_time = self.clock()
+
+    def signal_processed(self, signal):
+        """Record the time the signal waited in the queue.
+
+        Call this when the signal is taken from the queue for processing.
+
+        :param signal: Signal which is processed.
+        :type signal: Instance based on `simpleline.event_loop.AbstractSignal`.
+        """
+        enqueue_time = signal.enqueue_time
+        if enqueue_time is None:
+            return
+
+        event_id = next(self._ids)
+        name = signal.__class__.__name__
+        args = {"priority": signal.priority, "source": signal.source.__class__.__name__}
+
+        self._add_event(name, "queue", "b", enqueue_time, id=event_id, args=args)
+        self._add_event(name, "queue", "e", self.clock(), id=event_id)
+
+    def handler_finished(self, signal, handler, start):
+        """Record the call of a signal handler.
+
+        :param signal: Signal passed to the handler.
+        :type signal: Instance based on `simpleline.event_loop.AbstractSignal`.
+
+        :param handler: Handler called.
+        :type handler: `simpleline.event_loop.EventHandler` instance.
+
+        :param start: Time when the handler was called, see `clock()`.
+        :type start: float
+        """
+        end = self.clock()
+        name = getattr(handler.callback, "__qualname__", None) or repr(handler.callback)
+        self._add_event(name, "handler", "X", start, dur=_to_us(end - start),
+                        tid=threading.get_ident(),
+                        args={"signal": signal.__class__.__name__})
+
+    def dump(self, file):
+        """Save the recorded events as Chrome trace event JSON.
+
+        :param file: Path or opened text file object.
+        :type file: str or text file object
+        """
+        data = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+        if isinstance(file, str):
+            with open(file, "wt", encoding="utf-8") as f:
+                json.dump(data, f)
+        else:
+            json.dump(data, file)
+
+    def _add_event(self, name, category, phase, timestamp, tid=0, **kwargs):
+        event = {"name": name,
+                 "cat": category,
+                 "ph": phase,
+                 "ts": _to_us(timestamp),
+                 "pid": self._pid,
+                 "tid": tid}
+        event.update(kwargs)
+        self._events.append(event)
+
+
+def _to_us(seconds):
+    return round(seconds * 1000000, 3)
@@ -20,6 +20,8 @@
 
 from getpass import getpass
 
+from simpleline.render.output_sinks import TTYOutputSink
+
 __all__ = ["GlobalConfiguration"]
 
 DEFAULT_WIDTH = 80
@@ -36,6 +38,9 @@ class GlobalConfiguration():
         self._width = DEFAULT_WIDTH
         self._getpass = DEFAULT_PASSWORD_FUNC
         self._run_with_empty_stack = False
+        self._differential_output = False
+        self._terminal_supports_ansi = False
+        self._output_sink = TTYOutputSink()
 
     @property
     def width(self):
@@ -110,3 +115,83 @@ class GlobalConfiguration():
         Default: False
         """
         self._run_with_empty_stack = False
+
+    @property
+    def differential_output(self):
+        """Should be only the changed lines of the screen written on redraw?
+
+        :returns: True if differential output is enabled, False otherwise (default).
+        """
+        return self._differential_output
+
+    @differential_output.setter
+    def differential_output(self, value):
+        """Enable or disable differential output of screens.
+
+        The differential output remembers the last printed screen and rewrites only the changed
+        lines. This requires terminal with ANSI escape sequences support, see the
+        `terminal_supports_ansi` option. Without the support whole screens are printed.
+
+        :param value: True to enable differential output.
+        :type value: bool
+        """
+        self._differential_output = value
+
+    def clear_differential_output(self):
+        """Clear user defined differential output and set the default.
+
+        Default: False
+        """
+        self._differential_output = False
+
+    @property
+    def terminal_supports_ansi(self):
+        """Does the terminal support ANSI escape sequences?
+
+        :returns: True if ANSI escape sequences can be used, False otherwise (default).
+        """
+        return self._terminal_supports_ansi
+
+    @terminal_supports_ansi.setter
+    def terminal_supports_ansi(self, value):
+        """Set if the terminal supports ANSI escape sequences.
+
+        :param value: True if ANSI escape sequences (cursor addressing) can be used.
+        :type value: bool
+        """
+        self._terminal_supports_ansi = value
+
+    def clear_terminal_supports_ansi(self):
+        """Clear user defined ANSI escape sequences support and set the default.
+
+        Default: False
+        """
+        self._terminal_supports_ansi = False
+
+    @property
+    def output_sink(self):
+        """Get destination of everything printed by Simpleline.
+
+        :returns: Instance of class based on `simpleline.render.output_sinks.AbstractOutputSink`.
+        """
+        return self._output_sink
+
+    @output_sink.setter
+    def output_sink(self, sink):
+        """Set destination of everything printed by Simpleline.
+
+        Use `simpleline.render.output_sinks.MemoryOutputSink` to capture the output in tests
+        and headless runs or `simpleline.render.output_sinks.FileOutputSink` to write to a file.
+
+        :param sink: Output sink.
+        :type sink: Instance of class based on
+                    `simpleline.render.output_sinks.AbstractOutputSink`.
+        """
+        self._output_sink = sink
+
+    def clear_output_sink(self):
+        """Clear user defined output sink and set the default.
+
+        Default: `simpleline.render.output_sinks.TTYOutputSink` writing to `sys.stdout`
+        """
+        self._output_sink = TTYOutputSink()
@@ -18,7 +18,6 @@
 # along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-import sys
 
 from simpleline import App
 from simpleline.event_loop.signals import InputReadySignal
@@ -52,17 +51,19 @@ class InputHandler():
         self._input_successful = False
         self._skip_concurrency_check = False
         self._source = source
+        self._timeout_handle = None
+        self._timed_out = False
 
         self._register_input_ready_signal()
 
     def _register_input_ready_signal(self):
-        App.get_event_loop().register_signal_handler(InputReadySignal,
-                                                     self._input_received_handler)
+        InputThreadManager.get_instance().register_input_handler(self)
 
     def _input_received_handler(self, signal, args):
         if signal.input_handler_source != self:
             return
 
+        self._cancel_timeout()
         self._input_received = True
         self._input_successful = signal.success
 
@@ -148,7 +149,14 @@ class InputHandler():
         """
         return self._input_successful
 
-    def get_input(self, prompt):
+    def input_timed_out(self):
+        """Was the default input used because the user didn't answer in time?
+
+        :returns: bool
+        """
+        return self._timed_out
+
+    def get_input(self, prompt, timeout=None, default=""):
         """Use prompt to ask for user input and wait (non-blocking) on user input.
 
         This is an asynchronous call. If you want to wait for user input then use
@@ -157,19 +165,46 @@ class InputHandler():
 
         Check if user input was already received can be done by the `input_received` method call.
 
+        When `timeout` is specified and the user doesn't answer in time, the `default` is
+        received as the user input. The timeout is measured by a timer of the event loop.
+
         :param prompt: Ask user what you want to get.
         :type prompt: String or Prompt instance.
 
+        :param timeout: Seconds to wait on the user input or None to wait forever.
+        :type timeout: int or float
+
+        :param default: Input received when the timeout expires.
+        :type default: str
+
         :returns: User input.
         :rtype: str
         """
         self._clear_input()
-        self._invoke_input_thread(prompt)
+        thread_object = self._invoke_input_thread(prompt)
+
+        if timeout is not None:
+            self._timeout_handle = App.get_event_loop().call_later(timeout,
+                                                                   self._input_timeout_handler,
+                                                                   thread_object,
+                                                                   default)
 
     def _invoke_input_thread(self, prompt):
         thread_object = self.create_thread_object(prompt)
         InputThreadManager.get_instance().start_input_thread(thread_object,
                                                              not self._skip_concurrency_check)
+        return thread_object
+
+    def _input_timeout_handler(self, thread_object, default):
+        self._timeout_handle = None
+
+        if InputThreadManager.get_instance().input_timed_out(thread_object, default):
+            self._timed_out = True
+
+    def _cancel_timeout(self):
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
 
     def create_thread_object(self, prompt):
         """Create thread object containing all the information how to get user input.
@@ -179,13 +214,17 @@ class InputHandler():
         return InputHandlerRequest(App.get_configuration().width, prompt, self)
 
     def _clear_input(self):
+        self._cancel_timeout()
         self._input_received = False
+        self._timed_out = False
         self._input = None
 
 
 class InputHandlerRequest(InputRequest):
     """This is thread object to get input from user without blocking main thread."""
 
+    line_input = True
+
     def __init__(self, width, prompt, input_handler):
         """Create request object to get input in InputThreadManager.
 
@@ -224,8 +263,7 @@ class InputHandlerRequest(InputRequest):
 
     def _ask_input(self):
         text_prompt = self.text_prompt()
-        sys.stdout.write(text_prompt)
-        sys.stdout.flush()
+        App.get_configuration().output_sink.write(text_prompt)
 
         return self._get_input()
 
@@ -270,6 +308,8 @@ class PasswordInputHandler(InputHandler):
 class PasswordInputHandlerRequest(InputHandlerRequest):
     """Similar as InputHandlerRequest but don't echo user keys."""
 
+    line_input = False
+
     def __init__(self, width, prompt, input_handler, getpass_func):
         """Create request object to get password input in InputThreadManager.
 
@@ -17,7 +17,9 @@
 # along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import queue
 import threading
+import weakref
 from abc import ABCMeta, abstractmethod
 
 from simpleline import App
@@ -34,18 +36,38 @@ class InputThreadManager():
     """Manager object for input threads.
 
     This manager helps with concurrent user input (still you really shouldn't do that).
+
+    It also routes `InputReadySignal` signals to the InputHandler instances waiting for them.
+    Only one signal handler is registered to the event loop for all the InputHandlers and
+    the InputHandlers are referenced weakly, so they are released when not used anymore.
     """
 
     __instance = None
 
-    def __init__(self):
+    def __init__(self, reader=None):
+        """Create input manager.
+
+        :param reader: Reader used to get input for the requests; if not specified use
+                       `SingleThreadInputReader`.
+        :type reader: Instance of class based on `InputReader`.
+        """
         super().__init__()
         self._input_stack = []
         self._processing_input = False
+        # request the reader was started for
+        self._reader_request = None
+        # timed out request the reader is still reading input for
+        self._late_request = None
+        self._input_handlers = weakref.WeakSet()
+        self._reader = reader or SingleThreadInputReader()
 
     @classmethod
     def create_new_instance(cls):
-        instance = InputThreadManager()
+        if cls.__instance:
+            cls.__instance.reader.close()
+
+        reader = App.get_event_loop().create_input_reader()
+        instance = InputThreadManager(reader)
         cls.__instance = instance
 
         instance._post_init_configuration() # pylint: disable=protected-access
@@ -54,6 +76,8 @@ class InputThreadManager():
         # pylint: disable=protected-access
         App.get_event_loop().register_signal_handler(InputReceivedSignal,
                                                      self.__instance._input_received_handler)
+        App.get_event_loop().register_signal_handler(InputReadySignal,
+                                                     self.__instance._input_ready_handler)
 
     @classmethod
     def get_instance(cls):
@@ -62,22 +86,118 @@ class InputThreadManager():
 
         return cls.__instance
 
+    @property
+    def reader(self):
+        """Reader used to get input for the requests.
+
+        :returns: Instance of class based on `InputReader`.
+        """
+        return self._reader
+
+    @reader.setter
+    def reader(self, reader):
+        """Replace the reader used to get input for the requests.
+
+        The old reader is closed. Don't replace the reader while waiting on input.
+
+        :param reader: New reader.
+        :type reader: Instance of class based on `InputReader`.
+        """
+        self._reader.close()
+        self._reader = reader
+
+    def register_input_handler(self, input_handler):
+        """Deliver `InputReadySignal` signals to this InputHandler.
+
+        The InputHandler is referenced weakly, it is not necessary to unregister it.
+
+        :param input_handler: InputHandler which should receive its input.
+        :type input_handler: `simpleline.input.input_handler.InputHandler` based instance.
+        """
+        self._input_handlers.add(input_handler)
+
+    def unregister_input_handler(self, input_handler):
+        """Stop delivering `InputReadySignal` signals to this InputHandler.
+
+        :param input_handler: InputHandler registered by `register_input_handler()`.
+        :type input_handler: `simpleline.input.input_handler.InputHandler` based instance.
+        """
+        self._input_handlers.discard(input_handler)
+
+    def _input_ready_handler(self, signal, args):
+        input_handler = signal.input_handler_source
+
+        if input_handler in self._input_handlers:
+            input_handler._input_received_handler(signal, args) # pylint: disable=protected-access
+
     def _input_received_handler(self, signal, args):
+        if signal.source is self._late_request:
+            # the user typed the line after the timeout, it answers the prompt shown now
+            self._late_request = None
+
+            if not self._input_stack:
+                log.debug("Dropping input typed after the timeout, no prompt is waiting.")
+                self._processing_input = False
+                return
+
+            if not self._input_stack[-1].line_input:
+                # the line was echoed, don't use it e.g. as a password; read the input now
+                log.debug("Dropping input typed after the timeout, the prompt doesn't read lines.")
+                self._reader_request = self._input_stack[-1]
+                self._reader.start(self._reader_request)
+                return
+        elif signal.source not in self._input_stack:
+            # the request was already answered, e.g. by the default input after its timeout
+            log.debug("Dropping input of the finished request %s.", signal.source)
+            return
+
         thread_object = self._input_stack.pop()
-        thread_object.emit_input_ready_signal(signal.data)
+        if signal.success:
+            thread_object.emit_input_ready_signal(signal.data)
+        else:
+            thread_object.emit_failed_input_ready_signal()
+
+        self._reader.finish(thread_object)
 
-        if thread_object.thread:
-            thread_object.thread.join()
+        if thread_object.timed_out and thread_object is self._reader_request \
+           and self._reader.is_reading(thread_object):
+            # the reader can't stop reading; don't start it again, only print the next prompts
+            self._late_request = thread_object
 
         # wait until used object ends
         for t in self._input_stack:
             t.emit_failed_input_ready_signal()
-            if t.thread:
-                t.thread.join()
+            self._reader.finish(t)
 
         # remove all other items waiting for input
         self._input_stack.clear()
-        self._processing_input = False
+        self._processing_input = self._late_request is not None
+
+    def input_timed_out(self, input_request, default):
+        """Answer the request by the default input because the user didn't answer in time.
+
+        The default input is processed the same way as an input from the user.
+
+        :param input_request: Request which timed out.
+        :type input_request: Instance of class based on `InputRequest`.
+
+        :param default: Input used instead of the user input.
+        :type default: str
+
+        :returns: True if the default is used, False if the request is not waiting
+                  on the input anymore.
+        :rtype: bool
+        """
+        if not self._input_stack or self._input_stack[-1] is not input_request:
+            return False
+
+        log.info("User input timed out, using the default input.")
+        input_request.timed_out = True
+
+        # end the line with the prompt
+        App.get_configuration().output_sink.write("\n")
+        App.get_event_loop().enqueue_signal(InputReceivedSignal(input_request, default))
+        return True
 
     def start_input_thread(self, input_thread_object, concurrent_check=True):
         """Start input thread to get user input.
@@ -87,8 +207,18 @@ class InputThreadManager():
         """
         self._input_stack.append(input_thread_object)
         self._check_input_thread_running(concurrent_check)
+        self._flush_output()
         self._start_user_input_async()
 
+    @staticmethod
+    def _flush_output():
+        """Write the screen printed so far, the prompt must be printed after it."""
+        output = App.get_scheduler().differential_output
+        if output is not None and output.frame_started:
+            output.flush_frame()
+
+        App.get_configuration().output_sink.flush_frame()
+
     def _check_input_thread_running(self, raise_concurrent_check):
         if len(self._input_stack) != 1:
             if not raise_concurrent_check:
@@ -111,19 +241,131 @@ class InputThreadManager():
         thread_object = self._input_stack[-1]
 
         if self._processing_input:
-            self._print_new_prompt(thread_object)
+            # prompt of a request which doesn't read lines is printed when its reading starts;
+            # the user shouldn't type e.g. a password to the line read after a timeout
+            if self._late_request is None or thread_object.line_input:
+                self._print_new_prompt(thread_object)
             return
 
-        thread_object.initialize_thread()
         self._processing_input = True
-        thread_object.start_thread()
+        self._reader_request = thread_object
+        self._reader.start(thread_object)
 
     @staticmethod
     def _print_new_prompt(thread_object):
         prompt = thread_object.text_prompt()
 
         # print new prompt
-        print(prompt, end="")
+        if prompt:
+            App.get_configuration().output_sink.write(prompt)
+
+
+class InputReader(metaclass=ABCMeta):
+    """Base class for the ways how `InputThreadManager` gets user input.
+
+    Reader starts getting input for a request and when the input is obtained it enqueues
+    the `InputReceivedSignal` signal with the request as a source. Then the `finish()` method
+    is called from the event loop.
+    """
+
+    @abstractmethod
+    def start(self, input_request):
+        """Start getting input for the request.
+
+        :param input_request: Request for the input.
+        :type input_request: Instance of class based on `InputRequest`.
+        """
+
+    def finish(self, input_request):
+        """Clean up after the request is not waiting for input anymore.
+
+        This is called from the event loop after the input was received or when the request
+        was replaced by a newer one.
+
+        :param input_request: Request started by the `start()` method.
+        :type input_request: Instance of class based on `InputRequest`.
+        """
+
+    def is_reading(self, input_request):
+        """Is the reader still reading input for the finished request?
+
+        Readers which can't interrupt reading keep reading after the request was answered by
+        its timeout. The line read then answers the prompt shown at that time.
+
+        :param input_request: Request started by the `start()` method.
+        :type input_request: Instance of class based on `InputRequest`.
+
+        :returns: True if the `InputReceivedSignal` of the request will be enqueued later.
+        :rtype: bool
+        """
+        return False
+
+    def close(self):
+        """Release resources of this reader. The reader won't be used anymore."""
+
+
+class ThreadInputReader(InputReader):
+    """Get input for every request in a new thread."""
+
+    def start(self, input_request):
+        input_request.initialize_thread()
+        input_request.start_thread()
+
+    def finish(self, input_request):
+        # the thread is still blocked by reading of the input
+        if input_request.thread and not input_request.timed_out:
+            input_request.thread.join()
+
+    def is_reading(self, input_request):
+        return not input_request.input_read
+
+
+class SingleThreadInputReader(InputReader):
+    """Get input for all requests in one long-lived thread.
+
+    Requests are served one by one in the order they were started. The thread is started with
+    the first request and ends when the reader is closed.
+
+    This is the default input reader.
+
+    A read can't be interrupted. When a request is answered by its timeout, the thread keeps
+    waiting and the next line typed by the user answers the prompt shown at that time. Prompts
+    of the next requests are printed by `InputThreadManager` until the line is typed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._requests = queue.Queue()
+        self._thread = None
+
+    def start(self, input_request):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(name=INPUT_THREAD_NAME, target=self._serve_requests)
+            self._thread.daemon = True
+            self._thread.start()
+
+        self._requests.put(input_request)
+
+    def is_reading(self, input_request):
+        return not input_request.input_read
+
+    def close(self):
+        if self._thread is not None:
+            # stop the thread after the actual request is served
+            self._requests.put(None)
+            self._thread = None
+
+    def _serve_requests(self):
+        while True:
+            input_request = self._requests.get()
+            if input_request is None:
+                return
+
+            # the thread has to survive a failure of one request, it serves all of them
+            try:
+                input_request.run()
+            except Exception:  # pylint: disable=broad-except
+                log.exception("Input request %s failed.", input_request)
 
 
 class InputRequest(metaclass=ABCMeta):
@@ -137,15 +379,25 @@ class InputRequest(metaclass=ABCMeta):
     The `text_prompt` method is used to get textual representation of a prompt. This will be used
     on concurrent input to replace existing prompt to get new input.
 
+    Set the `line_input` class attribute to True if the `get_input` method only prints
+    the `text_prompt()` and reads one line from the standard input. Input readers can then read
+    the line without calling the `get_input` method.
+
     WARNING:
         The `run_input` method will run in a separate thread!
     """
 
+    line_input = False
+
     def __init__(self, source, requester_source=None):
         super().__init__()
         self._source = source
         self._requester_source = requester_source
         self.thread = None
+        # the request was answered by a default input
+        self.timed_out = False
+        # the input was read; it's set before the input is sent to the event loop
+        self.input_read = False
 
     @property
     def source(self):
@@ -212,10 +464,19 @@ class InputRequest(metaclass=ABCMeta):
         """Run the `run_input` method and propagate input outside.
 
         Do not call this method directly. It will be called by InputThreadManager.
-        """
-        data = self.get_input()
 
-        App.get_event_loop().enqueue_signal(InputReceivedSignal(self, data))
+        If getting of the input fails, the request is answered as failed.
+        """
+        try:
+            data = self.get_input()
+            success = True
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Getting user input failed.")
+            data = ""
+            success = False
+
+        self.input_read = True
+        App.get_event_loop().enqueue_signal(InputReceivedSignal(self, data, success=success))
 
     @abstractmethod
     def text_prompt(self):
@@ -0,0 +1,207 @@
+# Input reader answering prompts from a script.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from time import perf_counter
+
+from simpleline import App
+from simpleline.event_loop import ExitMainLoop
+from simpleline.event_loop.signals import InputReceivedSignal
+from simpleline.input.input_threading import InputReader
+from simpleline.logging import get_simpleline_logger
+from simpleline.render.instrumentation import Histogram
+from simpleline.render.screen.input_manager import InputManager
+from simpleline.render.session_recorder import read_session
+
+log = get_simpleline_logger()
+
+__all__ = ["ScriptedInputReader", "ScriptStats"]
+
+
+class ScriptedInputReader(InputReader):
+    """Answer input requests from a list of answers without a terminal.
+
+    Answers are delivered immediately from the event loop; no thread is started and the standard
+    input is never read. When the answers are exhausted the event loop is ended by
+    the `ExitMainLoop` exception.
+
+    Answers can be also taken from a session recorded by
+    `simpleline.render.session_recorder.SessionRecorder`, see `from_session()`.
+
+    Set the reader to the actual input manager after the `App.initialize()` call::
+
+        InputThreadManager.get_instance().reader = ScriptedInputReader(["1", "c", "q", "yes"])
+
+    Statistics of the run are available by the `stats` property.
+    """
+
+    def __init__(self, answers, echo=True):
+        """Create the reader.
+
+        :param answers: Answers for the prompts in the order they are asked.
+        :type answers: Iterable of str.
+
+        :param echo: Write the prompts and the answers to the output sink as a user would see them.
+        :type echo: bool
+        """
+        super().__init__()
+        self._answers = iter(answers)
+        self._echo = echo
+        self._stats = ScriptStats()
+
+    @classmethod
+    def from_file(cls, path, echo=True):
+        """Create the reader with answers from a text file; every line is one answer.
+
+        :param path: Path to the file.
+        :type path: str
+
+        :param echo: See the constructor.
+        :type echo: bool
+        """
+        with open(path, "rt", encoding="utf-8") as f:
+            answers = [line.rstrip("\n") for line in f]
+
+        return cls(answers, echo=echo)
+
+    @classmethod
+    def from_session(cls, path, session=-1, echo=True):
+        """Create the reader with answers recorded by `SessionRecorder`.
+
+        Hidden input which wasn't recorded is answered by an empty string.
+
+        :param path: Path to the session log.
+        :type path: str
+
+        :param session: Index of the session in the log; the last session by default.
+        :type session: int
+
+        :param echo: See the constructor.
+        :type echo: bool
+
+        :raises ValueError: if the log is not a valid session log or the session doesn't exist
+        """
+        sessions = []
+
+        for record in read_session(path):
+            if record["type"] == "session":
+                sessions.append([])
+            elif record["type"] == "input":
+                if not sessions:
+                    raise ValueError("Input recorded before the start of a session "
+                                     "in {}.".format(path))
+                sessions[-1].append(record["data"] or "")
+
+        if not sessions:
+            raise ValueError("No session is recorded in {}.".format(path))
+
+        try:
+            answers = sessions[session]
+        except IndexError:
+            raise ValueError("Session {} is not in {}; {} sessions are recorded.".format(
+                session, path, len(sessions))) from None
+
+        return cls(answers, echo=echo)
+
+    @property
+    def stats(self):
+        """Statistics of the prompts answered so far.
+
+        :returns: `ScriptStats` instance.
+        """
+        return self._stats
+
+    def start(self, input_request):
+        try:
+            answer = next(self._answers)
+        except StopIteration:
+            log.debug("All the scripted answers were used, ending the event loop.")
+            raise ExitMainLoop()  # pylint: disable=raise-missing-from
+
+        self._stats.prompt_answered(self._get_screen(input_request))
+
+        if self._echo:
+            prompt = input_request.text_prompt() or ""
+            shown = answer if input_request.line_input else ""
+            App.get_configuration().output_sink.write(prompt + shown + "\n")
+
+        App.get_event_loop().enqueue_signal(InputReceivedSignal(input_request, answer))
+
+    @staticmethod
+    def _get_screen(input_request):
+        source = input_request.requester_source or input_request.source
+
+        # blocking input of a screen is requested by its input manager
+        if isinstance(source, InputManager):
+            return source.ui_screen
+
+        return source
+
+
+class ScriptStats():
+    """Statistics of a scripted run.
+
+    Time of a screen is measured from the previous prompt to the prompt of the screen, so it
+    contains processing of the previous answer and drawing of the screen. Times are in
+    microseconds.
+    """
+
+    def __init__(self):
+        self._start = perf_counter()
+        self._last_prompt = self._start
+        self._screen_count = 0
+        self._histograms = {}
+
+    @property
+    def screen_count(self):
+        """Number of the answered prompts of screens."""
+        return self._screen_count
+
+    @property
+    def elapsed(self):
+        """Seconds from the creation of the reader to the last prompt."""
+        return self._last_prompt - self._start
+
+    @property
+    def screens_per_second(self):
+        """Number of the screens processed per second or None if nothing was processed."""
+        if not self._screen_count or not self.elapsed:
+            return None
+
+        return self._screen_count / self.elapsed
+
+    @property
+    def screen_times(self):
+        """Times of the screens.
+
+        :returns: Dictionary {name of the screen class: `Histogram` of times in microseconds}.
+        """
+        return self._histograms
+
+    def prompt_answered(self, screen):
+        """The screen asked for input and it is answered.
+
+        :param screen: Screen or other source of the input request.
+        :type screen: Anything, usually `simpleline.render.screen.UIScreen` based instance.
+        """
+        now = perf_counter()
+        name = screen.__class__.__name__
+        self._histograms.setdefault(name, Histogram()).add((now - self._last_prompt) * 1000000)
+        self._screen_count += 1
+        self._last_prompt = now
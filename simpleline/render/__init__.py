@@ -29,3 +29,7 @@ class RenderError(SimplelineError):
 
 class RenderUnexpectedError(RenderError):
     """Exception raised when something goes really wrong."""
+
+
+class ModalResultNotReadyError(RenderError):
+    """Exception raised when result of a modal screen is requested before the screen is closed."""
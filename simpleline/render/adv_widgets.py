@@ -204,6 +204,14 @@ class GetInputScreen(UIScreen):
         """User input."""
         return self._value
 
+    @property
+    def answer(self):
+        """User input; the same as `value`.
+
+        Result of this screen shown as modal by `push_screen_modal_async()`.
+        """
+        return self._value
+
     def add_acceptance_condition(self, acceptance_function, args=None):
         """Add acceptance condition to the conditions list.
 
@@ -0,0 +1,200 @@
+# Render buffers used by widgets.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from abc import ABCMeta, abstractmethod
+
+__all__ = ["AbstractRenderBuffer", "RowStringBuffer", "CharListBuffer"]
+
+
+class AbstractRenderBuffer(metaclass=ABCMeta):
+    """Base class for the widget render buffers.
+
+    Buffer is a list of rows. Rows are created on demand and padded by spaces when text is
+    written behind the end of the row.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def height(self):
+        """Number of rows in the buffer."""
+        return 0
+
+    @property
+    @abstractmethod
+    def width(self):
+        """Length of the longest row in the buffer."""
+        return 0
+
+    @property
+    @abstractmethod
+    def content(self):
+        """Return a list (rows) of lists (columns) with one character elements."""
+        return []
+
+    @abstractmethod
+    def clear(self):
+        """Remove all rows from the buffer."""
+
+    @abstractmethod
+    def set_lines(self, lines):
+        """Replace content of the buffer by `lines`.
+
+        :param lines: New rows of the buffer.
+        :type lines: list(str)
+        """
+
+    @abstractmethod
+    def get_lines(self):
+        """Return rows of the buffer as strings.
+
+        :rtype: list(str)
+        """
+        return []
+
+    @abstractmethod
+    def append_rows(self, count):
+        """Append `count` empty rows to the end of the buffer.
+
+        :param count: How many rows should be appended.
+        :type count: int
+        """
+
+    def ensure_height(self, height):
+        """Append empty rows if the buffer has less than `height` rows.
+
+        :param height: Minimal number of rows in the buffer.
+        :type height: int
+        """
+        if height > self.height:
+            self.append_rows(height - self.height)
+
+    @abstractmethod
+    def write(self, row, col, text):
+        """Overwrite `row` from the `col` column by `text`.
+
+        The row is padded by spaces up to the `col` column if it is shorter. The row must
+        already exist, see `ensure_height()`.
+
+        :param row: Row index.
+        :type row: int
+
+        :param col: Column index where the text starts.
+        :type col: int
+
+        :param text: Text without new lines.
+        :type text: str
+        """
+
+
+class RowStringBuffer(AbstractRenderBuffer):
+    """Render buffer storing every row as one string.
+
+    Text is written by whole segments so the cost of writing doesn't depend on the number
+    of characters written but only on the number of segments.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self):
+        super().__init__()
+        self._rows = []
+
+    @property
+    def height(self):
+        return len(self._rows)
+
+    @property
+    def width(self):
+        return max(map(len, self._rows), default=0)
+
+    @property
+    def content(self):
+        return [list(row) for row in self._rows]
+
+    def clear(self):
+        self._rows = []
+
+    def set_lines(self, lines):
+        self._rows = list(lines)
+
+    def get_lines(self):
+        return list(self._rows)
+
+    def append_rows(self, count):
+        self._rows.extend([""] * count)
+
+    def write(self, row, col, text):
+        line = self._rows[row]
+        length = len(line)
+
+        if length < col:
+            line += " " * (col - length)
+
+        self._rows[row] = line[:col] + text + line[col + len(text):]
+
+
+class CharListBuffer(AbstractRenderBuffer):
+    """Render buffer storing every row as a list of one character strings.
+
+    This was the original representation of the widget buffer. It is kept for compatibility
+    and for comparison with the `RowStringBuffer`.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self):
+        super().__init__()
+        self._rows = []
+
+    @property
+    def height(self):
+        return len(self._rows)
+
+    @property
+    def width(self):
+        return max(map(len, self._rows), default=0)
+
+    @property
+    def content(self):
+        return self._rows
+
+    def clear(self):
+        self._rows = []
+
+    def set_lines(self, lines):
+        self._rows = [list(line) for line in lines]
+
+    def get_lines(self):
+        return ["".join(row) for row in self._rows]
+
+    def append_rows(self, count):
+        for _i in range(count):
+            self._rows.append([])
+
+    def write(self, row, col, text):
+        line = self._rows[row]
+        end = col + len(text)
+
+        if len(line) < end:
+            line += (end - len(line)) * [" "]
+
+        line[col:end] = text
@@ -18,13 +18,17 @@
 # along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+from collections.abc import Sequence
+from itertools import islice
 from math import ceil
 
+from simpleline.render.prompt import Prompt
 from simpleline.render.widgets import Widget, TextWidget, SeparatorWidget
 
 from simpleline.logging import get_simpleline_logger
 
-__all__ = ["ListRowContainer", "ListColumnContainer", "WindowContainer"]
+__all__ = ["ListRowContainer", "ListColumnContainer", "ScrollingListContainer", "WindowContainer",
+           "LazyItems"]
 
 log = get_simpleline_logger()
 
@@ -32,12 +36,17 @@ log = get_simpleline_logger()
 class Container(Widget):
     """Base class for containers which will do positioning of the widgets."""
 
+    __slots__ = ("_key_pattern", "_items")
+
+    tracks_changes = True
+
     def __init__(self, items=None, numbering=True):
         """Construct Container.
 
         :param items: List of items for positioning in this Container. Callback
-                      can't be specified this way.
-        :type items: List of items for rendering.
+                      can't be specified this way. Use `LazyItems` to create the items
+                      only when they are needed.
+        :type items: List of items for rendering or `LazyItems` instance.
 
         :param numbering: Enable/disable automatic numbering (labels) for items.
                           Enabled by default (True).
@@ -45,10 +54,13 @@ class Container(Widget):
         """
         super().__init__()
         self._key_pattern = None
-        self._items = []
-        if items:
-            for i in items:
-                self._items.append(ContainerItem(i))
+        if isinstance(items, LazyItems):
+            self._items = items
+        else:
+            self._items = []
+            if items:
+                for i in items:
+                    self._items.append(ContainerItem(i))
 
         if numbering:
             self._key_pattern = KeyPattern()
@@ -60,6 +72,31 @@ class Container(Widget):
         """Return items count."""
         return len(self._items)
 
+    @property
+    def children(self):
+        """Widgets placed in this container.
+
+        Items of `LazyItems` which weren't created yet are not included.
+
+        :returns: List of widgets.
+        """
+        return [item.widget for item in self._created_items()]
+
+    @property
+    def is_dirty(self):
+        """Was this container or any of its items changed after the last render?"""
+        if super().is_dirty:
+            return True
+
+        return any(item.widget.is_dirty for item in self._created_items())
+
+    def _created_items(self):
+        if isinstance(self._items, LazyItems):
+            # items which weren't created yet weren't rendered
+            return self._items.created_items()
+
+        return self._items
+
     @property
     def key_pattern(self):
         """Return key pattern which will be used for items numbering.
@@ -75,6 +112,7 @@ class Container(Widget):
         Setting `None` will stop doing numbering.
         """
         self._key_pattern = key_pattern
+        self.mark_dirty()
 
     def add(self, item, callback=None, data=None):
         """Add item to the Container.
@@ -94,6 +132,7 @@ class Container(Widget):
         :rtype: int
         """
         self._items.append(ContainerItem(item, callback, data))
+        self.mark_dirty()
         return len(self._items) - 1
 
     def process_user_input(self, key):
@@ -144,6 +183,10 @@ class WindowContainer(Container):
     This can hold other containers or Widgets for rendering.
     """
 
+    __slots__ = ("_title",)
+
+    tracks_changes = True
+
     def __init__(self, title=None):
         """Construct base container for screens.
 
@@ -216,7 +259,7 @@ class WindowContainer(Container):
 
         for item in self._items:
             widget = item.widget
-            widget.render(width)
+            widget.render_if_dirty(width)
             self.draw(widget)
 
     def _draw_title_and_separator(self, width):
@@ -245,6 +288,10 @@ class ListRowContainer(Container):
     ....
     """
 
+    __slots__ = ("_columns", "_columns_width", "_spacing", "_numbering_widgets")
+
+    tracks_changes = True
+
     def __init__(self, columns, items=None, columns_width=None, spacing=3, numbering=True):
         """Create ListWidget with specific number of columns.
 
@@ -270,7 +317,7 @@ class ListRowContainer(Container):
         self._columns = columns
         self._columns_width = columns_width
         self._spacing = spacing
-        self._numbering_widgets = []
+        self._numbering_widgets = {}
 
     def render(self, width):
         """Render widgets to it's internal buffer.
@@ -333,8 +380,18 @@ class ListRowContainer(Container):
 
         return lines_per_row
 
+    def _visible_item_ids(self):
+        """Get identifiers (index) of the items which should be rendered.
+
+        :returns: Ordered sequence of item identifiers.
+        """
+        return range(self.size)
+
     def _render_all_items(self):
-        for item_id, item in enumerate(self._items):
+        self._numbering_widgets = {}
+
+        for item_id in self._visible_item_ids():
+            item = self._items[item_id]
             item_width = self._columns_width
 
             if item_width <= 0:
@@ -345,7 +402,7 @@ class ListRowContainer(Container):
                 # render numbers before widgets
                 number_width = len(number_widget.text)
                 number_widget.render(number_width)
-                self._numbering_widgets.append(number_widget)
+                self._numbering_widgets[item_id] = number_widget
                 # reduce the size of widget because of the number
                 item_width -= number_width
 
@@ -353,7 +410,7 @@ class ListRowContainer(Container):
                     raise ValueError("Widget can't be rendered with numbering on! "
                                      "Increase column width or disable numbering.")
 
-            item.widget.render(item_width)
+            item.widget.render_if_dirty(item_width)
 
     def _get_ordered_map(self):
         """Return list of identifiers (index) to the original item list.
@@ -364,8 +421,8 @@ class ListRowContainer(Container):
         # create list of columns (lists)
         ordering_map = self._prepare_list()
 
-        for item_id in range(self.size):
-            ordering_map[item_id % self._columns].append(item_id)
+        for position, item_id in enumerate(self._visible_item_ids()):
+            ordering_map[position % self._columns].append(item_id)
 
         return ordering_map
 
@@ -392,17 +449,191 @@ class ListColumnContainer(ListRowContainer):
     3) w3  6) w6  9) w9
     """
 
+    __slots__ = ()
+
+    tracks_changes = True
+
     def _get_ordered_map(self):
         ordering_map = self._prepare_list()
-        items_in_column = ceil(len(self._items) / self._columns)
+        item_ids = self._visible_item_ids()
+        items_in_column = ceil(len(item_ids) / self._columns)
 
-        for item_id in range(self.size):
-            col_position = int(item_id // items_in_column)
+        for position, item_id in enumerate(item_ids):
+            col_position = int(position // items_in_column)
             ordering_map[col_position].append(item_id)
 
         return ordering_map
 
 
+class ScrollingListContainer(ListRowContainer):
+    """Place widgets in rows and show only one page of them.
+
+    Only items on the actual page are rendered, so this container is usable even for lists with
+    tens of thousands of items. Items are placed the same way as by the `ListRowContainer`.
+    Numbering is kept for the whole list, the first item on the second page of a list with
+    10 items per page has number 11).
+
+    Use `next_page()`, `previous_page()` or the `page` property to move in the list. Input
+    processed by `process_user_input()` with a number of an item which is not on the actual page
+    will move to the page with this item. The `Prompt.NEXT_PAGE` and `Prompt.PREVIOUS_PAGE` keys
+    move to the next or the previous page; call `add_paging_options()` from the `prompt()` method
+    of the screen to show them to the user. The screen should be redrawn after the input was
+    processed by this container.
+    """
+
+    __slots__ = ("_rows_per_page", "_page")
+
+    tracks_changes = True
+
+    def __init__(self, columns, items=None, columns_width=None, spacing=3, numbering=True, *,
+                 rows_per_page=20):
+        """Create scrolling list with specific number of columns.
+
+        :param columns: How many columns we want.
+        :type columns: int, bigger than 0
+
+        :param items: List of items for positioning in this Container. Callback can't be
+                      specified this way.
+        :type items: List of items for rendering.
+
+        :param columns_width: Width of every column. If nothing specified the maximum width
+                              will be distributed to columns.
+        :type columns_width: int or None
+
+        :param spacing: Set the spacing between columns.
+        :type spacing: int
+
+        :param numbering: Enable/disable automatic numbering (labels) for items.
+                          Enabled by default (True).
+        :type numbering: bool
+
+        :param rows_per_page: How many rows of items are on one page.
+        :type rows_per_page: int, bigger than 0
+        """
+        super().__init__(columns, items, columns_width, spacing, numbering)
+        self._rows_per_page = rows_per_page
+        self._page = 0
+
+    @property
+    def is_dirty(self):
+        """Was this container or any of its visible items changed after the last render?"""
+        # items out of the actual page are not rendered, skip the check of all the items
+        if Widget.is_dirty.fget(self):
+            return True
+
+        return any(self._items[item_id].widget.is_dirty for item_id in self._visible_item_ids())
+
+    @property
+    def page_size(self):
+        """Maximal number of items on one page."""
+        return self._rows_per_page * self._columns
+
+    @property
+    def page_count(self):
+        """Number of pages; at least one page exists even for an empty list."""
+        return max(ceil(self.size / self.page_size), 1)
+
+    @property
+    def page(self):
+        """Index of the actual page, first page has index 0."""
+        return min(self._page, self.page_count - 1)
+
+    @page.setter
+    def page(self, page):
+        """Set the actual page.
+
+        Values out of the range are moved to the first or the last page.
+
+        :param page: Index of the page, first page has index 0.
+        :type page: int
+        """
+        page = max(min(page, self.page_count - 1), 0)
+        if page != self._page:
+            self._page = page
+            self.mark_dirty()
+
+    def next_page(self):
+        """Move to the next page.
+
+        :returns: False if this is already the last page, True otherwise.
+        :rtype: bool
+        """
+        if self.page >= self.page_count - 1:
+            return False
+
+        self.page = self.page + 1
+        return True
+
+    def previous_page(self):
+        """Move to the previous page.
+
+        :returns: False if this is already the first page, True otherwise.
+        :rtype: bool
+        """
+        if self.page == 0:
+            return False
+
+        self.page = self.page - 1
+        return True
+
+    def add_paging_options(self, prompt):
+        """Add options to move to the next or the previous page to the prompt.
+
+        Only options which can be used on the actual page are added.
+
+        :param prompt: Prompt of the screen showing this container.
+        :type prompt: `simpleline.render.prompt.Prompt` instance
+        """
+        if self.page > 0:
+            prompt.add_option(Prompt.PREVIOUS_PAGE, Prompt.PREVIOUS_PAGE_DESCRIPTION)
+
+        if self.page < self.page_count - 1:
+            prompt.add_option(Prompt.NEXT_PAGE, Prompt.NEXT_PAGE_DESCRIPTION)
+
+    def show_item(self, item_id):
+        """Move to the page with the given item.
+
+        :param item_id: ID of the item in this container.
+        :type item_id: int
+        """
+        self.page = item_id // self.page_size
+
+    def process_user_input(self, key):
+        """Process input from the user if any of the items in the list was called.
+
+        Callback of an item is called only if the item is on the actual page. Otherwise, the page
+        with the item is shown. The `Prompt.NEXT_PAGE` and `Prompt.PREVIOUS_PAGE` keys move
+        to the next or the previous page.
+
+        :param key: Key pressed from user.
+        :type key: str
+
+        :returns: True if key was processed. False otherwise.
+        """
+        if key == Prompt.NEXT_PAGE:
+            return self.next_page()
+
+        if key == Prompt.PREVIOUS_PAGE:
+            return self.previous_page()
+
+        if not self._key_pattern or not isinstance(key, str):
+            return False
+
+        item_id = self._key_pattern.translate_input_to_widget_id(key)
+        if item_id is None or not 0 <= item_id < self.size:
+            return False
+
+        if item_id not in self._visible_item_ids():
+            self.show_item(item_id)
+            return True
+
+        return super().process_user_input(key)
+
+    def _visible_item_ids(self):
+        start = self.page * self.page_size
+        return range(start, min(start + self.page_size, self.size))
+
+
 class KeyPattern():
     """Pattern for automatic key printing before items."""
 
@@ -451,12 +682,119 @@ class KeyPattern():
             return None
 
 
+class LazyItems(Sequence):
+    """Items of a container created when they are needed.
+
+    Widgets are created only when the container renders them or when the user selects them.
+    This is useful for lists of items loaded from a backend; only the items shown to
+    the user are created.
+
+    Items can be provided by a sequence (object with `__len__` and `__getitem__`) or by
+    any iterable with a known size. Items of an iterable are consumed only up to
+    the highest item required.
+    """
+
+    def __init__(self, source, size=None, factory=None, callback=None):
+        """Create lazy items.
+
+        :param source: Source of values for the items.
+        :type source: Sequence or iterable.
+
+        :param size: Number of items in the source. Required if the source is not a sequence.
+        :type size: int
+
+        :param factory: Create widget for a value from the source. If not specified, values
+                        from the source have to be widgets.
+        :type factory: Function ``func(value)`` returning widget.
+
+        :param callback: Callback for all the items. The value from the source is passed
+                         to the callback as data.
+        :type callback: Function ``func(data)``.
+        """
+        super().__init__()
+        if size is None:
+            try:
+                size = len(source)
+            except TypeError as e:
+                raise TypeError("Size is required for items without length!") from e
+
+        if isinstance(source, Sequence) or \
+                (hasattr(source, "__getitem__") and hasattr(source, "__len__")):
+            self._source = source
+            self._iterator = None
+        else:
+            self._source = []
+            self._iterator = iter(source)
+
+        self._size = size
+        self._factory = factory
+        self._callback = callback
+        self._created = {}
+        self._appended = []
+
+    def __len__(self):
+        return self._size + len(self._appended)
+
+    def __getitem__(self, index):
+        if not isinstance(index, int):
+            raise TypeError("Lazy items can be accessed only by an integer index!")
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("Lazy item index out of range")
+
+        if index >= self._size:
+            return self._appended[index - self._size]
+
+        item = self._created.get(index)
+        if item is None:
+            item = self._create_item(index)
+            self._created[index] = item
+
+        return item
+
+    def append(self, item):
+        """Add already created item after the items from the source.
+
+        :param item: Item to add.
+        :type item: `ContainerItem` instance.
+        """
+        self._appended.append(item)
+
+    def created_items(self):
+        """Get items which were already created.
+
+        :returns: List of `ContainerItem` instances.
+        """
+        return list(self._created.values()) + self._appended
+
+    def _create_item(self, index):
+        value = self._get_value(index)
+        widget = self._factory(value) if self._factory else value
+        return ContainerItem(widget, self._callback, value)
+
+    def _get_value(self, index):
+        if self._iterator is not None:
+            missing = index + 1 - len(self._source)
+            if missing > 0:
+                self._source.extend(islice(self._iterator, missing))
+
+            if index >= len(self._source):
+                raise IndexError("Source of lazy items is shorter than the given size!")
+
+        return self._source[index]
+
+
 class ContainerItem():
     """Item used inside of containers to store widgets callbacks and data.
 
     Internal representation for Containers. Do not use this class directly.
     """
 
+    __slots__ = ("widget", "callback", "data")
+
     def __init__(self, widget, callback=None, data=None):
         """Construct WidgetContainer.
 
@@ -0,0 +1,207 @@
+# Differential output of screens to the terminal.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from simpleline.logging import get_simpleline_logger
+from simpleline.render.output_sinks import TTYOutputSink
+
+log = get_simpleline_logger()
+
+__all__ = ["DifferentialOutput", "diff_lines"]
+
+# ANSI control sequences
+CSI = "\x1b["
+CLEAR_SCREEN = CSI + "H" + CSI + "2J"
+CLEAR_TO_END_OF_LINE = CSI + "K"
+CLEAR_TO_END_OF_SCREEN = CSI + "J"
+
+
+def diff_lines(old_lines, new_lines):
+    """Compare two frames line by line.
+
+    :param old_lines: Lines of the previous frame.
+    :type old_lines: list(str)
+
+    :param new_lines: Lines of the new frame.
+    :type new_lines: list(str)
+
+    :returns: Indexes and content of the lines from `new_lines` which are different.
+    :rtype: list((int, str))
+    """
+    old_count = len(old_lines)
+    changes = []
+
+    for row, line in enumerate(new_lines):
+        if row >= old_count or old_lines[row] != line:
+            changes.append((row, line))
+
+    return changes
+
+
+def _move_cursor(row):
+    """Move cursor to the beginning of the `row` (indexing from 0)."""
+    return "{}{};1H".format(CSI, row + 1)
+
+
+class DifferentialOutput():
+    """Write screens to the terminal as a difference against the previous screen.
+
+    Lines of one screen are collected to a frame between `begin_frame()` and `end_frame()` calls.
+    If the terminal supports ANSI escape sequences, only lines changed from the last frame are
+    rewritten by using cursor addressing. Otherwise, the whole frame is printed the same way as
+    without differential output.
+
+    The frame must fit to the terminal height, otherwise the cursor addressing won't work.
+    Use `flush_frame()` to print the frame the standard way (e.g. when paging long screens).
+    """
+
+    def __init__(self, ansi=False, sink=None):
+        """Create differential output.
+
+        :param ansi: Terminal supports ANSI escape sequences.
+        :type ansi: bool
+
+        :param sink: Sink where the output is written; if not specified write to the terminal.
+        :type sink: Instance of class based on
+                    `simpleline.render.output_sinks.AbstractOutputSink`.
+        """
+        super().__init__()
+        self._ansi = ansi
+        self._sink = sink or TTYOutputSink()
+        self._last_frame = None
+        self._frame = None
+        self._last_frame_bytes = 0
+        self._bytes_written = 0
+        self._frames_written = 0
+
+    @property
+    def ansi(self):
+        """Is cursor addressing by ANSI escape sequences used?"""
+        return self._ansi
+
+    @property
+    def sink(self):
+        """Sink where the output is written."""
+        return self._sink
+
+    @property
+    def frame_started(self):
+        """Is a frame collected right now?"""
+        return self._frame is not None
+
+    @property
+    def frame_lines(self):
+        """Lines collected in the actual frame so far.
+
+        :returns: list(str)
+        """
+        return list(self._frame or [])
+
+    @property
+    def last_frame_bytes(self):
+        """Number of bytes written for the last frame."""
+        return self._last_frame_bytes
+
+    @property
+    def bytes_written(self):
+        """Number of bytes written for all frames."""
+        return self._bytes_written
+
+    @property
+    def frames_written(self):
+        """Number of frames written."""
+        return self._frames_written
+
+    def reset(self):
+        """Forget the last frame so the next frame is written whole."""
+        self._last_frame = None
+
+    def begin_frame(self):
+        """Start collecting lines of a new frame."""
+        self._frame = []
+
+    def add_lines(self, lines):
+        """Add lines to the actual frame.
+
+        :param lines: Lines to add.
+        :type lines: list(str)
+        """
+        self._frame.extend(lines)
+
+    def flush_frame(self):
+        """Print lines collected so far without comparing them to the last frame.
+
+        The frame is closed and the last frame is forgotten. Use this when something else
+        than this class will print to the terminal.
+        """
+        if self._frame:
+            self._write("\n".join(self._frame) + "\n")
+
+        self._frame = None
+        self.reset()
+
+    def end_frame(self):
+        """Close the actual frame and write it to the terminal.
+
+        :returns: Number of bytes written.
+        :rtype: int
+        """
+        lines = self._frame
+        self._frame = None
+
+        if self._ansi:
+            data = self._create_ansi_output(lines)
+            self._last_frame = lines
+        elif lines:
+            data = "\n".join(lines) + "\n"
+        else:
+            data = ""
+
+        written = self._write(data)
+
+        self._last_frame_bytes = written
+        self._frames_written += 1
+        log.debug("Frame %d written with %d bytes", self._frames_written, written)
+
+        return written
+
+    def _create_ansi_output(self, lines):
+        if self._last_frame is None:
+            data = CLEAR_SCREEN
+            if lines:
+                data += "\n".join(lines) + "\n"
+            return data
+
+        changes = diff_lines(self._last_frame, lines)
+        data = "".join(_move_cursor(row) + line + CLEAR_TO_END_OF_LINE for row, line in changes)
+
+        # move below the frame and remove the old prompt and anything else left there
+        data += _move_cursor(len(lines)) + CLEAR_TO_END_OF_SCREEN
+
+        return data
+
+    def _write(self, data):
+        if not data:
+            return 0
+
+        self._sink.write(data)
+
+        written = len(data.encode("utf-8", "replace"))
+        self._bytes_written += written
+        return written
@@ -0,0 +1,336 @@
+# Instrumentation of the screen rendering.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from abc import ABCMeta, abstractmethod
+from enum import Enum
+from time import perf_counter
+
+__all__ = ["RenderPhase", "FrameStats", "AbstractRenderObserver", "RenderHistogramObserver",
+           "Histogram", "RenderInstrumentation"]
+
+
+class RenderPhase(Enum):
+    """Phases of processing one screen."""
+    SETUP = "setup"
+    REFRESH = "refresh"
+    RENDER = "render"
+    PRINT = "print"
+    INPUT_WAIT = "input_wait"
+
+
+class FrameStats():
+    """Statistics of one processed screen.
+
+    Time of every phase is measured from the previous `mark()` call. Time of one phase can be
+    measured by multiple `mark()` calls; the times are summed.
+    """
+
+    __slots__ = ("screen", "timings", "window", "_last_mark")
+
+    def __init__(self, screen):
+        """Start measuring a new frame.
+
+        :param screen: Screen processed in this frame.
+        :type screen: `simpleline.render.screen.UIScreen` based instance.
+        """
+        self.screen = screen
+        self.timings = {}
+        self.window = None
+        self._last_mark = perf_counter()
+
+    @property
+    def screen_name(self):
+        """Name of the screen class."""
+        return self.screen.__class__.__name__
+
+    @property
+    def line_count(self):
+        """Number of lines of the rendered window; 0 if no window was rendered."""
+        if self.window is None:
+            return 0
+
+        return self.window.height
+
+    @property
+    def widget_count(self):
+        """Number of widgets in the rendered window including the window and containers."""
+        return _count_widgets(self.window) if self.window is not None else 0
+
+    def mark(self, phase):
+        """End measuring of the phase.
+
+        :param phase: Phase which ended now.
+        :type phase: `RenderPhase` enum value.
+        """
+        now = perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._last_mark
+        self._last_mark = now
+
+    def restart(self):
+        """Start measuring from now without adding the time to any phase."""
+        self._last_mark = perf_counter()
+
+
+class _DisabledFrameStats():
+    """Frame statistics used when nobody is observing; all the calls are no-op."""
+
+    __slots__ = ()
+
+    def mark(self, phase):
+        pass
+
+    def restart(self):
+        pass
+
+    def __setattr__(self, name, value):
+        pass
+
+
+DISABLED_FRAME = _DisabledFrameStats()
+
+
+def _count_widgets(widget):
+    children = getattr(widget, "children", ())
+    return 1 + sum(_count_widgets(child) for child in children)
+
+
+class AbstractRenderObserver(metaclass=ABCMeta):
+    """Base class for observers of the screen rendering.
+
+    Register observers by `RenderInstrumentation.add_observer()`. Instrumentation of the actual
+    scheduler is available by `App.get_scheduler().instrumentation`.
+    """
+
+    @abstractmethod
+    def frame_drawn(self, stats):
+        """Screen was drawn.
+
+        :param stats: Statistics of the frame.
+        :type stats: `FrameStats` instance.
+        """
+
+    def input_received(self, screen, wait_time):
+        """User input for the screen was received.
+
+        :param screen: Screen which was waiting on the input.
+        :type screen: `simpleline.render.screen.UIScreen` based instance.
+
+        :param wait_time: How long the screen was waiting on input in seconds.
+        :type wait_time: float
+        """
+
+
+class Histogram():
+    """Histogram with buckets growing by powers of two.
+
+    Value is counted to the first bucket with upper bound greater than or equal to the value.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "_buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._buckets = {}
+
+    @property
+    def mean(self):
+        """Mean of the added values or None if there is no value."""
+        if not self.count:
+            return None
+
+        return self.total / self.count
+
+    @property
+    def buckets(self):
+        """Counts of values in buckets.
+
+        :returns: List of (upper bound, count) tuples sorted by the bound.
+        """
+        return sorted(self._buckets.items())
+
+    def add(self, value):
+        """Add value to the histogram.
+
+        :param value: Value to add.
+        :type value: int or float greater than or equal to 0
+        """
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        bound = 1
+        while bound < value:
+            bound *= 2
+
+        self._buckets[bound] = self._buckets.get(bound, 0) + 1
+
+
+class RenderHistogramObserver(AbstractRenderObserver):
+    """Aggregate rendering statistics of every screen class to histograms.
+
+    Times of phases are in microseconds. Histograms of the line and widget counts are stored
+    under the "lines" and "widgets" keys.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._histograms = {}
+
+    @property
+    def histograms(self):
+        """Histograms of all the screen classes.
+
+        :returns: Dictionary {screen class name: {phase value or "lines" or "widgets": Histogram}}.
+        """
+        return self._histograms
+
+    def get_histogram(self, screen_name, key):
+        """Get histogram of one screen class.
+
+        :param screen_name: Name of the screen class.
+        :type screen_name: str
+
+        :param key: Phase of the rendering or "lines" or "widgets".
+        :type key: `RenderPhase` enum value or str
+
+        :returns: `Histogram` instance or None if nothing was recorded.
+        """
+        if isinstance(key, RenderPhase):
+            key = key.value
+
+        return self._histograms.get(screen_name, {}).get(key)
+
+    def frame_drawn(self, stats):
+        for phase, elapsed in stats.timings.items():
+            self._add(stats.screen_name, phase.value, elapsed * 1000000)
+
+        if stats.window is not None:
+            self._add(stats.screen_name, "lines", stats.line_count)
+            self._add(stats.screen_name, "widgets", stats.widget_count)
+
+    def input_received(self, screen, wait_time):
+        self._add(screen.__class__.__name__, RenderPhase.INPUT_WAIT.value, wait_time * 1000000)
+
+    def clear(self):
+        """Drop all the statistics."""
+        self._histograms = {}
+
+    def _add(self, screen_name, key, value):
+        histograms = self._histograms.setdefault(screen_name, {})
+        histograms.setdefault(key, Histogram()).add(value)
+
+
+class RenderInstrumentation():
+    """Emit statistics of the screen rendering to observers.
+
+    When there is no observer registered nothing is measured.
+    """
+
+    def __init__(self):
+        self._observers = []
+        self._frames = []
+        self._input_start = {}
+
+    @property
+    def enabled(self):
+        """Is any observer registered?"""
+        return bool(self._observers)
+
+    @property
+    def frame(self):
+        """Statistics of the frame processed right now.
+
+        :returns: `FrameStats` instance. When nothing is measured an object with the same
+                  methods which does nothing is returned.
+        """
+        if not self._frames:
+            return DISABLED_FRAME
+
+        return self._frames[-1]
+
+    def add_observer(self, observer):
+        """Register observer of the rendering.
+
+        :param observer: Observer to register.
+        :type observer: `AbstractRenderObserver` based instance.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Unregister observer of the rendering.
+
+        :param observer: Observer to unregister.
+        :type observer: `AbstractRenderObserver` based instance.
+
+        :returns: True if the observer was registered, False otherwise.
+        """
+        try:
+            self._observers.remove(observer)
+            return True
+        except ValueError:
+            return False
+
+    def begin_frame(self, screen):
+        """Start measuring of the frame.
+
+        :param screen: Screen processed.
+        :type screen: `simpleline.render.screen.UIScreen` based instance.
+
+        :returns: `FrameStats` instance or an object doing nothing if there is no observer.
+        """
+        if not self._observers:
+            return DISABLED_FRAME
+
+        stats = FrameStats(screen)
+        self._frames.append(stats)
+        return stats
+
+    def end_frame(self, stats):
+        """End measuring of the frame and pass the statistics to observers.
+
+        :param stats: Statistics returned by `begin_frame()`.
+        """
+        if stats is DISABLED_FRAME:
+            return
+
+        if stats in self._frames:
+            self._frames.remove(stats)
+
+        for observer in list(self._observers):
+            observer.frame_drawn(stats)
+
+    def input_started(self, screen):
+        """Start measuring of the input wait of the screen."""
+        if self._observers:
+            self._input_start[screen] = perf_counter()
+
+    def input_finished(self, screen):
+        """End measuring of the input wait of the screen and pass it to observers."""
+        start = self._input_start.pop(screen, None)
+        if start is None:
+            return
+
+        wait_time = perf_counter() - start
+        for observer in list(self._observers):
+            observer.input_received(screen, wait_time)
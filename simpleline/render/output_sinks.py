@@ -0,0 +1,215 @@
+# Destinations of the Simpleline output.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import sys
+import threading
+
+from abc import ABCMeta, abstractmethod
+
+__all__ = ["AbstractOutputSink", "TTYOutputSink", "MemoryOutputSink", "FileOutputSink"]
+
+
+class AbstractOutputSink(metaclass=ABCMeta):
+    """Base class for the destinations of everything printed by Simpleline.
+
+    Text of one screen is assembled to a frame between the `begin_frame()` and `end_frame()`
+    calls and the whole frame is written at once. Text written outside of a frame, or by another
+    thread than the one which started the frame (e.g. input prompts), is written immediately.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._frame = None
+        self._frame_thread = None
+        # stack of (thread, list of text) copies of the written text, see `begin_capture()`
+        self._captures = []
+
+    @property
+    def frame_started(self):
+        """Is a frame assembled right now?"""
+        return self._frame is not None
+
+    def begin_frame(self):
+        """Start assembling a new frame."""
+        self._frame = []
+        self._frame_thread = threading.get_ident()
+
+    def write(self, text):
+        """Write text to this sink.
+
+        :param text: Text to write. New lines must be part of the text.
+        :type text: str
+        """
+        if self._captures:
+            self._capture(text)
+
+        if self._frame is not None and self._frame_thread == threading.get_ident():
+            self._frame.append(text)
+        elif text:
+            self._write_data(text)
+
+    def begin_capture(self):
+        """Start keeping a copy of the text written by the current thread.
+
+        The text is written the same way as without the capture. Captures can be nested.
+        """
+        self._captures.append((threading.get_ident(), []))
+
+    def end_capture(self):
+        """Stop the capture started by the last `begin_capture()` call.
+
+        :returns: Text written by the thread during the capture.
+        :rtype: str
+        """
+        _thread, chunks = self._captures.pop()
+        return "".join(chunks)
+
+    def _capture(self, text):
+        thread = threading.get_ident()
+
+        for capture_thread, chunks in self._captures:
+            if capture_thread == thread:
+                chunks.append(text)
+
+    def flush_frame(self):
+        """Write text of the actual frame assembled so far and close the frame.
+
+        Next text will be written immediately. Use this when the output must be visible
+        before the frame is finished, e.g. before asking for input.
+        """
+        self.end_frame()
+
+    def end_frame(self):
+        """Close the actual frame and write it.
+
+        :returns: Written text.
+        :rtype: str
+        """
+        if self._frame is None:
+            return ""
+
+        data = "".join(self._frame)
+        self._frame = None
+        self._frame_thread = None
+
+        if data:
+            self._write_data(data)
+
+        return data
+
+    @abstractmethod
+    def _write_data(self, data):
+        """Write data to the destination by one call.
+
+        :param data: Text to write.
+        :type data: str
+        """
+
+
+class TTYOutputSink(AbstractOutputSink):
+    """Write to the terminal.
+
+    Every frame is written by one `write()` call followed by flush.
+    """
+
+    def __init__(self, stream=None):
+        """Create the terminal sink.
+
+        :param stream: Stream to write to; if not specified use the actual `sys.stdout`.
+        :type stream: Text file object.
+        """
+        super().__init__()
+        self._stream = stream
+
+    def _write_data(self, data):
+        # look up sys.stdout every time, it could have been replaced
+        stream = self._stream or sys.stdout
+        stream.write(data)
+        stream.flush()
+
+
+class MemoryOutputSink(AbstractOutputSink):
+    """Keep the output in memory.
+
+    Useful for tests and headless runs.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._frames = []
+
+    @property
+    def frames(self):
+        """Text of all frames written so far.
+
+        :returns: list(str)
+        """
+        return list(self._frames)
+
+    def getvalue(self):
+        """Get the whole output written so far.
+
+        :returns: str
+        """
+        return "".join(self._chunks)
+
+    def clear(self):
+        """Forget the output written so far."""
+        self._chunks = []
+        self._frames = []
+
+    def end_frame(self):
+        data = super().end_frame()
+        if data:
+            self._frames.append(data)
+
+        return data
+
+    def _write_data(self, data):
+        self._chunks.append(data)
+
+
+class FileOutputSink(AbstractOutputSink):
+    """Write to a file or a pipe."""
+
+    def __init__(self, file):
+        """Create the file sink.
+
+        :param file: Path to a file where the output is appended or an opened text file object.
+        :type file: str or text file object
+        """
+        super().__init__()
+        if isinstance(file, str):
+            # the file stays open for the whole life of the sink and is closed in `close()`
+            self._file = open(file, "at", encoding="utf-8")  # pylint: disable=consider-using-with
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+
+    def close(self):
+        """Close the file if it was opened by this sink."""
+        if self._owns_file:
+            self._file.close()
+
+    def _write_data(self, data):
+        self._file.write(data)
+        self._file.flush()
@@ -50,6 +50,14 @@ class Prompt():
     HELP_DESCRIPTION = N_("to help")
     HELP = 'h'
 
+    # TRANSLATORS:'>' to show the next page
+    NEXT_PAGE_DESCRIPTION = N_("to show the next page")
+    NEXT_PAGE = '>'
+
+    # TRANSLATORS:'<' to show the previous page
+    PREVIOUS_PAGE_DESCRIPTION = N_("to show the previous page")
+    PREVIOUS_PAGE = '<'
+
     def __init__(self, message=DEFAULT_MESSAGE):
         """
         :param message: the message of the prompt
@@ -24,6 +24,7 @@ from enum import Enum
 
 from simpleline import App
 from simpleline.render.containers import WindowContainer
+from simpleline.render.instrumentation import RenderPhase
 from simpleline.render.prompt import Prompt
 from simpleline.render.screen.signal_handler import SignalHandler
 from simpleline.render.screen.input_manager import InputManager
@@ -65,6 +66,10 @@ class UIScreen(SignalHandler):
         # should the input be required after draw
         self._input_required = True
 
+        # seconds to wait on the input and input used when nobody answers
+        self._input_timeout = None
+        self._default_input = ""
+
         # index of the page (subset of screen) shown during show_all
         # indexing starts with 0
         self._page = 0
@@ -133,6 +138,42 @@ class UIScreen(SignalHandler):
         """Set if the screen should require input."""
         self._input_required = input_required
 
+    @property
+    def input_timeout(self):
+        """Seconds to wait on the user input of this screen.
+
+        :returns: Number of seconds or None to wait forever (default).
+        """
+        return self._input_timeout
+
+    @input_timeout.setter
+    def input_timeout(self, timeout):
+        """Set how long to wait on the user input of this screen.
+
+        When the user doesn't answer in time, the `default_input` is processed as the user input.
+
+        :param timeout: Number of seconds or None to wait forever.
+        :type timeout: int or float
+        """
+        self._input_timeout = timeout
+
+    @property
+    def default_input(self):
+        """Input processed when the user doesn't answer in the `input_timeout`.
+
+        :returns: str (default is an empty string).
+        """
+        return self._default_input
+
+    @default_input.setter
+    def default_input(self, value):
+        """Set input processed when the user doesn't answer in the `input_timeout`.
+
+        :param value: Input processed instead of the user input, e.g. `Prompt.CONTINUE`.
+        :type value: str
+        """
+        self._default_input = value
+
     @property
     def no_separator(self):
         """Should we print separator for this screen?
@@ -186,7 +227,7 @@ class UIScreen(SignalHandler):
         """
         self._window = window
 
-    def get_user_input(self, message, hidden=False):
+    def get_user_input(self, message, hidden=False, timeout=None, default=""):
         """Get immediately input from the user.
 
         Use this with cautious. Never call this in middle of rendering or when other
@@ -197,8 +238,14 @@ class UIScreen(SignalHandler):
 
         :param hidden: Do not echo user input (password typing).
         :type hidden: bool
+
+        :param timeout: Seconds to wait on the user input or None to wait forever.
+        :type timeout: int or float
+
+        :param default: Input returned when the timeout expires.
+        :type default: str
         """
-        return self._input_manager.get_input_blocking(message, hidden)
+        return self._input_manager.get_input_blocking(message, hidden, timeout, default)
 
     def setup(self, args):
         """Do additional setup right before this screen is used.
@@ -240,25 +287,35 @@ class UIScreen(SignalHandler):
 
         prompt_height = 2
         real_screen_height = self._screen_height - prompt_height
+        output = App.get_scheduler().differential_output
+        sink = App.get_configuration().output_sink
 
         if num_lines < real_screen_height:
             # widget plus prompt are shorter than screen height, just print the widget
-            print("\n".join(lines))
+            if output is not None and output.frame_started:
+                output.add_lines(lines)
+            else:
+                sink.write("\n".join(lines) + "\n")
             return
 
+        # long widgets are paged, differential output can't be used
+        if output is not None and output.frame_started:
+            output.flush_frame()
+
+        # the page must be visible before asking to continue
+        sink.flush_frame()
+
         # long widget, print it in steps and prompt user to continue
         last_line = num_lines - 1
         while pos <= last_line:
             if pos + real_screen_height > last_line:
                 # enough space to print the rest of the widget plus regular
                 # prompt (2 lines)
-                for line in lines[pos:]:
-                    print(line)
+                sink.write("".join(line + "\n" for line in lines[pos:]))
                 pos += self._screen_height - 1
             else:
                 # print part with a prompt to continue
-                for line in lines[pos:(pos + real_screen_height)]:
-                    print(line)
+                sink.write("".join(line + "\n" for line in lines[pos:(pos + real_screen_height)]))
                 custom_prompt = Prompt(_("\nPress %s to continue") % Prompt.ENTER)
                 self._ask_user_input_blocking(custom_prompt)
                 pos += real_screen_height
@@ -267,9 +324,18 @@ class UIScreen(SignalHandler):
         return self._input_manager.get_input_blocking(prompt, False)
 
     def show_all(self):
-        """Print WindowContainer in `self.window` with all its content."""
-        self.window.render(App.get_configuration().width)
+        """Print WindowContainer in `self.window` with all its content.
+
+        The window is rendered only if it or any of its widgets changed since the last call.
+        """
+        frame = App.get_scheduler().instrumentation.frame
+        frame.window = self.window
+
+        frame.restart()
+        self.window.render_if_dirty(App.get_configuration().width)
+        frame.mark(RenderPhase.RENDER)
         self._print_widget(self.window)
+        frame.mark(RenderPhase.PRINT)
 
     def input(self, args, key):
         """Method called to process input. If the input is not handled here, return it.
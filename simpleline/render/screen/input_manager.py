@@ -50,6 +50,11 @@ class InputManager():
         self._skip_concurrency_check = False
         self._input_args = None
 
+    @property
+    def ui_screen(self):
+        """Screen associated with this input manager."""
+        return self._ui_screen
+
     @property
     def input_error_counter(self):
         """Return how many times the user provided bad input."""
@@ -83,7 +88,7 @@ class InputManager():
         """
         self._skip_concurrency_check = value
 
-    def get_input_blocking(self, message, hidden):
+    def get_input_blocking(self, message, hidden, timeout=None, default=""):
         """Get blocking input from the user.
 
         :param message: Message prompt for the user.
@@ -91,6 +96,12 @@ class InputManager():
 
         :param hidden: Do not echo user input (password typing).
         :type hidden: bool
+
+        :param timeout: Seconds to wait on the user input or None to wait forever.
+        :type timeout: int or float
+
+        :param default: Input returned when the timeout expires.
+        :type default: str
         """
         if hidden:
             handler = PasswordInputHandler(source=self)
@@ -100,8 +111,15 @@ class InputManager():
             handler = InputHandler(source=self)
 
         handler.skip_concurrency_check = self._skip_concurrency_check
-        handler.get_input(message)
+        if timeout is None:
+            handler.get_input(message)
+        else:
+            handler.get_input(message, timeout=timeout, default=default)
         handler.wait_on_input()
+
+        if handler.input_successful():
+            self._record_input(handler.value, hidden)
+
         return handler.value
 
     def get_input(self, args=None):
@@ -125,7 +143,13 @@ class InputManager():
 
         handler.skip_concurrency_check = self._skip_concurrency_check
         handler.set_callback(self.process_input)
-        handler.get_input(prompt)
+        # handlers which don't support timeouts still work for screens without a timeout
+        if self._ui_screen.input_timeout is None:
+            handler.get_input(prompt)
+        else:
+            handler.get_input(prompt,
+                              timeout=self._ui_screen.input_timeout,
+                              default=self._ui_screen.default_input)
 
     def _is_input_expected(self, prompt):
         """Check if user handled input processing some other way.
@@ -151,6 +175,8 @@ class InputManager():
 
         :raises: ExitMainLoop or any other kind of exception from screen processing.
         """
+        self._record_input(user_input, self._ui_screen.hide_user_input)
+
         # process the input, if it wasn't processed (valid)
         # increment the error counter
         try:
@@ -168,6 +194,11 @@ class InputManager():
 
         App.get_scheduler().process_input_result(result, self.input_error_threshold_exceeded)
 
+    def _record_input(self, user_input, hidden):
+        recorder = App.get_scheduler().recorder
+        if recorder is not None:
+            recorder.input_received(self._ui_screen, user_input, hidden=hidden)
+
     def _process_input(self, key):
         """Method called internally to process unhandled input key presses.
 
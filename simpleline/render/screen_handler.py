@@ -56,3 +56,11 @@ class ScreenHandler():
         See: `simpleline.render.screen_scheduler.push_screen_modal()`.
         """
         App.get_scheduler().push_screen_modal(ui_screen=ui_screen, args=args)
+
+    @classmethod
+    def push_screen_modal_async(cls, ui_screen, args=None):
+        """Schedule screen to the active scheduler.
+
+        See: `simpleline.render.screen_scheduler.push_screen_modal_async()`.
+        """
+        return App.get_scheduler().push_screen_modal_async(ui_screen=ui_screen, args=args)
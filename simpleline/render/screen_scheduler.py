@@ -20,13 +20,18 @@
 # Author(s): Jiri Konecny <jkonecny@redhat.com>
 #
 
+import sys
 import threading
 
+from contextlib import redirect_stdout
 
 from simpleline import App
 from simpleline.event_loop import ExitMainLoop
-from simpleline.event_loop.signals import ExceptionSignal, RenderScreenSignal, CloseScreenSignal
-from simpleline.render import RenderUnexpectedError
+from simpleline.event_loop.signals import ExceptionSignal, RenderScreenSignal, CloseScreenSignal, \
+    ProgressSignal
+from simpleline.render import RenderUnexpectedError, ModalResultNotReadyError
+from simpleline.render.differential_output import DifferentialOutput
+from simpleline.render.instrumentation import RenderInstrumentation, RenderPhase
 from simpleline.render.screen.input_manager import UserInputAction
 from simpleline.render.screen_stack import ScreenStack, ScreenData, ScreenStackEmptyException
 
@@ -37,7 +42,7 @@ log = get_simpleline_logger()
 RAW_INPUT_LOCK = threading.Lock()
 
 
-__all__ = ["ScreenScheduler"]
+__all__ = ["ScreenScheduler", "ModalResult"]
 
 
 class ScreenScheduler():
@@ -62,6 +67,9 @@ class ScreenScheduler():
         self._register_handlers()
 
         self._first_screen_scheduled = False
+        self._differential_output = None
+        self._instrumentation = RenderInstrumentation()
+        self._recorder = None
 
     @staticmethod
     def _spacer():
@@ -70,6 +78,7 @@ class ScreenScheduler():
     def _register_handlers(self):
         self._event_loop.register_signal_handler(RenderScreenSignal, self._process_screen_callback)
         self._event_loop.register_signal_handler(CloseScreenSignal, self._close_screen_callback)
+        self._event_loop.register_signal_handler(ProgressSignal, self._progress_callback)
 
     @property
     def quit_screen(self):
@@ -86,6 +95,55 @@ class ScreenScheduler():
         """
         self._quit_screen = quit_screen
 
+    @property
+    def differential_output(self):
+        """Differential output used to draw screens.
+
+        Enabled by the `differential_output` global configuration option.
+
+        :returns: Instance of `simpleline.render.differential_output.DifferentialOutput` or None
+                  if the differential output is disabled.
+        """
+        configuration = App.get_configuration()
+
+        if not configuration.differential_output:
+            self._differential_output = None
+        elif self._differential_output is None or \
+                self._differential_output.ansi != configuration.terminal_supports_ansi or \
+                self._differential_output.sink is not configuration.output_sink:
+            self._differential_output = DifferentialOutput(configuration.terminal_supports_ansi,
+                                                           configuration.output_sink)
+
+        return self._differential_output
+
+    @property
+    def instrumentation(self):
+        """Instrumentation of the screen processing.
+
+        Register observers here to get timings of the processing phases of every screen.
+
+        :returns: Instance of `simpleline.render.instrumentation.RenderInstrumentation`.
+        """
+        return self._instrumentation
+
+    @property
+    def recorder(self):
+        """Recorder of the drawn screens and the user input.
+
+        :returns: Instance of `simpleline.render.session_recorder.SessionRecorder` or None
+                  if the recording is disabled (default).
+        """
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder):
+        """Set recorder of the drawn screens and the user input.
+
+        :param recorder: Recorder to use or None to disable the recording.
+        :type recorder: Instance of `simpleline.render.session_recorder.SessionRecorder` or None.
+        """
+        self._recorder = recorder
+
     @property
     def nothing_to_render(self):
         """Is something for rendering in the scheduler stack?
@@ -130,14 +188,15 @@ class ScreenScheduler():
         """
         log.debug("Replacing screen %s", ui_screen)
         try:
-            execute_new_loop = self._screen_stack.pop().execute_new_loop
+            old_screen = self._screen_stack.pop()
+            execute_new_loop = old_screen.execute_new_loop
         except ScreenStackEmptyException as e:
             raise ScreenStackEmptyException("Switch screen is not possible when there is no "
                                             "screen scheduled!") from e
 
         # we have to keep the old_loop value so we stop
         # dialog's mainloop if it ever uses switch_screen
-        screen = ScreenData(ui_screen, args, execute_new_loop)
+        screen = ScreenData(ui_screen, args, execute_new_loop, old_screen.modal_result)
         self._screen_stack.append(screen)
         self.redraw()
 
@@ -174,9 +233,38 @@ class ScreenScheduler():
         # the old one will wait after this event loop will be closed
         self._event_loop.execute_new_loop(RenderScreenSignal(self))
 
+    def push_screen_modal_async(self, ui_screen, args=None):
+        """Show a modal screen without waiting until it is closed.
+
+        The new screen is shown on top of the current one and the caller is redisplayed when
+        the new screen is closed, the same way as with `push_screen_modal()`. However, no new
+        event loop is started and this method returns immediately. Use the returned object to
+        react on closing of the screen.
+
+        :param ui_screen: screen to show
+        :type ui_screen: UIScreen instance
+        :param args: optional argument, please see switch_screen for details
+        :type args: anything
+
+        :returns: Result resolved when the screen is closed.
+        :rtype: `ModalResult` instance
+        """
+        log.debug("Pushing non-blocking modal screen %s to stack", ui_screen)
+        modal_result = ModalResult(ui_screen)
+        screen = ScreenData(ui_screen, args, False, modal_result)
+        self._screen_stack.append(screen)
+        self.redraw()
+        return modal_result
+
     def _close_screen_callback(self, signal, data):
         self.close_screen(signal.source)
 
+    def _progress_callback(self, signal, data):
+        signal.source.redraw_requested()
+
+        if not self._screen_stack.empty():
+            self.redraw()
+
     def close_screen(self, closed_from=None):
         """Close the currently displayed screen and exit it's main loop if necessary.
 
@@ -196,6 +284,9 @@ class ScreenScheduler():
         if screen.execute_new_loop:
             self._event_loop.close_loop()
 
+        if screen.modal_result is not None:
+            screen.modal_result.resolve(screen.ui_screen)
+
         # redraw screen if there is what to redraw
         # and if it is not modal screen (modal screen parent is blocked)
         if not self._screen_stack.empty() and not screen.execute_new_loop:
@@ -225,6 +316,13 @@ class ScreenScheduler():
 
         log.debug("Processing screen %s", top_screen)
 
+        frame = self._instrumentation.begin_frame(top_screen.ui_screen)
+        try:
+            self._process_screen_frame(top_screen, frame)
+        finally:
+            self._instrumentation.end_frame(frame)
+
+    def _process_screen_frame(self, top_screen, frame):
         # this screen is used first time (call setup() method)
         if not top_screen.ui_screen.screen_ready:
             if not top_screen.ui_screen.setup(top_screen.args):
@@ -234,10 +332,13 @@ class ScreenScheduler():
                 log.warning("Screen %s setup wasn't successful", top_screen)
                 return
 
+            frame.mark(RenderPhase.SETUP)
+
         # get the widget tree from the screen and show it in the screen
         try:
             # refresh screen content
             top_screen.ui_screen.refresh(top_screen.args)
+            frame.mark(RenderPhase.REFRESH)
 
             # Screen was closed in the refresh method
             if top_screen != self._get_last_screen():
@@ -248,6 +349,7 @@ class ScreenScheduler():
 
             if top_screen.ui_screen.input_required:
                 log.debug("Input is required by %s screen", top_screen)
+                self._instrumentation.input_started(top_screen.ui_screen)
                 top_screen.ui_screen.get_input_with_error_check(top_screen.args)
         except ExitMainLoop:  # pylint: disable=try-except-raise
             raise
@@ -261,18 +363,64 @@ class ScreenScheduler():
         :param active_screen: Screen which should be draw to the console.
         :type active_screen: Classed based on `simpleline.render.screen.UIScreen`.
         """
+        output = self.differential_output
+        sink = App.get_configuration().output_sink
+        frame = self._instrumentation.frame
+        recorder = self._recorder
+
+        if recorder is not None:
+            # record the text as it is written, screens may print more than their window
+            sink.begin_capture()
+
         # get the widget tree from the screen and show it in the screen
         try:
+            if output is not None:
+                output.begin_frame()
+            else:
+                sink.begin_frame()
+
             if not active_screen.ui_screen.no_separator:
                 # separate the content on the screen from the stuff we are about to display now
-                print(self._spacer())
+                if output is not None:
+                    output.add_lines(self._spacer().split("\n"))
+                else:
+                    sink.write(self._spacer() + "\n")
 
-            # print UIScreen content
-            active_screen.ui_screen.show_all()
+                frame.mark(RenderPhase.PRINT)
+
+            # print UIScreen content, text printed by the screen must keep its place in the frame
+            with redirect_stdout(_ScreenStdout(sys.stdout, sink, output)):
+                active_screen.ui_screen.show_all()
         except ExitMainLoop:  # pylint: disable=try-except-raise
             raise
         except Exception:    # pylint: disable=broad-except
             self._event_loop.enqueue_signal(ExceptionSignal(self))
+        finally:
+            if recorder is not None:
+                self._record_frame(recorder, active_screen.ui_screen, sink, output)
+
+            if output is not None and output.frame_started:
+                output.end_frame()
+
+            # write the whole screen at once
+            if sink.frame_started:
+                sink.end_frame()
+
+            frame.mark(RenderPhase.PRINT)
+
+    @staticmethod
+    def _record_frame(recorder, ui_screen, sink, output):
+        """Record lines written for the screen to the sink and the differential output."""
+        lines = sink.end_capture().split("\n")
+        # the last line is empty if the text ends with a new line
+        if not lines[-1]:
+            lines.pop()
+
+        # differential output writes the lines at the end of the frame
+        if output is not None:
+            lines.extend(output.frame_lines)
+
+        recorder.frame_drawn(ui_screen, lines)
 
     def _get_last_screen(self):
         if self._screen_stack.empty():
@@ -282,6 +430,7 @@ class ScreenScheduler():
 
     def process_input_result(self, input_result, should_redraw):
         active_screen = self._get_last_screen()
+        self._instrumentation.input_finished(active_screen.ui_screen)
 
         if not input_result.was_successful():
             if should_redraw:
@@ -299,13 +448,132 @@ class ScreenScheduler():
                 self.close_screen()
             elif input_result == UserInputAction.QUIT:
                 if self.quit_screen:
-                    self.push_screen_modal(self.quit_screen)
-                    try:
-                        if self.quit_screen.answer is True:
-                            raise ExitMainLoop()
-
-                        self.redraw()
-                    except AttributeError as e:
-                        raise ExitMainLoop() from e
+                    modal_result = self.push_screen_modal_async(self.quit_screen)
+                    modal_result.add_done_callback(self._quit_screen_closed)
                 else:
                     raise ExitMainLoop()
+
+    @staticmethod
+    def _quit_screen_closed(modal_result):
+        # quit screens without the answer property always quit the application
+        if getattr(modal_result.screen, "answer", True) is True:
+            raise ExitMainLoop()
+
+
+class ModalResult():
+    """Result of a modal screen shown by `ScreenScheduler.push_screen_modal_async()`.
+
+    The result is resolved when the screen is closed. The value of the result is taken from
+    the `answer` property of the screen, if the screen has one.
+    """
+
+    def __init__(self, ui_screen):
+        """Create result of the modal screen.
+
+        :param ui_screen: The modal screen.
+        :type ui_screen: UIScreen instance
+        """
+        self._screen = ui_screen
+        self._done = False
+        self._value = None
+        self._callbacks = []
+
+    @property
+    def screen(self):
+        """The modal screen.
+
+        If the modal screen was replaced by another screen, this is the screen which was closed.
+        """
+        return self._screen
+
+    def done(self):
+        """Was the modal screen closed?
+
+        :rtype: bool
+        """
+        return self._done
+
+    def result(self):
+        """Get the answer of the closed modal screen.
+
+        :returns: Value of the `answer` property of the screen or None if the screen doesn't
+                  have this property.
+        :raises ModalResultNotReadyError: if the screen is not closed yet
+        """
+        if not self._done:
+            raise ModalResultNotReadyError("Modal screen {} is not closed yet!".format(
+                self._screen))
+
+        return self._value
+
+    def add_done_callback(self, callback):
+        """Call the callback when the modal screen is closed.
+
+        The callback is called immediately if the screen is already closed.
+
+        :param callback: Callback called with this result as the only argument.
+        :type callback: Function ``func(modal_result)``.
+        """
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def resolve(self, ui_screen=None):
+        """Resolve the result and call the callbacks.
+
+        This is called by the scheduler when the screen is closed.
+
+        :param ui_screen: Screen which was closed, if the modal screen was replaced.
+        :type ui_screen: UIScreen instance
+        """
+        if self._done:
+            return
+
+        if ui_screen is not None:
+            self._screen = ui_screen
+
+        self._value = getattr(self._screen, "answer", None)
+        self._done = True
+
+        callbacks = self._callbacks
+        self._callbacks = []
+        for callback in callbacks:
+            callback(self)
+
+
+class _ScreenStdout():
+    """Standard output used while a screen is drawn.
+
+    Screens may print to the standard output directly. The text is written to the output sink
+    frame so it is not written before the separator and the widgets printed before it.
+    """
+
+    def __init__(self, stream, sink, output):
+        self._stream = stream
+        self._sink = sink
+        self._output = output
+        self._thread = threading.get_ident()
+
+    def write(self, text):
+        if threading.get_ident() != self._thread:
+            return self._stream.write(text)
+
+        if self._output is not None and self._output.frame_started:
+            # differential output can't contain text printed by the screen, use the full output
+            self._sink.begin_frame()
+            self._output.flush_frame()
+
+        # the sink writes the finished frame to the real standard output
+        if not self._sink.frame_started:
+            return self._stream.write(text)
+
+        self._sink.write(text)
+        return len(text)
+
+    def flush(self):
+        if not self._sink.frame_started:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
@@ -104,10 +104,14 @@ class ScreenStack():
 class ScreenData():
     """Inner data class to store screen data."""
 
-    def __init__(self, ui_screen, args=None, execute_new_loop=False):
+    __slots__ = ("ui_screen", "args", "execute_new_loop", "modal_result")
+
+    def __init__(self, ui_screen, args=None, execute_new_loop=False, modal_result=None):
         self.ui_screen = ui_screen
         self.args = args
         self.execute_new_loop = execute_new_loop
+        # resolved when the screen is closed (see `ScreenScheduler.push_screen_modal_async`)
+        self.modal_result = modal_result
 
     def __str__(self):
         msg = self.__class__.__name__
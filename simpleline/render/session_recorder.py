@@ -0,0 +1,204 @@
+# Recording of the drawn screens and the user input.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import atexit
+import gzip
+import json
+import time
+
+from time import perf_counter
+
+__all__ = ["SessionRecorder", "read_session", "replay_frames", "SESSION_FORMAT_VERSION"]
+
+SESSION_FORMAT_VERSION = 1
+
+
+class SessionRecorder():
+    """Record drawn screens and user input to a compressed log.
+
+    Set the recorder to the scheduler by the `ScreenScheduler.recorder` property. Every drawn
+    screen is recorded as a difference against the previous screen and every input processed
+    by a screen is recorded with the time when it was received.
+
+    The log is a gzip compressed file with one JSON record per line. Records are buffered in
+    memory and compressed to the file when the buffer is full, by `flush()` or by `close()`.
+    Every recorder appends a new session to the file, existing content is never changed.
+    Records which are not written when the Python interpreter exits are written by an `atexit`
+    handler.
+
+    Records have the "type" key and the "t" key with seconds from the start of the session:
+
+    * "session" -- first record of the session with the "version" of the format and the "start"
+      wall clock time.
+    * "frame" -- drawn screen with the "screen" class name, "height" in lines and the "changes"
+      list of [line index, line text] pairs which differ from the previous frame.
+    * "input" -- input for the "screen" class name with the "data" string. Hidden input
+      (passwords) is stored as null unless recording of hidden input is enabled.
+    """
+
+    def __init__(self, path, buffer_size=256, record_hidden_input=False, compresslevel=1):
+        """Create the recorder and start a new session in the file.
+
+        :param path: Path to the log file; new session is appended if it exists.
+        :type path: str
+
+        :param buffer_size: Number of records kept in memory before they are written.
+        :type buffer_size: int
+
+        :param record_hidden_input: Record also input which is not shown to the user.
+        :type record_hidden_input: bool
+
+        :param compresslevel: Level of the gzip compression from 1 (fastest) to 9 (smallest).
+        :type compresslevel: int
+        """
+        super().__init__()
+        self._path = path
+        self._buffer_size = buffer_size
+        self._record_hidden_input = record_hidden_input
+        self._compresslevel = compresslevel
+        self._buffer = []
+        self._previous_lines = []
+        self._start = perf_counter()
+        self._closed = False
+
+        self._add({"type": "session", "t": 0.0, "version": SESSION_FORMAT_VERSION,
+                   "start": time.time()})
+        atexit.register(self.close)
+
+    @property
+    def path(self):
+        """Path to the log file."""
+        return self._path
+
+    @property
+    def closed(self):
+        """Was the recorder closed?"""
+        return self._closed
+
+    def frame_drawn(self, screen, lines):
+        """Record the drawn screen.
+
+        :param screen: Screen which was drawn.
+        :type screen: `simpleline.render.screen.UIScreen` based instance.
+
+        :param lines: Lines of the drawn screen.
+        :type lines: list(str)
+        """
+        previous = self._previous_lines
+        changes = [[i, line] for i, line in enumerate(lines)
+                   if i >= len(previous) or previous[i] != line]
+        self._previous_lines = lines
+
+        self._add({"type": "frame", "t": self._now(), "screen": screen.__class__.__name__,
+                   "height": len(lines), "changes": changes})
+
+    def input_received(self, screen, data, hidden=False):
+        """Record the user input.
+
+        :param screen: Screen which received the input.
+        :type screen: `simpleline.render.screen.UIScreen` based instance.
+
+        :param data: The input.
+        :type data: str
+
+        :param hidden: Was the input hidden from the user (password)?
+        :type hidden: bool
+        """
+        if hidden and not self._record_hidden_input:
+            data = None
+
+        self._add({"type": "input", "t": self._now(), "screen": screen.__class__.__name__,
+                   "data": data})
+
+    def flush(self):
+        """Write the buffered records to the file."""
+        if not self._buffer:
+            return
+
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer = []
+
+        # every write appends a new gzip member, the file is never rewritten
+        with gzip.open(self._path, "ab", compresslevel=self._compresslevel) as f:
+            f.write(data)
+
+    def close(self):
+        """Write the buffered records and stop recording."""
+        if self._closed:
+            return
+
+        self.flush()
+        self._closed = True
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _now(self):
+        return round(perf_counter() - self._start, 6)
+
+    def _add(self, record):
+        if self._closed:
+            return
+
+        self._buffer.append(json.dumps(record, separators=(",", ":")) + "\n")
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+
+def read_session(path):
+    """Read records of all the sessions in the log file.
+
+    :param path: Path to the log file written by `SessionRecorder`.
+    :type path: str
+
+    :returns: Generator of record dictionaries in the order they were written.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def replay_frames(records):
+    """Reconstruct whole screens from the recorded frame differences.
+
+    :param records: Records returned by `read_session()`.
+    :type records: Iterable of dictionaries.
+
+    :returns: Generator of (time, screen class name, list of lines) tuples.
+    """
+    lines = []
+
+    for record in records:
+        record_type = record["type"]
+
+        if record_type == "session":
+            lines = []
+        elif record_type == "frame":
+            lines = lines[:record["height"]]
+            lines.extend([""] * (record["height"] - len(lines)))
+
+            for index, line in record["changes"]:
+                lines[index] = line
+
+            yield record["t"], record["screen"], list(lines)
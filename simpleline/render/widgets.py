@@ -19,17 +19,90 @@
 #
 
 
-import functools
+import threading
+
+from functools import lru_cache
 from textwrap import wrap
+from time import monotonic
+
+from simpleline import App
+from simpleline.event_loop.signals import ProgressSignal
+from simpleline.render.buffers import RowStringBuffer
 from simpleline.utils.i18n import _
 from simpleline.utils import ensure_str
 
 __all__ = ["Widget", "TextWidget", "SeparatorWidget", "EntryWidget", "ColumnWidget",
-           "CheckboxWidget", "CenterWidget"]
+           "CheckboxWidget", "CenterWidget", "ProgressWidget", "wrap_words", "wrap_cache_info",
+           "clear_wrap_cache"]
+
+# Maximal number of (text, width) pairs remembered by the word-wrap cache.
+WRAP_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_words(text, width):
+    """Wrap text by words to the given width.
+
+    Results are cached and shared by all widgets, so redraws of the same text
+    (help screens, long dialog messages) do not wrap it again.
+
+    :param text: Text to wrap. Existing new lines are kept.
+    :type text: str
+
+    :param width: Maximal width of one line.
+    :type width: int
+
+    :returns: Text with new lines added where the lines should be wrapped.
+    :rtype: str
+    """
+    lines = []
+    # Wrap each line separately
+    for line in text.split('\n'):
+        sublines = []
+        for subline in wrap(line, width):
+            sublines.append(subline)
+            if len(subline) < width:
+                # line shorter than width will be wrapped by '\n' we add
+                sublines.append('\n')
+            # line with length == width will be wrapped by the width based
+            # wrapping logic
+        # end of line will be wrapped by '\n' following the line in
+        # original text
+        if sublines and sublines[-1] == '\n':
+            sublines.pop()
+        lines.append("".join(sublines))
+    return '\n'.join(lines)
+
+
+def wrap_cache_info():
+    """Get statistics of the word-wrap cache.
+
+    :returns: Named tuple with the `hits`, `misses`, `maxsize` and `currsize` fields.
+    """
+    # lru_cache wrapper methods are not visible to pylint
+    return wrap_words.cache_info()  # pylint: disable=no-value-for-parameter
+
+
+def clear_wrap_cache():
+    """Drop all cached word-wrap results and reset the statistics."""
+    wrap_words.cache_clear()
 
 
 class Widget():
 
+    # Widgets are created in large numbers, do not create `__dict__` for every instance.
+    # Subclasses should define their own `__slots__` for the same reason.
+    __slots__ = ("_buffer", "_max_width", "_cursor", "_dirty", "_render_width")
+
+    # Class of the render buffer used by widgets.
+    # See `simpleline.render.buffers` for available implementations.
+    buffer_class = RowStringBuffer
+
+    # Set to True in widgets which call `mark_dirty()` on every change of their state.
+    # Only these widgets can reuse their rendered buffer, others are rendered every time.
+    # The flag is not inherited, every subclass has to set it explicitly, see `__init_subclass__`.
+    tracks_changes = False
+
     def __init__(self, max_width=None, default=None):
         """Initializes base Widgets buffer.
 
@@ -41,31 +114,55 @@ class Widget():
         :param default: string containing the default content to fill the buffer with
         :type default: string
         """
-        self._buffer = []
+        self._buffer = self.buffer_class()
         if default:
-            self._buffer = [[c for c in l] for l in default.split("\n")] # pylint: disable=unnecessary-comprehension
+            self._buffer.set_lines(default.split("\n"))
         self._max_width = max_width
         self._cursor = (0, 0)  # row, col
+        self._dirty = True
+        self._render_width = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Do not inherit the `tracks_changes` flag.
+
+        A subclass may override `render()` or change its state without `mark_dirty()` so it
+        would show an outdated buffer. Subclasses which track their changes have to say so.
+        """
+        super().__init_subclass__(**kwargs)
+        if "tracks_changes" not in cls.__dict__:
+            cls.tracks_changes = False
 
     @property
     def height(self):
         """The current height of the internal buffer."""
-        return len(self._buffer)
+        return self._buffer.height
 
     @property
     def width(self):
         """The current width of the internal buffer (id of the first empty column)."""
-        return functools.reduce(lambda acc, l: max(acc, len(l)), self._buffer, 0)
+        return self._buffer.width
 
     def clear(self):
         """Clears this widgets buffer and resets cursor."""
-        self._buffer = []
+        self._buffer.clear()
         self._cursor = (0, 0)
 
     @property
     def content(self):
         """Return a list (rows) of lists (columns) with one character elements."""
-        return self._buffer
+        return self._buffer.content
+
+    @property
+    def is_dirty(self):
+        """Was the widget changed after the last render?
+
+        Widgets which are not tracking their changes (see `tracks_changes`) are always dirty.
+        """
+        return self._dirty or not self.tracks_changes
+
+    def mark_dirty(self):
+        """Mark this widget as changed so it will be rendered again."""
+        self._dirty = True
 
     def render(self, width):
         """Redraw the widget's self._buffer.
@@ -77,6 +174,26 @@ class Widget():
         methods to copy their contents to self._buffer.
         """
         self.clear()
+        self._dirty = False
+        self._render_width = width
+
+    def render_if_dirty(self, width):
+        """Render the widget only if it was changed or the width is different.
+
+        Containers are using this method to render their items so an unchanged widget keeps its
+        buffer from the last render.
+
+        :param width: the width of buffer requested by the caller
+        :type width: int
+
+        :returns: True if the widget was rendered, False if the old buffer was kept.
+        :rtype: bool
+        """
+        if not self.is_dirty and width == self._render_width:
+            return False
+
+        self.render(width)
+        return True
 
     def get_lines(self):
         """Return lines to write out in order to show this widget.
@@ -84,7 +201,7 @@ class Widget():
         :return: lines representing this widget
         :rtype: list(str)
         """
-        return [str("".join(line)) for line in self._buffer]
+        return self._buffer.get_lines()
 
     def set_cursor_position(self, row, col):
         """Set cursor position.
@@ -128,24 +245,20 @@ class Widget():
         if col is None:
             col = self._cursor[1]
 
+        lines = w.get_lines()
+
         # fill up rows to accommodate for w.height
-        if self.height < row + w.height:
-            for _i in range(row + w.height - self.height):
-                self._buffer.append([])
-
-        # append columns to accommodate for w.width
-        for l in range(row, row + w.height):
-            l_len = len(self._buffer[l])
-            w_len = len(w.content[l - row])
-            if l_len < col + w_len:
-                self._buffer[l] += ((col + w_len - l_len) * [" "])
-            self._buffer[l][col:col + w_len] = w.content[l - row][:]
+        self._buffer.ensure_height(row + len(lines))
+
+        # copy rows and append columns to accommodate for w.width
+        for l, line in enumerate(lines, row):
+            self._buffer.write(l, col, line)
 
         # move the cursor to new spot
         if block:
-            self._cursor = (row + w.height, col)
+            self._cursor = (row + len(lines), col)
         else:
-            self._cursor = (row + w.height, 0)
+            self._cursor = (row + len(lines), 0)
 
     def write(self, text, row=None, col=None, width=None, block=False, wordwrap=False):
         """Emulate the typing machine writing to this widget's buffer.
@@ -188,71 +301,64 @@ class Widget():
             text = self._wrap_words(text, width)
 
         # emulate typing machine
-        for character in text:
-            # FIXME: Remove the code duplication below and optimize it
+        # every line is written by segments which fit to the rest of the row
+        for line_id, line in enumerate(text.split("\n")):
             # process newline
-            if character == "\n":
-                x += 1
-                if block:
-                    y = col
-                else:
-                    y = 0
+            if line_id > 0:
+                x, y = self._new_row(x, col, block)
+                self._buffer.ensure_height(x + 1)
 
-                self._increase_x_buffer_size(x)
-                continue
+            x, y = self._write_line(line, (x, y), col, width, block)
 
-            self._increase_x_buffer_size(x)
-            self._increase_y_buffer_size(x, y)
+        self._cursor = (x, y)
 
-            self._save_character_to_buffer(x, y, character)
+    def _write_line(self, line, position, col, width, block):
+        """Write one line without newlines to the buffer starting at `position`.
 
-            # shift to the next char
-            y += 1
-            if width is not None and y >= col + width:
-                x += 1
-                if block:
-                    y = col
-                else:
-                    y = 0
+        :returns: cursor position (row, column) behind the written line
+        :rtype: (int, int)
+        """
+        x, y = position
+        while line:
+            if width is not None:
+                # at least one character is written even if there is no space left
+                space = max(col + width - y, 1)
+                segment = line[:space]
+                line = line[space:]
+            else:
+                segment = line
+                line = ""
 
-        self._cursor = (x, y)
+            self._buffer.ensure_height(x + 1)
+            self._buffer.write(x, y, segment)
 
-    def _increase_x_buffer_size(self, x):
-        if x >= len(self._buffer):
-            for _i in range(x - len(self._buffer) + 1):
-                self._buffer.append([])
+            # shift behind the written segment
+            y += len(segment)
+            if width is not None and y >= col + width:
+                x, y = self._new_row(x, col, block)
 
-    def _increase_y_buffer_size(self, x, y):
-        if y >= len(self._buffer[x]):
-            self._buffer[x] += ((y - len(self._buffer[x]) + 1) * [" "])
+        return x, y
 
-    def _save_character_to_buffer(self, x, y, character):
-        self._buffer[x][y] = character
+    @staticmethod
+    def _new_row(x, col, block):
+        """Get the cursor position at the start of the next row.
+
+        When `block` is set the row starts at column `col`, otherwise at column 0.
+        """
+        return x + 1, col if block else 0
 
     @staticmethod
     def _wrap_words(text, width):
-        lines = []
-        # Wrap each line separately
-        for line in text.split('\n'):
-            sublines = []
-            for subline in wrap(line, width):
-                sublines.append(subline)
-                if len(subline) < width:
-                    # line shorter than width will be wrapped by '\n' we add
-                    sublines.append('\n')
-                # line with length == width will be wrapped by the width based
-                # wrapping logic
-            # end of line will be wrapped by '\n' following the line in
-            # original text
-            if sublines and sublines[-1] == '\n':
-                sublines.pop()
-            lines.append("".join(sublines))
-        return '\n'.join(lines)
+        return wrap_words(text, width)
 
 
 class TextWidget(Widget):
     """Class to handle wrapped text output."""
 
+    __slots__ = ("_text",)
+
+    tracks_changes = True
+
     def __init__(self, text):
         """
         :param text: text to format
@@ -266,6 +372,12 @@ class TextWidget(Widget):
         """Contains text of this widget."""
         return self._text
 
+    @text.setter
+    def text(self, text):
+        """Change text of this widget."""
+        self._text = text
+        self.mark_dirty()
+
     def render(self, width):
         """Renders the text widget limited to width number of columns.
 
@@ -292,6 +404,10 @@ class EntryWidget(TextWidget):
     value
     """
 
+    __slots__ = ("_title", "_value")
+
+    tracks_changes = True
+
     def __init__(self, title, value=None):
         """ Create Entry widget instance.
 
@@ -301,9 +417,27 @@ class EntryWidget(TextWidget):
         :param value: Actual value printed in second line below the title.
         :type value: String.
         """
+        self._title = title
+        self._value = value
         text = self._create_text(title=title, value=value)
         super().__init__(text)
 
+    @property
+    def title(self):
+        """Title of this entry."""
+        return self._title
+
+    @property
+    def value(self):
+        """Value printed below the title."""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """Change value printed below the title."""
+        self._value = value
+        self.text = self._create_text(title=self._title, value=value)
+
     @staticmethod
     def _create_text(title, value):
         msg = title
@@ -318,6 +452,10 @@ class EntryWidget(TextWidget):
 class SeparatorWidget(Widget):
     """Print empty line."""
 
+    __slots__ = ("_lines",)
+
+    tracks_changes = True
+
     def __init__(self, lines=1):
         """Construct SeparatorWidget for printing blank lines.
 
@@ -341,15 +479,17 @@ class SeparatorWidget(Widget):
 
         To print just a blank line we don't need too much logic.
         """
-        for i in range(0, self._lines):
-            self._buffer.append([])
-            self._buffer[i] += ""
+        self._buffer.append_rows(self._lines)
         self.set_cursor_position(self._lines - 1, 0)
 
 
 class CenterWidget(Widget):
     """Class to handle horizontal centering of content."""
 
+    __slots__ = ("_w",)
+
+    tracks_changes = True
+
     def __init__(self, w):
         """
         :param w: widget to center
@@ -358,6 +498,11 @@ class CenterWidget(Widget):
         super().__init__()
         self._w = w
 
+    @property
+    def is_dirty(self):
+        """Was this widget or the centered widget changed after the last render?"""
+        return super().is_dirty or self._w.is_dirty
+
     def render(self, width):
         """Render the centered widget to internal buffer.
 
@@ -365,7 +510,7 @@ class CenterWidget(Widget):
         :type width: int
         """
         super().render(width)
-        self._w.render(width)
+        self._w.render_if_dirty(width)
         # make sure col is an integer
         self.draw(self._w, col=(width - self._w.width) // 2)
 
@@ -373,6 +518,10 @@ class CenterWidget(Widget):
 class CheckboxWidget(Widget):
     """Widget to show checkbox with (un)checked box, name and description."""
 
+    __slots__ = ("_key", "_title", "_text", "_completed")
+
+    tracks_changes = True
+
     def __init__(self, key="x", title=None, text=None, completed=None):
         """
         :param key: tick character to be used inside [ ]
@@ -436,6 +585,12 @@ class CheckboxWidget(Widget):
         """Returns the state of the checkbox, checked is True."""
         return self._completed
 
+    @completed.setter
+    def completed(self, completed):
+        """Check or uncheck the checkbox."""
+        self._completed = completed
+        self.mark_dirty()
+
     @property
     def text(self):
         """Contains the description text from the second line."""
@@ -444,6 +599,8 @@ class CheckboxWidget(Widget):
 
 class ColumnWidget(Widget):
 
+    __slots__ = ("_spacing", "_columns")
+
     def __init__(self, columns, spacing=0):
         """Create text columns
 
@@ -493,3 +650,151 @@ class ColumnWidget(Widget):
 
             # recompute the leftmost empty column
             col_pos = max((col_pos + col_width), self.width) + self._spacing
+
+
+class ProgressWidget(Widget):
+    """Progress bar which can be updated from any thread.
+
+    Updates are folded to the latest state and the screen is redrawn at most `max_fps` times
+    per second. The last update is always shown.
+
+    [#####---------------]  25%
+    message
+
+    Redraw of the screen asks for user input again if the screen requires input. Use this
+    widget on screens which don't require input while the progress is updated.
+    """
+
+    __slots__ = ("_total", "_value", "_message", "_min_interval", "_lock", "_signal_pending",
+                 "_last_redraw", "_update_count", "_shown_update", "_render_count",
+                 "_dropped_count")
+
+    tracks_changes = True
+
+    def __init__(self, total=100, max_fps=10):
+        """
+        :param total: value of the finished progress
+        :type total: int greater than 0
+
+        :param max_fps: maximal number of redraws per second caused by this widget
+        :type max_fps: int or float greater than 0
+        """
+        super().__init__()
+        self._total = total
+        self._value = 0
+        self._message = ""
+        self._min_interval = 1 / max_fps
+        self._lock = threading.Lock()
+        self._signal_pending = False
+        self._last_redraw = None
+        self._update_count = 0
+        self._shown_update = 0
+        self._render_count = 0
+        self._dropped_count = 0
+
+    @property
+    def total(self):
+        """Value of the finished progress."""
+        return self._total
+
+    @property
+    def value(self):
+        """Actual value of the progress."""
+        return self._value
+
+    @property
+    def message(self):
+        """Message shown next to the progress bar."""
+        return self._message
+
+    @property
+    def update_count(self):
+        """Number of updates of this widget."""
+        return self._update_count
+
+    @property
+    def render_count(self):
+        """Number of renders which showed a new state of this widget."""
+        return self._render_count
+
+    @property
+    def dropped_count(self):
+        """Number of updates replaced by a newer update before they were shown."""
+        return self._dropped_count
+
+    def update(self, value, message=None):
+        """Set new state of the progress.
+
+        This method is thread safe and cheap; it can be called on every step of a long
+        operation.
+
+        :param value: new value of the progress
+        :type value: int
+
+        :param message: new message or None to keep the actual one
+        :type message: str
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            self._value = min(value, self._total)
+            if message is not None:
+                self._message = message
+
+            self._update_count += 1
+            self.mark_dirty()
+
+            if self._signal_pending:
+                return
+
+            self._signal_pending = True
+            delay = 0
+            if self._last_redraw is not None:
+                delay = self._last_redraw + self._min_interval - monotonic()
+
+        if delay > 0:
+            App.get_event_loop().call_later(delay, self._emit_signal)
+        else:
+            self._emit_signal()
+
+    def redraw_requested(self):
+        """The screen is going to be redrawn because of this widget.
+
+        Called by the scheduler when the `ProgressSignal` of this widget is processed.
+        """
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            self._signal_pending = False
+            self._last_redraw = monotonic()
+
+    def render(self, width):
+        """Render the progress bar.
+
+        :param width: maximum width allocated to the widget
+        :type width: int
+        """
+        super().render(width)
+
+        # TODO: Remove when python3-astroid 1.5.3 will be in Fedora
+        # pylint: disable=not-context-manager
+        with self._lock:
+            value = self._value
+            message = self._message
+
+            if self._shown_update != self._update_count:
+                self._render_count += 1
+                self._dropped_count += self._update_count - self._shown_update - 1
+                self._shown_update = self._update_count
+
+        percent = "{:>5d}%".format(value * 100 // self._total)
+        bar_width = max(width - len(percent) - 2, 1)
+        done = bar_width * value // self._total
+        self.write("[" + "#" * done + "-" * (bar_width - done) + "]" + percent, width=width)
+
+        if message:
+            self.set_cursor_position(1, 0)
+            self.write(message, width=width, wordwrap=True)
+
+    def _emit_signal(self):
+        App.get_event_loop().enqueue_signal(ProgressSignal(self))
@@ -0,0 +1,84 @@
+# Helper functions for the benchmarks.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Benchmarks are not run by the unit tests. Run them directly, for example:
+#
+#   python3 -m tests.benchmarks.render_buffer_bench
+#
+# or run all of them and save the results as JSON by `make bench`.
+#
+
+import time
+import tracemalloc
+
+
+def measure(func, repeat=5):
+    """Call `func` `repeat` times and return the best time in seconds."""
+    best = None
+
+    for _i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def measure_memory(func):
+    """Call `func` once and return the peak of memory allocated meanwhile in bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def percentile(values, fraction):
+    """Return value of the `fraction` (0.0 - 1.0) percentile of the values."""
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+def print_results(title, results):
+    """Print list of result dictionaries as a simple table."""
+    print(title)
+
+    if not results:
+        return
+
+    keys = list(results[0].keys())
+    print("  ".join("{:>14}".format(k) for k in keys))
+    for result in results:
+        print("  ".join(_format_value(result[k]) for k in keys))
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return "{:>14.6f}".format(value)
+
+    return "{:>14}".format(str(value))
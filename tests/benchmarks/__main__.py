@@ -0,0 +1,103 @@
+# Run all the benchmarks and save the results.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Usage:
+#
+#   python3 -m tests.benchmarks [--output results.json] [benchmark ...]
+#
+# Benchmark names are module names without the "_bench" suffix, e.g. "render".
+#
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+
+from tests.benchmarks import print_results
+
+BENCH_SUFFIX = "_bench"
+
+
+def find_benchmarks():
+    """Return names of all benchmark modules in this package."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    names = []
+
+    for file_name in sorted(os.listdir(directory)):
+        name, ext = os.path.splitext(file_name)
+        if ext == ".py" and name.endswith(BENCH_SUFFIX):
+            names.append(name[:-len(BENCH_SUFFIX)])
+
+    return names
+
+
+def run_benchmarks(names):
+    """Run benchmarks and return dictionary with results for every benchmark."""
+    results = {}
+
+    for name in names:
+        module = importlib.import_module("tests.benchmarks." + name + BENCH_SUFFIX)
+        print("Running {} benchmark".format(name), file=sys.stderr)
+
+        start = time.perf_counter()
+        module_results = module.run()
+        elapsed = time.perf_counter() - start
+
+        print_results(name, module_results)
+        print()
+
+        results[name] = {"results": module_results,
+                         "total_seconds": elapsed}
+
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run Simpleline benchmarks.")
+    parser.add_argument("-o", "--output", help="save results to this JSON file")
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark",
+                        help="benchmarks to run (default: all)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    available = find_benchmarks()
+
+    names = args.benchmarks or available
+    for name in names:
+        if name not in available:
+            sys.exit("Unknown benchmark '{}', available: {}".format(name, ", ".join(available)))
+
+    data = {"python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "benchmarks": run_benchmarks(names)}
+
+    if args.output:
+        with open(args.output, "wt") as f:
+            json.dump(data, f, indent=2)
+        print("Results saved to {}".format(args.output), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
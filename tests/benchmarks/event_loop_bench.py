@@ -0,0 +1,241 @@
+# Event loop throughput and latency benchmark.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import threading
+import time
+
+from simpleline.event_loop import AbstractSignal, ExitMainLoop
+from simpleline.event_loop.asyncio_event_loop import AsyncioEventLoop
+from simpleline.event_loop.main_loop import MainLoop
+from simpleline.event_loop.signals import ExceptionSignal
+
+from tests.benchmarks import percentile, print_results
+
+try:
+    from simpleline.event_loop.glib_event_loop import GLibEventLoop
+except (ImportError, ValueError):
+    # GLib is not available
+    GLibEventLoop = None
+
+SIGNALS = 100000
+PRODUCERS = (1, 2, 4, 8)
+RETURN_AFTER_CALLS = 10000
+NESTING_DEPTHS = (1, 10, 50)
+NESTING_REPEAT = 20
+# (priority, share of the signals); None priority is the ExceptionSignal
+MIXED_WORKLOAD = ((None, 0.1), (0, 0.45), (20, 0.45))
+
+
+class BenchSignal(AbstractSignal):
+
+    def __init__(self, priority=0):
+        super().__init__(None, priority)
+        self.created = time.perf_counter()
+
+
+class BenchExceptionSignal(ExceptionSignal):
+    """Exception signal with `__dict__` to store the creation time; built-in signals use slots."""
+
+
+class StartSignal(AbstractSignal):
+
+    def __init__(self):
+        super().__init__(None)
+
+
+class NestSignal(AbstractSignal):
+
+    def __init__(self, depth):
+        super().__init__(None)
+        self.depth = depth
+
+
+class LatencyRecorder():
+    """Signal handler recording time from creating signals to processing them."""
+
+    def __init__(self, expected=None):
+        self.latencies = []
+        self._expected = expected
+
+    def __call__(self, signal, data):
+        self.latencies.append(time.perf_counter() - signal.created)
+
+        if len(self.latencies) == self._expected:
+            raise ExitMainLoop()
+
+
+def _available_backends():
+    backends = [MainLoop, AsyncioEventLoop]
+    if GLibEventLoop is not None:
+        backends.append(GLibEventLoop)
+
+    return backends
+
+
+def _close_loop(loop):
+    if isinstance(loop, AsyncioEventLoop):
+        loop.asyncio_loop.close()
+
+
+def _result(backend, scenario, parameter, latencies, seconds):
+    return {"backend": backend.__name__,
+            "scenario": scenario,
+            "parameter": parameter,
+            "signals": len(latencies),
+            "signals_per_s": int(len(latencies) / seconds),
+            "p50_us": percentile(latencies, 0.5) * 1e6,
+            "p99_us": percentile(latencies, 0.99) * 1e6}
+
+
+def _bench_producers(backend, producers):
+    """Enqueue signals from producer threads and dispatch them in the running loop."""
+    loop = backend()
+    per_producer = SIGNALS // producers
+    recorder = LatencyRecorder(expected=per_producer * producers)
+    threads = []
+
+    def produce():
+        for _i in range(per_producer):
+            loop.enqueue_signal(BenchSignal())
+
+    def start_producers(signal, data):
+        for _i in range(producers):
+            thread = threading.Thread(target=produce)
+            threads.append(thread)
+            thread.start()
+
+    loop.register_signal_handler(BenchSignal, recorder)
+    loop.register_signal_handler(StartSignal, start_producers)
+    loop.enqueue_signal(StartSignal())
+
+    start = time.perf_counter()
+    loop.run()
+    seconds = time.perf_counter() - start
+
+    for thread in threads:
+        thread.join()
+
+    _close_loop(loop)
+    return _result(backend, "producers", producers, recorder.latencies, seconds)
+
+
+def _bench_return_after(backend):
+    """Measure how long process_signals(return_after=...) takes for an enqueued signal."""
+    loop = backend()
+    recorder = LatencyRecorder()
+    loop.register_signal_handler(BenchSignal, recorder)
+
+    start = time.perf_counter()
+    for _i in range(RETURN_AFTER_CALLS):
+        loop.enqueue_signal(BenchSignal())
+        loop.process_signals(return_after=BenchSignal)
+    seconds = time.perf_counter() - start
+
+    _close_loop(loop)
+    return _result(backend, "return_after", RETURN_AFTER_CALLS, recorder.latencies, seconds)
+
+
+def _bench_nesting(backend, max_depth):
+    """Open `max_depth` nested loops and close them again."""
+    durations = []
+
+    for _i in range(NESTING_REPEAT):
+        loop = backend()
+
+        def nest(signal, data, loop=loop):
+            if signal.depth < max_depth:
+                loop.execute_new_loop(NestSignal(signal.depth + 1))
+
+            if signal.depth > 0:
+                loop.close_loop()
+            else:
+                raise ExitMainLoop()
+
+        loop.register_signal_handler(NestSignal, nest)
+        loop.enqueue_signal(NestSignal(0))
+
+        start = time.perf_counter()
+        loop.run()
+        durations.append(time.perf_counter() - start)
+
+        _close_loop(loop)
+
+    return _result(backend, "nesting", max_depth, durations, sum(durations))
+
+
+def _bench_mixed_priorities(backend):
+    """Dispatch signals of different priorities including exception signals."""
+    loop = backend()
+    recorder = LatencyRecorder(expected=SIGNALS)
+
+    def record_exception(signal, data):
+        recorder(signal, data)
+
+    loop.register_signal_handler(BenchSignal, recorder)
+    loop.register_signal_handler(ExceptionSignal, record_exception)
+
+    signals = []
+    for priority, share in MIXED_WORKLOAD:
+        for _i in range(int(SIGNALS * share)):
+            if priority is None:
+                signal = BenchExceptionSignal(None, exception_info=(None, None, None))
+            else:
+                signal = BenchSignal(priority)
+
+            signals.append(signal)
+
+    # interleave the priorities
+    signals.sort(key=lambda s: id(s) % 7919)
+    for signal in signals:
+        signal.created = time.perf_counter()
+        loop.enqueue_signal(signal)
+
+    start = time.perf_counter()
+    loop.run()
+    seconds = time.perf_counter() - start
+
+    _close_loop(loop)
+    return _result(backend, "mixed_priorities", len(MIXED_WORKLOAD), recorder.latencies, seconds)
+
+
+def run():
+    """Measure throughput and latency of every available event loop."""
+    results = []
+
+    for backend in _available_backends():
+        for producers in PRODUCERS:
+            results.append(_bench_producers(backend, producers))
+
+        results.append(_bench_return_after(backend))
+
+        for depth in NESTING_DEPTHS:
+            results.append(_bench_nesting(backend, depth))
+
+        results.append(_bench_mixed_priorities(backend))
+
+    return results
+
+
+def main():
+    print_results("Event loop throughput and latency", run())
+
+
+if __name__ == "__main__":
+    main()
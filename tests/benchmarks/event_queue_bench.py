@@ -0,0 +1,110 @@
+# Event queue benchmark.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from queue import PriorityQueue
+
+from simpleline.event_loop.event_queue import EventQueue
+from simpleline.event_loop.signals import AbstractSignal
+
+from tests.benchmarks import measure, print_results
+
+SIGNALS = (10000, 100000, 1000000)
+PRIORITIES = (0, 20, 20, 20, 30)
+
+
+class LegacyEventQueue():
+    """Original queue implementation based on the `PriorityQueue`.
+
+    Checking priority of the top signal takes it out of the queue and puts it back.
+    """
+
+    def __init__(self):
+        self._queue = PriorityQueue()
+
+    def empty(self):
+        return self._queue.empty()
+
+    def enqueue(self, signal):
+        self._queue.put(signal)
+
+    def get(self):
+        return self._queue.get()
+
+    def get_top_event_if_priority(self, priority):
+        event = self._queue.get()
+        if event.priority == priority:
+            return event
+
+        self._queue.put(event)
+        return None
+
+
+class BenchSignal(AbstractSignal):
+    pass
+
+
+def _create_signals(count):
+    return [BenchSignal(source=None, priority=PRIORITIES[i % len(PRIORITIES)])
+            for i in range(count)]
+
+
+def _drain(queue_class, signals):
+    """Fill the queue and process it the same way the main loop does."""
+
+    def run_scenario():
+        queue = queue_class()
+        for signal in signals:
+            queue.enqueue(signal)
+
+        while not queue.empty():
+            signal = queue.get()
+            priority = signal.priority
+            while not queue.empty():
+                signal = queue.get_top_event_if_priority(priority)
+                if signal is None:
+                    break
+
+    return run_scenario
+
+
+def run():
+    """Enqueue and process signals by the legacy and the heap based queue."""
+    results = []
+
+    for count in SIGNALS:
+        signals = _create_signals(count)
+        repeat = 1 if count >= 1000000 else 3
+
+        for queue_class in (LegacyEventQueue, EventQueue):
+            seconds = measure(_drain(queue_class, signals), repeat=repeat)
+            results.append({"queue": queue_class.__name__,
+                            "signals": count,
+                            "seconds": seconds,
+                            "signals_per_s": int(count / seconds)})
+
+    return results
+
+
+def main():
+    print_results("Event queue enqueue and dispatch", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Input reader benchmark.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from io import StringIO
+from unittest import mock
+
+from simpleline import App
+from simpleline.event_loop.main_loop import MainLoop
+from simpleline.input.input_handler import InputHandler
+from simpleline.input.input_threading import ThreadInputReader, SingleThreadInputReader
+from simpleline.render.prompt import Prompt
+
+from tests.benchmarks import measure, print_results
+
+READERS = (ThreadInputReader, SingleThreadInputReader)
+PROMPTS = (100, 1000, 5000)
+
+
+def _ask_prompts(count):
+    def run_scenario():
+        handler = InputHandler()
+        prompt = Prompt(message="Benchmark")
+
+        for _i in range(count):
+            handler.get_input(prompt)
+            handler.wait_on_input()
+
+    return run_scenario
+
+
+def run():
+    """Answer many prompts with mocked input by every input reader."""
+    results = []
+
+    for count in PROMPTS:
+        for reader_class in READERS:
+            with mock.patch.object(MainLoop, "create_input_reader", side_effect=reader_class), \
+                 mock.patch("simpleline.input.input_handler.InputHandlerRequest._get_input",
+                            return_value="a"), \
+                 mock.patch("sys.stdout", new_callable=StringIO):
+                App.initialize()
+                seconds = measure(_ask_prompts(count), repeat=3)
+
+            results.append({"reader": reader_class.__name__,
+                            "prompts": count,
+                            "seconds": seconds,
+                            "prompts_per_s": int(count / seconds)})
+
+    # stop the input thread of the last reader
+    App.initialize()
+
+    return results
+
+
+def main():
+    print_results("User input throughput by input reader", run())
+
+
+if __name__ == "__main__":
+    main()
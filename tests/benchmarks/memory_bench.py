@@ -0,0 +1,97 @@
+# Memory benchmark of the widgets and signals.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from simpleline.event_loop.event_queue import EventQueue
+from simpleline.event_loop.signals import InputReceivedSignal
+from simpleline.render.containers import ListRowContainer
+from simpleline.render.widgets import TextWidget
+
+from tests.benchmarks import measure_memory, print_results
+
+ITEMS = 100000
+WIDTH = 80
+
+
+# Subclasses without `__slots__` have `__dict__` for every instance,
+# this is the representation used before the slots were added.
+class DictTextWidget(TextWidget):
+    pass
+
+
+class DictInputReceivedSignal(InputReceivedSignal):
+    pass
+
+
+def _container_bytes(widget_class, render):
+    def create():
+        container = ListRowContainer(columns=1)
+        for i in range(ITEMS):
+            container.add(widget_class("Item {}".format(i)))
+
+        if render:
+            container.render(WIDTH)
+
+        return container
+
+    return measure_memory(create)
+
+
+def _queue_bytes(signal_class):
+    def create():
+        queue = EventQueue()
+        for i in range(ITEMS):
+            queue.enqueue(signal_class(None, str(i)))
+
+        return queue
+
+    return measure_memory(create)
+
+
+def _result(scenario, representation, total_bytes):
+    return {"scenario": scenario,
+            "representation": representation,
+            "items": ITEMS,
+            "total_kb": total_bytes // 1024,
+            "bytes_per_item": total_bytes // ITEMS}
+
+
+def run():
+    """Measure memory used by a large container and by a full event queue."""
+    results = []
+
+    for representation, widget_class in (("slots", TextWidget), ("dict", DictTextWidget)):
+        results.append(_result("container", representation,
+                               _container_bytes(widget_class, render=False)))
+        results.append(_result("rendered_container", representation,
+                               _container_bytes(widget_class, render=True)))
+
+    for representation, signal_class in (("slots", InputReceivedSignal),
+                                         ("dict", DictInputReceivedSignal)):
+        results.append(_result("queued_signal", representation, _queue_bytes(signal_class)))
+
+    return results
+
+
+def main():
+    print_results("Memory used by containers and queued signals", run())
+
+
+if __name__ == "__main__":
+    main()
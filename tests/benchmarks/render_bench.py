@@ -0,0 +1,194 @@
+# Render benchmark of widgets, containers and screens.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from io import StringIO
+from unittest import mock
+
+from simpleline import App
+from simpleline.render.containers import ListColumnContainer, ListRowContainer, \
+    ScrollingListContainer, WindowContainer
+from simpleline.render.screen import UIScreen
+from simpleline.render.widgets import TextWidget, clear_wrap_cache
+
+from tests.benchmarks import measure, measure_memory, print_results
+
+WIDTH = 80
+TEXT_LENGTHS = (1000, 10000, 100000)
+LIST_SIZES = (10, 100, 1000, 10000)
+NESTING_DEPTHS = (2, 5, 10)
+SCREEN_WIDTHS = (80, 200, 1000)
+SCREEN_ITEMS = 500
+
+WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit",
+         "installation", "destination", "x86_64")
+
+
+def _create_text(length):
+    words = []
+    size = 0
+    i = 0
+
+    while size < length:
+        word = WORDS[i % len(WORDS)]
+        words.append(word)
+        size += len(word) + 1
+        i += 1
+
+    return " ".join(words)
+
+
+def _item_text(i):
+    return "Item {} with a description of the item".format(i)
+
+
+def _create_list(container_class, size):
+    items = [TextWidget(_item_text(i)) for i in range(size)]
+    return container_class(columns=3, items=items)
+
+
+def _create_nested_window(depth):
+    window = WindowContainer("Level {}".format(depth))
+    for i in range(10):
+        window.add(TextWidget(_item_text(i)))
+
+    if depth > 1:
+        window.add(_create_nested_window(depth - 1))
+
+    return window
+
+
+class BenchmarkScreen(UIScreen):
+
+    def __init__(self, items):
+        # high screen will not be paged
+        super().__init__(title="Benchmark", screen_height=100000)
+        self._items = items
+        self.input_required = False
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        self.window.add(TextWidget(_create_text(1000)))
+        self.window.add(_create_list(ListColumnContainer, self._items))
+
+
+def _result(scenario, size, width, cold_func, warm_func=None):
+    """Measure cold render (everything is created and rendered) and warm render.
+
+    Warm render re-renders only the top widget, unchanged children are reused.
+    """
+    return {"scenario": scenario,
+            "size": size,
+            "width": width,
+            "cold_s": measure(cold_func, repeat=3),
+            "warm_s": measure(warm_func, repeat=3) if warm_func else None,
+            "peak_kb": measure_memory(cold_func) // 1024}
+
+
+def _bench_text_widget():
+    results = []
+
+    for length in TEXT_LENGTHS:
+        text = _create_text(length)
+        widget = TextWidget(text)
+
+        def cold(text=text):
+            # the shared wrap cache would make every run after the first one warm
+            clear_wrap_cache()
+            TextWidget(text).render(WIDTH)
+
+        results.append(_result("text_widget", length, WIDTH, cold,
+                               lambda widget=widget: widget.render(WIDTH)))
+
+    return results
+
+
+def _bench_lists():
+    results = []
+
+    for container_class in (ListRowContainer, ListColumnContainer, ScrollingListContainer):
+        for size in LIST_SIZES:
+            container = _create_list(container_class, size)
+            container.render(WIDTH)
+
+            def cold(container_class=container_class, size=size):
+                _create_list(container_class, size).render(WIDTH)
+
+            def warm(container=container):
+                container.mark_dirty()
+                container.render_if_dirty(WIDTH)
+
+            results.append(_result(container_class.__name__, size, WIDTH, cold, warm))
+
+    return results
+
+
+def _bench_nested_windows():
+    results = []
+
+    for depth in NESTING_DEPTHS:
+        window = _create_nested_window(depth)
+        window.render(WIDTH)
+
+        def cold(depth=depth):
+            _create_nested_window(depth).render(WIDTH)
+
+        def warm(window=window):
+            window.mark_dirty()
+            window.render_if_dirty(WIDTH)
+
+        results.append(_result("nested_window", depth, WIDTH, cold, warm))
+
+    return results
+
+
+def _bench_show_all():
+    results = []
+    screen = BenchmarkScreen(SCREEN_ITEMS)
+
+    def cold():
+        screen.refresh()
+        screen.show_all()
+
+    with mock.patch("sys.stdout", new_callable=StringIO):
+        App.initialize()
+
+        for width in SCREEN_WIDTHS:
+            App.get_configuration().width = width
+            results.append(_result("show_all", SCREEN_ITEMS, width, cold, screen.show_all))
+
+    return results
+
+
+def run():
+    """Render widgets, containers and screens of different sizes."""
+    results = []
+    results.extend(_bench_text_widget())
+    results.extend(_bench_lists())
+    results.extend(_bench_nested_windows())
+    results.extend(_bench_show_all())
+    return results
+
+
+def main():
+    print_results("Render time (seconds) and peak memory (kB)", run())
+
+
+if __name__ == "__main__":
+    main()
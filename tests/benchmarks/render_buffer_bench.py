@@ -0,0 +1,78 @@
+# Compare render buffers used by widgets.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from unittest import mock
+
+from simpleline.render.buffers import CharListBuffer, RowStringBuffer
+from simpleline.render.containers import WindowContainer
+from simpleline.render.widgets import Widget, TextWidget
+
+from tests.benchmarks import measure, print_results
+
+BUFFERS = (CharListBuffer, RowStringBuffer)
+ROWS = (100, 1000, 5000)
+WIDTH = 80
+
+
+def _create_window(rows):
+    window = WindowContainer("Packages")
+    for i in range(rows):
+        window.add(TextWidget("package-{0}-1.0-1.fc99.x86_64  Description of the package {0}"
+                              .format(i)))
+    return window
+
+
+def _write_and_draw(rows):
+    text = "\n".join("row {} ".format(i) * 10 for i in range(rows))
+
+    def run_scenario():
+        source = Widget()
+        source.write(text)
+        target = Widget()
+        target.draw(source, col=4)
+
+    return run_scenario
+
+
+def run():
+    """Write and render long list of rows by every buffer type."""
+    results = []
+
+    for rows in ROWS:
+        for buffer_class in BUFFERS:
+            with mock.patch.object(Widget, "buffer_class", buffer_class):
+                window = _create_window(rows)
+                render_seconds = measure(lambda: window.render(WIDTH))  # pylint: disable=cell-var-from-loop
+                write_seconds = measure(_write_and_draw(rows))
+
+            results.append({"buffer": buffer_class.__name__,
+                            "rows": rows,
+                            "write_draw": write_seconds,
+                            "window_render": render_seconds})
+
+    return results
+
+
+def main():
+    print_results("Window render time by buffer type", run())
+
+
+if __name__ == "__main__":
+    main()
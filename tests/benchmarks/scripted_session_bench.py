@@ -0,0 +1,127 @@
+# Benchmark of whole scripted sessions.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+import time
+
+from simpleline import App
+from simpleline.input.input_threading import InputThreadManager
+from simpleline.input.scripted_input import ScriptedInputReader
+from simpleline.render.containers import ListColumnContainer
+from simpleline.render.output_sinks import FileOutputSink
+from simpleline.render.screen import UIScreen, InputState
+from simpleline.render.screen_handler import ScreenHandler
+from simpleline.render.widgets import TextWidget
+
+from tests.benchmarks import print_results
+
+SESSIONS = (10, 100, 1000)
+ITEMS = 20
+# open and close every item detail
+ANSWERS = [answer for i in range(ITEMS) for answer in (str(i + 1), "c")]
+
+
+class MenuScreen(UIScreen):
+
+    def __init__(self):
+        super().__init__("Menu")
+        self._container = None
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        self._container = ListColumnContainer(2)
+        for i in range(ITEMS):
+            self._container.add(TextWidget("Item {}".format(i)), self._open_detail, i)
+
+        self.window.add(self._container)
+
+    def input(self, args, key):
+        if self._container.process_user_input(key):
+            return InputState.PROCESSED
+
+        return key
+
+    @staticmethod
+    def _open_detail(data):
+        ScreenHandler.push_screen(DetailScreen(data))
+
+
+class DetailScreen(UIScreen):
+
+    def __init__(self, item):
+        super().__init__("Detail")
+        self._item = item
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        self.window.add(TextWidget("Detail of the item {}".format(self._item)))
+
+
+def _run_sessions(count, sink):
+    screens = 0
+    times = []
+
+    for _i in range(count):
+        App.initialize()
+        App.get_configuration().output_sink = sink
+        reader = ScriptedInputReader(ANSWERS)
+        InputThreadManager.get_instance().reader = reader
+
+        App.get_scheduler().schedule_screen(MenuScreen())
+        App.run()
+
+        screens += reader.stats.screen_count
+        for histogram in reader.stats.screen_times.values():
+            times.append(histogram)
+
+    return screens, times
+
+
+def run():
+    """Run many scripted sessions through the whole screen scheduler pipeline."""
+    results = []
+    sink = FileOutputSink(os.devnull)
+
+    try:
+        for count in SESSIONS:
+            start = time.perf_counter()
+            screens, histograms = _run_sessions(count, sink)
+            seconds = time.perf_counter() - start
+
+            total_us = sum(h.total for h in histograms)
+            results.append({"sessions": count,
+                            "screens": screens,
+                            "seconds": seconds,
+                            "screens_per_s": int(screens / seconds),
+                            "mean_screen_us": total_us / screens,
+                            "max_screen_us": max(h.max for h in histograms)})
+    finally:
+        sink.close()
+        App.initialize()
+
+    return results
+
+
+def main():
+    print_results("Scripted sessions through the screen scheduler", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Benchmark of the session recorder overhead.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+import tempfile
+
+from simpleline.render.session_recorder import SessionRecorder
+
+from tests.benchmarks import measure, print_results
+
+FRAMES = 10000
+HEIGHT = 30
+WIDTH = 80
+BUFFER_SIZES = (1, 64, 256)
+
+
+class ScreenMock():
+    pass
+
+
+def _frames():
+    """Frames where one line changes every time, like a counter on the screen."""
+    base = ["{:<{}}".format("Line {}".format(i), WIDTH) for i in range(HEIGHT)]
+    frames = []
+
+    for i in range(FRAMES):
+        lines = list(base)
+        lines[i % HEIGHT] = "{:<{}}".format("Changed {}".format(i), WIDTH)
+        frames.append(lines)
+
+    return frames
+
+
+def _record(path, buffer_size, frames):
+    def run_scenario():
+        # keep only the last session in the file
+        if os.path.exists(path):
+            os.remove(path)
+
+        screen = ScreenMock()
+        with SessionRecorder(path, buffer_size=buffer_size) as recorder:
+            for lines in frames:
+                recorder.frame_drawn(screen, lines)
+                recorder.input_received(screen, "1")
+
+    return run_scenario
+
+
+def run():
+    """Measure time spent by recording of one frame and one input."""
+    results = []
+    frames = _frames()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for buffer_size in BUFFER_SIZES:
+            path = os.path.join(tmp_dir, "session-{}.log.gz".format(buffer_size))
+            seconds = measure(_record(path, buffer_size, frames), repeat=3)
+
+            results.append({"buffer_size": buffer_size,
+                            "frames": FRAMES,
+                            "seconds": seconds,
+                            "us_per_frame": seconds / FRAMES * 1000000,
+                            "file_kb": os.path.getsize(path) // 1024})
+
+    return results
+
+
+def main():
+    print_results("Overhead of the session recording (frame and input)", run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# Asyncio event loop test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+import threading
+import unittest
+
+from io import StringIO
+from unittest import mock
+
+from simpleline import App
+from simpleline.event_loop.asyncio_event_loop import AsyncioEventLoop, AsyncioInputReader
+from simpleline.input.input_handler import InputHandler
+from simpleline.input.input_threading import InputThreadManager, SingleThreadInputReader
+from simpleline.render.prompt import Prompt
+
+from .event_loop_test import ProcessEvents_TestCase, SignalMock
+from .screen_scheduler_test import ScreenScheduler_TestCase
+
+
+class AsyncioProcessEvents_TestCase(ProcessEvents_TestCase):
+    """Run all the tests in ProcessEvents test case but with asyncio event loop."""
+
+    def create_loop(self):
+        self.loop = AsyncioEventLoop()
+
+    def tearDown(self):
+        super().tearDown()
+        self.loop.asyncio_loop.close()
+
+    def test_signal_from_thread(self):
+        self.callback_called = False
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_callback)
+        thread = threading.Thread(target=loop.enqueue_signal, args=(SignalMock(),))
+
+        # the asyncio loop is waiting when the thread enqueues the signal
+        loop.asyncio_loop.call_soon(thread.start)
+        loop.process_signals(return_after=SignalMock)
+        thread.join()
+
+        self.assertTrue(self.callback_called)
+
+    def test_asyncio_callbacks_run_while_waiting(self):
+        self.callback_called = False
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_callback)
+        loop.asyncio_loop.call_later(0.01, loop.enqueue_signal, SignalMock())
+        loop.process_signals(return_after=SignalMock)
+
+        self.assertTrue(self.callback_called)
+
+
+class AsyncioScreenScheduler_TestCase(ScreenScheduler_TestCase):
+    """Run all the tests in ScreenScheduler test case but with asyncio event loop."""
+
+    def schedule_screen_and_run(self, screen):
+        loop = AsyncioEventLoop()
+        # input is mocked by the tests so it must be read by threads
+        with mock.patch('sys.stdin', StringIO()):
+            App.initialize(event_loop=loop)
+            App.get_scheduler().schedule_screen(screen)
+            App.run()
+
+        loop.asyncio_loop.close()
+
+
+@mock.patch('sys.stdout', new_callable=StringIO)
+class AsyncioInputReader_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = AsyncioEventLoop()
+        App.initialize(event_loop=self.loop)
+
+        read_fd, self._write_fd = os.pipe()
+        self._stdin = os.fdopen(read_fd)
+
+    def tearDown(self):
+        super().tearDown()
+        self._stdin.close()
+        os.close(self._write_fd)
+        self.loop.asyncio_loop.close()
+
+    def test_reader_is_used(self, _):
+        reader = InputThreadManager.get_instance().reader
+        self.assertIsInstance(reader, AsyncioInputReader)
+
+    def test_read_input(self, stdout_mock):
+        os.write(self._write_fd, b"abc\n")
+
+        with mock.patch('sys.stdin', self._stdin):
+            h = InputHandler()
+            h.get_input(Prompt(message="ABC"))
+            h.wait_on_input()
+
+        self.assertEqual(h.value, "abc")
+        self.assertIn("ABC", stdout_mock.getvalue())
+
+    def test_read_more_lines_at_once(self, _):
+        os.write(self._write_fd, b"first\nsecond\n")
+
+        with mock.patch('sys.stdin', self._stdin):
+            h = InputHandler()
+            h.get_input(Prompt(message="ABC"))
+            h.wait_on_input()
+            first = h.value
+
+            h.get_input(Prompt(message="ABC"))
+            h.wait_on_input()
+
+        self.assertEqual(first, "first")
+        self.assertEqual(h.value, "second")
+
+    def test_end_of_file(self, _):
+        os.close(self._write_fd)
+        self._write_fd = os.open(os.devnull, os.O_WRONLY)
+
+        with mock.patch('sys.stdin', self._stdin):
+            h = InputHandler()
+            h.get_input(Prompt(message="ABC"))
+            h.wait_on_input()
+
+        self.assertFalse(h.input_successful())
+        self.assertIsNone(h.value)
+
+    @mock.patch('simpleline.input.input_handler.InputHandlerRequest._get_input')
+    def test_fallback_to_thread(self, input_mock, _):
+        input_mock.return_value = "a"
+
+        with mock.patch('sys.stdin', StringIO()):
+            with mock.patch.object(SingleThreadInputReader, "start",
+                                   side_effect=SingleThreadInputReader.start,
+                                   autospec=True) as start_mock:
+                h = InputHandler()
+                h.get_input(Prompt(message="ABC"))
+                h.wait_on_input()
+
+        start_mock.assert_called_once()
+        self.assertEqual(h.value, "a")
+
+
+# Hack to avoid running the original classes thanks to import
+del ProcessEvents_TestCase
+del ScreenScheduler_TestCase
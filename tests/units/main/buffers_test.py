@@ -0,0 +1,145 @@
+# Render buffers test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import unittest
+from unittest import mock
+
+from simpleline.render.buffers import RowStringBuffer, CharListBuffer
+from simpleline.render.widgets import Widget, TextWidget, CheckboxWidget, ColumnWidget
+from simpleline.render.containers import ListColumnContainer
+
+
+class RowStringBuffer_TestCase(unittest.TestCase):
+
+    def create_buffer(self):
+        return RowStringBuffer()
+
+    def setUp(self):
+        self.buffer = self.create_buffer()
+
+    def test_empty_buffer(self):
+        self.assertEqual(self.buffer.height, 0)
+        self.assertEqual(self.buffer.width, 0)
+        self.assertEqual(self.buffer.get_lines(), [])
+        self.assertEqual(self.buffer.content, [])
+
+    def test_ensure_height(self):
+        self.buffer.ensure_height(3)
+        self.assertEqual(self.buffer.get_lines(), ["", "", ""])
+
+        # never shrink the buffer
+        self.buffer.ensure_height(1)
+        self.assertEqual(self.buffer.height, 3)
+
+    def test_write_with_padding(self):
+        self.buffer.ensure_height(2)
+        self.buffer.write(1, 3, "abc")
+
+        self.assertEqual(self.buffer.get_lines(), ["", "   abc"])
+        self.assertEqual(self.buffer.width, 6)
+
+    def test_write_empty_text_pads_row(self):
+        self.buffer.ensure_height(1)
+        self.buffer.write(0, 2, "")
+
+        self.assertEqual(self.buffer.get_lines(), ["  "])
+
+    def test_overwrite(self):
+        self.buffer.set_lines(["0123456789"])
+        self.buffer.write(0, 2, "ab")
+        self.buffer.write(0, 8, "xyz")
+
+        self.assertEqual(self.buffer.get_lines(), ["01ab4567xyz"])
+
+    def test_content(self):
+        self.buffer.set_lines(["ab", "", "c"])
+
+        self.assertEqual(self.buffer.content, [["a", "b"], [], ["c"]])
+
+    def test_clear(self):
+        self.buffer.set_lines(["ab", "c"])
+        self.buffer.clear()
+
+        self.assertEqual(self.buffer.height, 0)
+
+
+class CharListBuffer_TestCase(RowStringBuffer_TestCase):
+
+    def create_buffer(self):
+        return CharListBuffer()
+
+
+class BufferCompatibility_TestCase(unittest.TestCase):
+    """Test that both buffers render widgets the same way."""
+
+    def _compare_buffers(self, create_widget):
+        results = []
+        for buffer_class in (CharListBuffer, RowStringBuffer):
+            with mock.patch.object(Widget, "buffer_class", buffer_class):
+                widget = create_widget()
+                results.append((widget.get_lines(), widget.content, widget.cursor))
+
+        self.assertEqual(results[0], results[1])
+
+    def _render_with_both_buffers(self, create_widget, width=40):
+        def create_and_render():
+            widget = create_widget()
+            widget.render(width)
+            return widget
+
+        self._compare_buffers(create_and_render)
+
+    def test_text_widget(self):
+        text = ("Long text which will be wrapped to more lines.\n\n"
+                "Tooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooo long word.")
+        self._render_with_both_buffers(lambda: TextWidget(text))
+
+    def test_write_block(self):
+        def create_widget():
+            w = Widget()
+            w.write("text\nnext line", row=2, col=5, width=4, block=True)
+            w.write("not block\n", row=0, col=3, width=10)
+            return w
+
+        self._compare_buffers(create_widget)
+
+    def test_zero_width_write(self):
+        def create_widget():
+            w = Widget()
+            w.write("abc", col=2, width=0)
+            return w
+
+        self._compare_buffers(create_widget)
+
+    def test_checkbox_widget(self):
+        self._render_with_both_buffers(lambda: CheckboxWidget(title="Title", text="Description",
+                                                              completed=True))
+
+    def test_column_widget(self):
+        self._render_with_both_buffers(lambda: ColumnWidget([(10, [TextWidget("Column one")]),
+                                                             (15, [TextWidget("Column two")])],
+                                                            spacing=2))
+
+    def test_list_container(self):
+        def create_widget():
+            items = [TextWidget("Item number {}".format(i)) for i in range(10)]
+            return ListColumnContainer(3, items)
+
+        self._render_with_both_buffers(create_widget)
@@ -25,7 +25,8 @@ from unittest.mock import patch
 
 from simpleline import App
 from simpleline.render.containers import WindowContainer, ListRowContainer, ListColumnContainer, \
-    KeyPattern
+    ScrollingListContainer, KeyPattern, LazyItems
+from simpleline.render.prompt import Prompt
 from simpleline.render.screen import UIScreen, InputState
 from simpleline.render.widgets import TextWidget
 
@@ -277,6 +278,276 @@ class Containers_TestCase(BaseWidgets_TestCase):
             c.render(19)
 
 
+class ContainerDirtyTracking_TestCase(unittest.TestCase):
+
+    def test_clean_items_are_not_rendered(self):
+        widgets = [RenderCounterWidget("First"), RenderCounterWidget("Second")]
+        c = WindowContainer()
+        for w in widgets:
+            c.add(w)
+
+        c.render_if_dirty(20)
+        self.assertFalse(c.is_dirty)
+        self.assertFalse(c.render_if_dirty(20))
+
+        # only the changed widget is rendered again
+        widgets[1].text = "Changed"
+        self.assertTrue(c.is_dirty)
+        self.assertTrue(c.render_if_dirty(20))
+
+        self.assertEqual(widgets[0].render_count, 1)
+        self.assertEqual(widgets[1].render_count, 2)
+        self.assertEqual(c.get_lines(), ["First", "Changed"])
+
+    def test_nested_container_rendering(self):
+        widget = RenderCounterWidget("Item")
+        inner = ListRowContainer(1, [widget])
+        outer = WindowContainer()
+        outer.add(inner)
+
+        outer.render_if_dirty(30)
+        # new window around the same container (new screen refresh)
+        new_outer = WindowContainer()
+        new_outer.add(inner)
+        new_outer.render_if_dirty(30)
+
+        self.assertEqual(widget.render_count, 1)
+        self.assertEqual(new_outer.get_lines(), ["1) Item"])
+
+    def test_add_marks_dirty(self):
+        c = ListRowContainer(2)
+        c.add(TextWidget("Item"))
+        c.render_if_dirty(30)
+
+        c.add(TextWidget("Other"))
+        self.assertTrue(c.is_dirty)
+
+        c.render_if_dirty(30)
+        self.assertEqual(c.get_lines(), ["1) Item" + 9 * " " + "2) Other"])
+
+    def test_key_pattern_change_marks_dirty(self):
+        c = ListRowContainer(1, [TextWidget("Item")])
+        c.render_if_dirty(30)
+
+        c.key_pattern = KeyPattern("{:d}. ")
+        c.render_if_dirty(30)
+
+        self.assertEqual(c.get_lines(), ["1. Item"])
+
+
+class ScrollingListContainer_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._callback_data = None
+        self._widgets = []
+
+    def _callback(self, data):
+        self._callback_data = data
+
+    def _create_container(self, count, columns=1, rows_per_page=2):
+        c = ScrollingListContainer(columns, rows_per_page=rows_per_page)
+        self._widgets = [RenderCounterWidget("Item {}".format(i + 1)) for i in range(count)]
+        for i, widget in enumerate(self._widgets):
+            c.add(widget, self._callback, i + 1)
+
+        return c
+
+    def test_first_page(self):
+        c = self._create_container(5)
+        c.render(30)
+
+        self.assertEqual(c.page_count, 3)
+        self.assertEqual(c.get_lines(), ["1) Item 1", "2) Item 2"])
+
+    def test_only_visible_items_rendered(self):
+        c = self._create_container(1000)
+        c.render(30)
+
+        render_counts = [widget.render_count for widget in self._widgets]
+        self.assertEqual(sum(render_counts), 2)
+
+    def test_changed_item_on_other_page(self):
+        c = self._create_container(5)
+        c.render_if_dirty(30)
+
+        self._widgets[4].mark_dirty()
+        self.assertFalse(c.is_dirty)
+        self._widgets[0].mark_dirty()
+        self.assertTrue(c.is_dirty)
+
+    def test_not_tracking_subclass_is_dirty(self):
+        class NotTrackingContainer(ScrollingListContainer):
+            tracks_changes = False
+
+        c = NotTrackingContainer(1)
+        c.render_if_dirty(30)
+
+        self.assertTrue(c.is_dirty)
+
+    def test_page_moving(self):
+        c = self._create_container(5)
+
+        self.assertFalse(c.previous_page())
+        self.assertTrue(c.next_page())
+        self.assertTrue(c.next_page())
+        self.assertFalse(c.next_page())
+        self.assertEqual(c.page, 2)
+
+        c.render_if_dirty(30)
+        self.assertEqual(c.get_lines(), ["5) Item 5"])
+
+        c.page = 100
+        self.assertEqual(c.page, 2)
+        c.page = -1
+        self.assertEqual(c.page, 0)
+
+    def test_page_change_marks_dirty(self):
+        c = self._create_container(5)
+        c.render_if_dirty(30)
+        self.assertFalse(c.is_dirty)
+
+        c.next_page()
+        self.assertTrue(c.is_dirty)
+        c.render_if_dirty(30)
+        self.assertEqual(c.get_lines(), ["3) Item 3", "4) Item 4"])
+
+    def test_columns(self):
+        c = self._create_container(10, columns=2, rows_per_page=2)
+        c.show_item(5)
+        c.render(40)
+
+        self.assertEqual(c.page, 1)
+        self.assertEqual(c.get_lines(), ["5) Item 5" + 12 * " " + "6) Item 6",
+                                         "7) Item 7" + 12 * " " + "8) Item 8"])
+
+    def test_input_jumps_to_page(self):
+        c = self._create_container(5)
+
+        self.assertTrue(c.process_user_input("4"))
+        self.assertEqual(c.page, 1)
+        self.assertIsNone(self._callback_data)
+
+        self.assertTrue(c.process_user_input("4"))
+        self.assertEqual(self._callback_data, 4)
+
+    def test_paging_input(self):
+        c = self._create_container(5)
+
+        self.assertFalse(c.process_user_input(Prompt.PREVIOUS_PAGE))
+        self.assertTrue(c.process_user_input(Prompt.NEXT_PAGE))
+        self.assertEqual(c.page, 1)
+        self.assertTrue(c.process_user_input(Prompt.PREVIOUS_PAGE))
+        self.assertEqual(c.page, 0)
+
+    def test_paging_options(self):
+        c = self._create_container(5)
+
+        p = Prompt()
+        c.add_paging_options(p)
+        self.assertEqual(list(p.options), [Prompt.NEXT_PAGE])
+
+        c.next_page()
+        p = Prompt()
+        c.add_paging_options(p)
+        self.assertEqual(sorted(p.options), sorted([Prompt.NEXT_PAGE, Prompt.PREVIOUS_PAGE]))
+
+        c.next_page()
+        p = Prompt()
+        c.add_paging_options(p)
+        self.assertEqual(list(p.options), [Prompt.PREVIOUS_PAGE])
+
+    def test_wrong_input(self):
+        c = self._create_container(5)
+
+        self.assertFalse(c.process_user_input("0"))
+        self.assertFalse(c.process_user_input("6"))
+        self.assertFalse(c.process_user_input("a"))
+        self.assertEqual(c.page, 0)
+
+    def test_empty(self):
+        c = ScrollingListContainer(1)
+        c.render(30)
+
+        self.assertEqual(c.page_count, 1)
+        self.assertEqual(c.get_lines(), [])
+
+
+class LazyItems_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._created = []
+        self._callback_data = None
+
+    def _factory(self, value):
+        self._created.append(value)
+        return TextWidget("Item {}".format(value))
+
+    def _callback(self, data):
+        self._callback_data = data
+
+    def test_sequence_source(self):
+        items = LazyItems(range(1000), factory=self._factory)
+        c = ScrollingListContainer(1, items, rows_per_page=2)
+        c.render(30)
+
+        self.assertEqual(c.size, 1000)
+        self.assertEqual(c.get_lines(), ["1) Item 0", "2) Item 1"])
+        self.assertEqual(self._created, [0, 1])
+
+    def test_generator_source(self):
+        consumed = []
+
+        def generate():
+            for i in range(1000):
+                consumed.append(i)
+                yield TextWidget("Item {}".format(i))
+
+        items = LazyItems(generate(), size=1000)
+        c = ScrollingListContainer(1, items, rows_per_page=2)
+        c.render(30)
+
+        self.assertEqual(c.get_lines(), ["1) Item 0", "2) Item 1"])
+        self.assertEqual(consumed, [0, 1])
+
+    def test_generator_without_size(self):
+        with self.assertRaises(TypeError):
+            LazyItems(i for i in range(10))
+
+    def test_generator_shorter_than_size(self):
+        items = LazyItems(iter([TextWidget("a")]), size=2)
+
+        with self.assertRaises(IndexError):
+            items[1]  # pylint: disable=pointless-statement
+
+    def test_item_created_on_selection(self):
+        items = LazyItems(["a", "b", "c"], factory=self._factory, callback=self._callback)
+        c = ListRowContainer(1, items)
+
+        self.assertTrue(c.process_user_input("3"))
+        self.assertEqual(self._callback_data, "c")
+        self.assertEqual(self._created, ["c"])
+
+    def test_items_created_once(self):
+        items = LazyItems(["a", "b"], factory=self._factory)
+        c = ListRowContainer(1, items)
+        c.render_if_dirty(30)
+        self.assertFalse(c.is_dirty)
+        c.mark_dirty()
+        c.render_if_dirty(30)
+
+        self.assertEqual(self._created, ["a", "b"])
+
+    def test_add_after_lazy_items(self):
+        items = LazyItems(["a"], factory=self._factory)
+        c = ListRowContainer(1, items)
+        c.add(TextWidget("added"))
+        c.render(30)
+
+        self.assertEqual(c.size, 2)
+        self.assertEqual(items[-1].widget.text, "added")
+        self.assertEqual(c.get_lines(), ["1) Item a", "2) added"])
+
+
 @patch('simpleline.input.input_handler.InputHandlerRequest._get_input')
 @patch('sys.stdout', new_callable=StringIO)
 class ContainerInput_TestCase(unittest.TestCase):
@@ -366,6 +637,19 @@ class ContainerInput_TestCase(unittest.TestCase):
         self._callback_called = data
 
 
+class RenderCounterWidget(TextWidget):
+
+    tracks_changes = True
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.render_count = 0
+
+    def render(self, width):
+        super().render(width)
+        self.render_count += 1
+
+
 class ScreenWithListWidget(UIScreen):
 
     def __init__(self, widgets_count):
@@ -0,0 +1,182 @@
+# Differential output test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import unittest
+from io import StringIO
+from unittest import mock
+
+from simpleline import App
+from simpleline.render.differential_output import DifferentialOutput, diff_lines, CLEAR_SCREEN
+from simpleline.render.screen import UIScreen
+from simpleline.render.widgets import TextWidget
+
+from .. import UtilityMixin
+
+
+class DiffLines_TestCase(unittest.TestCase):
+
+    def test_same_frames(self):
+        self.assertEqual(diff_lines(["a", "b"], ["a", "b"]), [])
+
+    def test_changed_line(self):
+        self.assertEqual(diff_lines(["a", "b", "c"], ["a", "x", "c"]), [(1, "x")])
+
+    def test_longer_frame(self):
+        self.assertEqual(diff_lines(["a"], ["a", "b", "c"]), [(1, "b"), (2, "c")])
+
+    def test_shorter_frame(self):
+        self.assertEqual(diff_lines(["a", "b", "c"], ["a"]), [])
+
+
+@mock.patch('sys.stdout', new_callable=StringIO)
+class DifferentialOutput_TestCase(unittest.TestCase):
+
+    def _write_frame(self, output, lines):
+        output.begin_frame()
+        output.add_lines(lines)
+        return output.end_frame()
+
+    def test_without_ansi(self, stdout_mock):
+        output = DifferentialOutput(ansi=False)
+
+        self._write_frame(output, ["a", "b"])
+        self._write_frame(output, ["a", "b"])
+
+        self.assertEqual(stdout_mock.getvalue(), "a\nb\na\nb\n")
+        self.assertEqual(output.last_frame_bytes, 4)
+        self.assertEqual(output.bytes_written, 8)
+        self.assertEqual(output.frames_written, 2)
+
+    def test_first_frame_clears_screen(self, stdout_mock):
+        output = DifferentialOutput(ansi=True)
+
+        written = self._write_frame(output, ["a", "b"])
+
+        expected = CLEAR_SCREEN + "a\nb\n"
+        self.assertEqual(stdout_mock.getvalue(), expected)
+        self.assertEqual(written, len(expected))
+
+    def test_only_changed_lines_written(self, stdout_mock):
+        output = DifferentialOutput(ansi=True)
+        self._write_frame(output, ["title", "value 1", "footer"])
+        stdout_mock.truncate(0)
+        stdout_mock.seek(0)
+
+        self._write_frame(output, ["title", "value 2", "footer"])
+
+        self.assertEqual(stdout_mock.getvalue(), "\x1b[2;1Hvalue 2\x1b[K\x1b[4;1H\x1b[J")
+        self.assertEqual(output.last_frame_bytes, len(stdout_mock.getvalue()))
+
+    def test_unchanged_frame(self, stdout_mock):
+        output = DifferentialOutput(ansi=True)
+        self._write_frame(output, ["title", "value"])
+        stdout_mock.truncate(0)
+        stdout_mock.seek(0)
+
+        self._write_frame(output, ["title", "value"])
+
+        # only the prompt area is cleaned
+        self.assertEqual(stdout_mock.getvalue(), "\x1b[3;1H\x1b[J")
+
+    def test_flush_frame_resets_last_frame(self, stdout_mock):
+        output = DifferentialOutput(ansi=True)
+        self._write_frame(output, ["a"])
+
+        output.begin_frame()
+        output.add_lines(["header"])
+        output.flush_frame()
+        self.assertFalse(output.frame_started)
+
+        stdout_mock.truncate(0)
+        stdout_mock.seek(0)
+        self._write_frame(output, ["a"])
+
+        self.assertEqual(stdout_mock.getvalue(), CLEAR_SCREEN + "a\n")
+
+
+@mock.patch('sys.stdout', new_callable=StringIO)
+class DifferentialScreenOutput_TestCase(unittest.TestCase, UtilityMixin):
+
+    def setUp(self):
+        App.initialize()
+        App.get_configuration().differential_output = True
+
+    def tearDown(self):
+        App.initialize()
+
+    def test_output_same_without_ansi(self, stdout_mock):
+        screen = CounterScreen(redraws=1)
+
+        App.get_scheduler().schedule_screen(screen)
+        App.run()
+
+        differential_output = stdout_mock.getvalue()
+        stdout_mock.truncate(0)
+        stdout_mock.seek(0)
+
+        App.initialize()
+        App.get_scheduler().schedule_screen(CounterScreen(redraws=1))
+        App.run()
+
+        self.assertEqual(differential_output, stdout_mock.getvalue())
+
+    def test_ansi_redraw_changed_line_only(self, stdout_mock):
+        App.get_configuration().terminal_supports_ansi = True
+        screen = CounterScreen(redraws=1)
+
+        App.get_scheduler().schedule_screen(screen)
+        App.run()
+
+        first_frame = CLEAR_SCREEN + self.calculate_separator() + "Counter 0\n"
+        second_frame = "\x1b[3;1HCounter 1\x1b[K\x1b[4;1H\x1b[J"
+        self.assertEqual(stdout_mock.getvalue(), first_frame + second_frame)
+
+        output = App.get_scheduler().differential_output
+        self.assertEqual(output.frames_written, 2)
+        self.assertEqual(output.last_frame_bytes, len(second_frame))
+
+    def test_disabled_by_default(self, _):
+        App.initialize()
+
+        self.assertIsNone(App.get_scheduler().differential_output)
+
+
+class CounterScreen(UIScreen):
+
+    def __init__(self, redraws):
+        super().__init__()
+        self.input_required = False
+        self._redraws = redraws
+        self._counter = 0
+        self._widget = TextWidget("")
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        self._widget.text = "Counter {}".format(self._counter)
+        self.window.add(self._widget)
+
+    def show_all(self):
+        super().show_all()
+
+        if self._counter < self._redraws:
+            self._counter += 1
+            self.redraw()
+        else:
+            self.close()
@@ -18,12 +18,17 @@
 # along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import threading
 import unittest
 
+from unittest import mock
+
 from simpleline.event_loop import AbstractSignal
 from simpleline.event_loop import EventHandler
 from simpleline.event_loop import ExitMainLoop
+from simpleline.event_loop.event_queue import EventQueue
 from simpleline.event_loop.main_loop import MainLoop
+from simpleline.event_loop.signals import ExceptionSignal
 
 
 class EventLoopHandler_TestCase(unittest.TestCase):
@@ -54,6 +59,7 @@ class ProcessEvents_TestCase(unittest.TestCase):
         self.signal_counter_copied = 0
         self.callback_called = False
         self.callback_args = None
+        self.timer_handle = None
         self.create_loop()
 
     def create_loop(self):
@@ -181,6 +187,93 @@ class ProcessEvents_TestCase(unittest.TestCase):
         loop.process_signals()
         self.assertEqual(self.signal_counter_copied, 3)
 
+    def test_enqueue_signals(self):
+        self.signal_counter = 0
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_signal_counter)
+        loop.register_signal_handler(PrioritySignalMock, self._handler_signal_counter)
+        loop.enqueue_signals([SignalMock(), SignalMock(), PrioritySignalMock(), SignalMock()])
+        loop.process_signals()
+        self.assertEqual(self.signal_counter, 1)
+
+        loop.process_signals()
+        self.assertEqual(self.signal_counter, 4)
+
+    def test_enqueue_signals_generator(self):
+        self.signal_counter = 0
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_signal_counter)
+        loop.enqueue_signals(SignalMock() for _i in range(5))
+        loop.enqueue_signals([])
+        loop.process_signals()
+
+        self.assertEqual(self.signal_counter, 5)
+
+    def test_mergeable_signals(self):
+        self.signal_counter = 0
+
+        loop = self.loop
+        loop.register_signal_handler(MergeableSignalMock, self._handler_signal_counter)
+        loop.enqueue_signal(MergeableSignalMock())
+        loop.enqueue_signal(MergeableSignalMock())
+        loop.enqueue_signals([MergeableSignalMock(), MergeableSignalMock()])
+        loop.process_signals()
+        self.assertEqual(self.signal_counter, 1)
+
+        loop.enqueue_signal(MergeableSignalMock())
+        loop.process_signals()
+        self.assertEqual(self.signal_counter, 2)
+
+    def test_base_class_handler(self):
+        self.signal_counter = 0
+        self.signal_counter2 = 0
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_signal_counter)
+        loop.register_signal_handler(SubclassSignalMock, self._handler_signal_counter2)
+        loop.enqueue_signal(SubclassSignalMock())
+        loop.enqueue_signal(SignalMock())
+        loop.process_signals()
+
+        self.assertEqual(self.signal_counter, 2)
+        self.assertEqual(self.signal_counter2, 1)
+
+    def test_handler_registered_after_processing(self):
+        self.signal_counter = 0
+
+        loop = self.loop
+        loop.enqueue_signal(SubclassSignalMock())
+        loop.process_signals()
+
+        # cached handlers must be invalidated by the registration
+        loop.register_signal_handler(AbstractSignal, self._handler_signal_counter)
+        loop.enqueue_signal(SubclassSignalMock())
+        loop.process_signals()
+
+        self.assertEqual(self.signal_counter, 1)
+
+    def test_unregister_handler(self):
+        self.signal_counter = 0
+        self.signal_counter2 = 0
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_signal_counter)
+        handler = loop.register_signal_handler(SignalMock, self._handler_signal_counter2)
+        loop.enqueue_signal(SignalMock())
+        loop.process_signals()
+
+        self.assertTrue(loop.unregister_signal_handler(SignalMock, self._handler_signal_counter))
+        self.assertTrue(loop.unregister_signal_handler(SignalMock, handler))
+        self.assertFalse(loop.unregister_signal_handler(SignalMock, self._handler_signal_counter))
+
+        loop.enqueue_signal(SignalMock())
+        loop.process_signals()
+
+        self.assertEqual(self.signal_counter, 1)
+        self.assertEqual(self.signal_counter2, 1)
+
     def test_quit_callback(self):
         self.callback_called = False
         self.callback_args = None
@@ -239,6 +332,142 @@ class ProcessEvents_TestCase(unittest.TestCase):
 
         self.assertFalse(self.callback_called)
 
+    def test_call_later(self):
+        self.callback_called = False
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_callback)
+        start = loop.time()
+        loop.call_later(0.02, loop.enqueue_signal, SignalMock())
+        loop.process_signals(return_after=SignalMock)
+
+        self.assertTrue(self.callback_called)
+        self.assertGreaterEqual(loop.time() - start, 0.02)
+
+    def test_call_at_order(self):
+        calls = []
+
+        loop = self.loop
+        now = loop.time()
+        loop.call_at(now + 0.02, calls.append, 2)
+        loop.call_at(now + 0.01, calls.append, 1)
+        loop.call_at(now + 0.03, loop.enqueue_signal, SignalMock())
+        loop.process_signals(return_after=SignalMock)
+
+        self.assertEqual(calls, [1, 2])
+
+    def test_cancel_timer(self):
+        calls = []
+
+        loop = self.loop
+        handle = loop.call_later(0.01, calls.append, 1)
+        handle.cancel()
+        loop.call_later(0.02, loop.enqueue_signal, SignalMock())
+        loop.process_signals(return_after=SignalMock)
+
+        self.assertTrue(handle.cancelled)
+        self.assertEqual(calls, [])
+
+    def test_cancel_timer_expired_at_same_time(self):
+        calls = []
+
+        loop = self.loop
+        now = loop.time()
+        handles = []
+        loop.call_at(now + 0.01, self._timer_cancel_all, handles)
+        handles.append(loop.call_at(now + 0.01, calls.append, 1))
+        loop.call_at(now + 0.02, loop.enqueue_signal, SignalMock())
+        loop.process_signals(return_after=SignalMock)
+
+        self.assertEqual(calls, [])
+
+    def test_call_every(self):
+        self.signal_counter = 0
+
+        loop = self.loop
+        self.timer_handle = loop.call_every(0.005, self._timer_count_to_three)
+        loop.process_signals(return_after=SignalMock)
+
+        self.assertEqual(self.signal_counter, 3)
+        self.assertTrue(self.timer_handle.cancelled)
+
+        with self.assertRaises(ValueError):
+            loop.call_every(0, self._timer_count_to_three)
+
+    def test_timer_added_from_thread(self):
+        self.callback_called = False
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_callback)
+        # the loop is waiting without any timer when the timer is added
+        thread = threading.Timer(0.01, loop.call_later,
+                                 args=(0, loop.enqueue_signal, SignalMock()))
+        thread.start()
+        loop.process_signals(return_after=SignalMock)
+        thread.join()
+
+        self.assertTrue(self.callback_called)
+
+    def test_timer_exception(self):
+        self.callback_called = False
+
+        loop = self.loop
+        loop.register_signal_handler(ExceptionSignal, self._handler_callback)
+        loop.call_later(0, self._timer_raise_exception)
+        loop.process_signals(return_after=ExceptionSignal)
+
+        self.assertTrue(self.callback_called)
+
+    def test_timer_exit_main_loop(self):
+        self.callback_called = False
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_callback)
+        loop.call_later(0.01, self._timer_exit_main_loop)
+        loop.call_later(1, loop.enqueue_signal, SignalMock())
+        loop.run()
+
+        self.assertFalse(self.callback_called)
+
+    def test_timers_in_nested_loop(self):
+        calls = []
+
+        loop = self.loop
+        loop.register_signal_handler(SignalMock, self._handler_start_inner_loop_and_enqueue_event,
+                                     SignalMock2())
+        loop.register_signal_handler(SignalMock2, self._handler_add_timers_in_inner_loop, calls)
+        # the outer timer has to expire while the inner loop is running
+        loop.call_later(0.01, calls.append, "outer")
+        loop.enqueue_signal(SignalMock())
+        # the timer added in the inner loop has to survive closing of the inner loop
+        loop.process_signals(return_after=SignalMock3)
+
+        self.assertEqual(calls, ["outer", "inner closed"])
+
+    # TIMER CALLBACKS FOR TESTING
+    def _timer_count_to_three(self):
+        self.signal_counter += 1
+        if self.signal_counter == 3:
+            self.timer_handle.cancel()
+            self.loop.enqueue_signal(SignalMock())
+
+    def _timer_close_inner_loop(self, calls):
+        calls.append("inner closed")
+        self.loop.close_loop()
+
+    @staticmethod
+    def _timer_raise_exception():
+        raise ValueError("Timer failed")
+
+    @staticmethod
+    def _timer_exit_main_loop():
+        raise ExitMainLoop()
+
+    @staticmethod
+    def _timer_cancel_all(handles):
+        for handle in handles:
+            handle.cancel()
+
     # HANDLERS FOR TESTING
     def _handler_callback(self, signal, data):
         self.callback_called = True
@@ -266,6 +495,10 @@ class ProcessEvents_TestCase(unittest.TestCase):
     def _handler_start_inner_loop_and_enqueue_event(self, signal, data):
         self.loop.execute_new_loop(data)
 
+    def _handler_add_timers_in_inner_loop(self, signal, data):
+        self.loop.call_later(0.03, self._timer_close_inner_loop, data)
+        self.loop.call_later(0.05, self.loop.enqueue_signal, SignalMock3())
+
     @staticmethod
     def _handler_raise_ExitMainLoop_exception(signal, data):
         raise ExitMainLoop()
@@ -274,6 +507,38 @@ class ProcessEvents_TestCase(unittest.TestCase):
         self.loop.force_quit()
 
 
+class MainLoopBatch_TestCase(unittest.TestCase):
+
+    def test_batch_enqueued_at_once(self):
+        loop = MainLoop()
+
+        with mock.patch.object(EventQueue, "enqueue_signals") as enqueue_mock:
+            loop.enqueue_signals([SignalMock() for _i in range(100)])
+
+        enqueue_mock.assert_called_once()
+        self.assertEqual(len(enqueue_mock.call_args[0][0]), 100)
+
+    def test_batch_goes_to_source_queue(self):
+        # pylint: disable=protected-access
+        loop = MainLoop()
+        source = mock.Mock()
+        loop.register_signal_source(source)
+        outer_queue = loop._active_queue
+        # simulate inner loop
+        inner_queue = EventQueue()
+        loop._event_queues.append(inner_queue)
+        loop._active_queue = inner_queue
+
+        signal_outer = SourceSignalMock(source)
+        signal_inner = SourceSignalMock(None)
+        loop.enqueue_signals([signal_outer, signal_inner])
+
+        self.assertIs(outer_queue.get(), signal_outer)
+        self.assertIs(inner_queue.get(), signal_inner)
+        self.assertTrue(outer_queue.empty())
+        self.assertTrue(inner_queue.empty())
+
+
 # TESTING EVENTS
 class SignalMock(AbstractSignal):
 
@@ -282,6 +547,10 @@ class SignalMock(AbstractSignal):
         super().__init__(None)
 
 
+class SubclassSignalMock(SignalMock):
+    pass
+
+
 class SignalMock2(AbstractSignal):
 
     def __init__(self):
@@ -296,6 +565,19 @@ class SignalMock3(AbstractSignal):
         super().__init__(None)
 
 
+class MergeableSignalMock(AbstractSignal):
+
+    mergeable = True
+
+    def __init__(self):
+        # ignore source
+        super().__init__(None)
+
+
+class SourceSignalMock(AbstractSignal):
+    pass
+
+
 class PrioritySignalMock(AbstractSignal):
 
     def __init__(self):
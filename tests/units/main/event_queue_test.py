@@ -19,6 +19,7 @@
 #
 
 
+import threading
 import unittest
 
 from unittest.mock import MagicMock
@@ -61,6 +62,110 @@ class EventQueue_TestCase(unittest.TestCase):
         self.assertEqual(signal_high_priority, self.e.get())
         self.assertEqual(signal_low_priority, self.e.get())
 
+    def test_enqueue_same_priority_is_fifo(self):
+        signals = [SignalMock(priority=10) for _i in range(20)]
+
+        for s in signals:
+            self.e.enqueue(s)
+
+        # signals are equal when they have the same priority so compare identity
+        for s in signals:
+            self.assertIs(s, self.e.get())
+
+    def test_peek(self):
+        self.assertIsNone(self.e.peek())
+
+        signal_low_priority = SignalMock(priority=10)
+        signal_high_priority = SignalMock(priority=0)
+        self.e.enqueue(signal_low_priority)
+        self.e.enqueue(signal_high_priority)
+
+        self.assertEqual(signal_high_priority, self.e.peek())
+        # peek must not remove the signal
+        self.assertEqual(signal_high_priority, self.e.get())
+        self.assertEqual(signal_low_priority, self.e.peek())
+
+    def test_get_with_timeout(self):
+        self.assertIsNone(self.e.get(timeout=0.01))
+        self.assertIsNone(self.e.get(timeout=0))
+
+        signal = SignalMock()
+        self.e.enqueue(signal)
+        self.assertIs(self.e.get(timeout=0), signal)
+
+    def test_wake_up(self):
+        # wake up before waiting is not lost
+        self.e.wake_up()
+        self.assertIsNone(self.e.get())
+
+        timer = threading.Timer(0.01, self.e.wake_up)
+        timer.start()
+        self.assertIsNone(self.e.get(timeout=10))
+        timer.join()
+
+    def test_get_top_event_if_priority(self):
+        signal_low_priority = SignalMock(priority=10)
+        signal_high_priority = SignalMock(priority=0)
+        self.e.enqueue(signal_low_priority)
+        self.e.enqueue(signal_high_priority)
+
+        self.assertIsNone(self.e.get_top_event_if_priority(10))
+        self.assertEqual(signal_high_priority, self.e.get_top_event_if_priority(0))
+        self.assertEqual(signal_low_priority, self.e.get_top_event_if_priority(10))
+
+        # does not wait on empty queue
+        self.assertIsNone(self.e.get_top_event_if_priority(10))
+
+    def test_enqueue_signals(self):
+        signals = [SignalMock(priority=10), SignalMock(priority=0), SignalMock(priority=10)]
+
+        self.e.enqueue_signals(signals)
+
+        self.assertIs(signals[1], self.e.get())
+        self.assertIs(signals[0], self.e.get())
+        self.assertIs(signals[2], self.e.get())
+        self.assertTrue(self.e.empty())
+
+    def test_contained_sources(self):
+        source = MagicMock()
+        source2 = MagicMock()
+        self.e.add_source(source)
+
+        self.assertEqual(self.e.contained_sources([source, source2]), {source})
+        self.assertEqual(self.e.contained_sources([source2]), set())
+
+    def test_mergeable_signals(self):
+        source = MagicMock()
+        first = MergeableSignalMock(source)
+
+        self.e.enqueue(first)
+        self.e.enqueue(MergeableSignalMock(source))
+        self.e.enqueue_signals([MergeableSignalMock(source), MergeableSignalMock(source)])
+
+        self.assertIs(first, self.e.get())
+        self.assertTrue(self.e.empty())
+
+        # signal is not waiting anymore so a new one can be enqueued
+        second = MergeableSignalMock(source)
+        self.e.enqueue(second)
+        self.assertIs(second, self.e.get_top_event_if_priority(20))
+
+    def test_mergeable_signals_different_source(self):
+        self.e.enqueue(MergeableSignalMock(MagicMock()))
+        self.e.enqueue(MergeableSignalMock(MagicMock()))
+
+        self.e.get()
+        self.assertFalse(self.e.empty())
+
+    def test_not_mergeable_signals(self):
+        source = MagicMock()
+
+        self.e.enqueue(SignalMock(source))
+        self.e.enqueue(SignalMock(source))
+
+        self.e.get()
+        self.assertFalse(self.e.empty())
+
     def test_adding_event_source(self):
         fake_source = MagicMock()
         self.e.add_source(fake_source)
@@ -103,3 +208,8 @@ class SignalMock(AbstractSignal):
 
     def __init__(self, source=None, priority=20):  # pylint: disable=useless-super-delegation
         super().__init__(source, priority)
+
+
+class MergeableSignalMock(SignalMock):
+
+    mergeable = True
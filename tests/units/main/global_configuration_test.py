@@ -24,6 +24,7 @@ from unittest.mock import MagicMock
 
 from simpleline import App
 from simpleline.global_configuration import DEFAULT_WIDTH, DEFAULT_PASSWORD_FUNC
+from simpleline.render.output_sinks import TTYOutputSink, MemoryOutputSink
 
 
 class GlobalConfiguration_TestCase(unittest.TestCase):
@@ -85,3 +86,27 @@ class GlobalConfiguration_TestCase(unittest.TestCase):
 
         App.get_configuration().clear_password_function()
         self._check_default_password_function()
+
+    def test_differential_output(self):
+        self.assertFalse(App.get_configuration().differential_output)
+        self.assertFalse(App.get_configuration().terminal_supports_ansi)
+
+        App.get_configuration().differential_output = True
+        App.get_configuration().terminal_supports_ansi = True
+        self.assertTrue(App.get_configuration().differential_output)
+        self.assertTrue(App.get_configuration().terminal_supports_ansi)
+
+        App.get_configuration().clear_differential_output()
+        App.get_configuration().clear_terminal_supports_ansi()
+        self.assertFalse(App.get_configuration().differential_output)
+        self.assertFalse(App.get_configuration().terminal_supports_ansi)
+
+    def test_output_sink(self):
+        self.assertIsInstance(App.get_configuration().output_sink, TTYOutputSink)
+
+        sink = MemoryOutputSink()
+        App.get_configuration().output_sink = sink
+        self.assertIs(App.get_configuration().output_sink, sink)
+
+        App.get_configuration().clear_output_sink()
+        self.assertIsInstance(App.get_configuration().output_sink, TTYOutputSink)
@@ -19,7 +19,9 @@
 #
 
 
+import gc
 import unittest
+import weakref
 
 from unittest.mock import Mock, patch
 from threading import Barrier, current_thread, Event
@@ -28,7 +30,9 @@ from io import StringIO
 
 from simpleline import App
 from simpleline.event_loop.main_loop import MainLoop
+from simpleline.event_loop.signals import InputReadySignal, InputReceivedSignal
 from simpleline.input.input_handler import InputHandler, PasswordInputHandler
+from simpleline.input.input_threading import InputThreadManager, SingleThreadInputReader
 from simpleline.render.prompt import Prompt
 
 
@@ -59,6 +63,9 @@ class InputHandler_TestCase(unittest.TestCase):
         super().tearDown()
         self._thread_event_wait_for_outer.set()
 
+        # end the input thread after it serves the actual request
+        InputThreadManager.get_instance().reader.close()
+
         for t in self._threads:
             t.join()
 
@@ -88,6 +95,126 @@ class InputHandler_TestCase(unittest.TestCase):
 
         self.assertTrue(h.input_received())
 
+    def test_failed_input(self, input_mock, output_mock):
+        input_mock.side_effect = [RuntimeError("broken input"), "a"]
+
+        with self.assertLogs("simpleline", level="ERROR"):
+            h = InputHandler()
+            h.get_input(Prompt(message="ABC"))
+            h.wait_on_input()
+
+        self.assertTrue(h.input_received())
+        self.assertFalse(h.input_successful())
+
+        # the input thread is still serving requests
+        h.get_input(Prompt(message="ABC"))
+        h.wait_on_input()
+
+        self.assertTrue(h.input_successful())
+        self.assertEqual(h.value, "a")
+
+    def test_input_timeout(self, input_mock, output_mock):
+        input_mock.side_effect = self._blocking_input
+
+        h = InputHandler()
+        h.get_input(Prompt(message="ABC"), timeout=0.01, default="d")
+        h.wait_on_input()
+
+        self.assertTrue(h.input_successful())
+        self.assertTrue(h.input_timed_out())
+        self.assertEqual(h.value, "d")
+        self.assertTrue(output_mock.getvalue().endswith("\n"))
+
+    def test_input_before_timeout(self, input_mock, output_mock):
+        input_mock.return_value = 'a'
+
+        h = InputHandler()
+        h.get_input(Prompt(message="ABC"), timeout=10, default="d")
+        h.wait_on_input()
+
+        self.assertFalse(h.input_timed_out())
+        self.assertEqual(h.value, "a")
+
+    def test_late_input_dropped(self, input_mock, output_mock):
+        input_mock.side_effect = self._blocking_input
+
+        h = InputHandler()
+        h.get_input(Prompt(message="ABC"), timeout=0.01, default="d")
+        h.wait_on_input()
+
+        # the user answers the old prompt after the timeout
+        self._thread_event_wait_for_outer.set()
+        App.get_event_loop().process_signals(return_after=InputReceivedSignal)
+
+        self.assertEqual(h.value, "d")
+
+    def test_late_input_answers_next_prompt(self, input_mock, output_mock):
+        input_mock.side_effect = self._blocking_input
+
+        h = InputHandler()
+        h.get_input(Prompt(message="ABC"), timeout=0.01, default="d")
+        h.wait_on_input()
+
+        # the thread is still reading, the prompt is printed without it
+        h2 = InputHandler()
+        h2.get_input(Prompt(message="DEF"), timeout=10, default="d2")
+        self.assertIn("DEF", output_mock.getvalue())
+
+        # the user answers the prompt shown now
+        self._thread_event_wait_for_outer.set()
+        h2.wait_on_input()
+
+        self.assertEqual(h.value, "d")
+        self.assertFalse(h2.input_timed_out())
+        self.assertEqual(h2.value, "late")
+
+        # the reader is used for the next prompts again
+        input_mock.side_effect = None
+        input_mock.return_value = "a"
+        h2.get_input(Prompt(message="GHI"))
+        h2.wait_on_input()
+
+        self.assertEqual(h2.value, "a")
+
+    def test_late_input_not_used_for_password(self, input_mock, output_mock):
+        input_mock.side_effect = self._blocking_input
+
+        h = InputHandler()
+        h.get_input(Prompt(message="ABC"), timeout=0.01, default="d")
+        h.wait_on_input()
+
+        pass_mock = Mock(return_value="secret")
+        h2 = PasswordInputHandler()
+        h2.set_pass_func(pass_mock)
+        h2.get_input(Prompt(message="DEF"))
+        self.assertNotIn("DEF", output_mock.getvalue())
+
+        # the line typed after the timeout is dropped and the password is read
+        self._thread_event_wait_for_outer.set()
+        h2.wait_on_input()
+
+        pass_mock.assert_called_once()
+        self.assertEqual(h2.value, "secret")
+
+    def test_late_input_with_timed_out_next_prompt(self, input_mock, output_mock):
+        input_mock.side_effect = self._blocking_input
+
+        h = InputHandler()
+        h.get_input(Prompt(message="ABC"), timeout=0.01, default="d")
+        h.wait_on_input()
+
+        h2 = InputHandler()
+        h2.get_input(Prompt(message="DEF"), timeout=0.01, default="d2")
+        h2.wait_on_input()
+        self.assertEqual(h2.value, "d2")
+
+        h3 = InputHandler()
+        h3.get_input(Prompt(message="GHI"))
+        self._thread_event_wait_for_outer.set()
+        h3.wait_on_input()
+
+        self.assertEqual(h3.value, "late")
+
     def test_input_callback(self, input_mock, output_mock):
         input_value = 'abc'
         input_mock.return_value = input_value
@@ -184,6 +311,10 @@ class InputHandler_TestCase(unittest.TestCase):
         self._thread_event_wait_for_outer.wait()
         return ret
 
+    def _blocking_input(self):
+        self._thread_event_wait_for_outer.wait()
+        return "late"
+
     def _test_callback(self, user_input):
         self._callback_called = True
         self._callback_input = user_input
@@ -193,6 +324,82 @@ class InputHandler_TestCase(unittest.TestCase):
         self._callback_input2 = user_input
 
 
+class SingleThreadInputReader_TestCase(unittest.TestCase):
+
+    def test_requests_served_by_one_thread(self):
+        reader = SingleThreadInputReader()
+        threads = []
+        served = Event()
+
+        def run():
+            threads.append(current_thread())
+            if len(threads) == 3:
+                served.set()
+
+        requests = [Mock(run=run) for _i in range(3)]
+        for r in requests:
+            reader.start(r)
+
+        self.assertTrue(served.wait(timeout=3))
+        reader.close()
+        threads[0].join(timeout=3)
+
+        self.assertEqual(len(set(threads)), 1)
+        self.assertNotEqual(threads[0], current_thread())
+        self.assertFalse(threads[0].is_alive())
+
+
+    def test_thread_survives_failed_request(self):
+        reader = SingleThreadInputReader()
+        served = Event()
+
+        with self.assertLogs("simpleline", level="ERROR"):
+            reader.start(Mock(run=Mock(side_effect=RuntimeError("broken request"))))
+            reader.start(Mock(run=served.set))
+
+            self.assertTrue(served.wait(timeout=3))
+
+        reader.close()
+
+
+class InputReadyRouting_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        App.initialize(event_loop=MainLoop())
+
+    def _input_ready_handlers(self):
+        loop = App.get_event_loop()
+        return loop._get_handlers(InputReadySignal)  # pylint: disable=protected-access
+
+    def test_handlers_not_accumulated(self):
+        handlers = [InputHandler() for _i in range(100)]
+
+        self.assertEqual(len(self._input_ready_handlers()), 1)
+        self.assertEqual(len(handlers), 100)
+
+    def test_signal_routed_to_input_handler(self):
+        h = InputHandler()
+        h2 = InputHandler()
+
+        signal = InputReadySignal(source=h, input_handler_source=h, data="a")
+        App.get_event_loop().enqueue_signal(signal)
+        App.get_event_loop().process_signals()
+
+        self.assertTrue(h.input_received())
+        self.assertEqual(h.value, "a")
+        self.assertFalse(h2.input_received())
+
+    def test_input_handler_referenced_weakly(self):
+        h = InputHandler()
+        ref = weakref.ref(h)
+
+        del h
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+
 @patch('sys.stdout', new_callable=StringIO)
 @patch('simpleline.global_configuration.GlobalConfiguration.password_function')
 class PasswordInputHandler_TestCase(unittest.TestCase):
@@ -0,0 +1,163 @@
+# Render instrumentation test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import unittest
+from io import StringIO
+from unittest import mock
+
+from simpleline import App
+from simpleline.render.containers import ListRowContainer
+from simpleline.render.instrumentation import RenderInstrumentation, RenderHistogramObserver, \
+    AbstractRenderObserver, Histogram, RenderPhase, DISABLED_FRAME
+from simpleline.render.prompt import Prompt
+from simpleline.render.screen import UIScreen
+from simpleline.render.widgets import TextWidget
+
+
+class Histogram_TestCase(unittest.TestCase):
+
+    def test_empty(self):
+        h = Histogram()
+
+        self.assertEqual(h.count, 0)
+        self.assertIsNone(h.mean)
+        self.assertEqual(h.buckets, [])
+
+    def test_values(self):
+        h = Histogram()
+        for value in (0.5, 1, 3, 4, 100):
+            h.add(value)
+
+        self.assertEqual(h.count, 5)
+        self.assertEqual(h.min, 0.5)
+        self.assertEqual(h.max, 100)
+        self.assertAlmostEqual(h.mean, 108.5 / 5)
+        self.assertEqual(h.buckets, [(1, 2), (4, 2), (128, 1)])
+
+
+class RenderInstrumentation_TestCase(unittest.TestCase):
+
+    def test_disabled(self):
+        instrumentation = RenderInstrumentation()
+
+        self.assertFalse(instrumentation.enabled)
+        frame = instrumentation.begin_frame(object())
+        self.assertIs(frame, DISABLED_FRAME)
+        self.assertIs(instrumentation.frame, DISABLED_FRAME)
+
+        # nothing happens
+        frame.mark(RenderPhase.SETUP)
+        frame.window = TextWidget("Window")
+        instrumentation.end_frame(frame)
+
+    def test_frame(self):
+        instrumentation = RenderInstrumentation()
+        observer = mock.Mock(spec=AbstractRenderObserver)
+        instrumentation.add_observer(observer)
+        screen = object()
+
+        frame = instrumentation.begin_frame(screen)
+        self.assertIs(instrumentation.frame, frame)
+        frame.mark(RenderPhase.RENDER)
+        frame.mark(RenderPhase.RENDER)
+        instrumentation.end_frame(frame)
+
+        self.assertIs(instrumentation.frame, DISABLED_FRAME)
+        observer.frame_drawn.assert_called_once_with(frame)
+        self.assertEqual(list(frame.timings.keys()), [RenderPhase.RENDER])
+        self.assertIs(frame.screen, screen)
+        # no window was rendered
+        self.assertEqual(frame.line_count, 0)
+        self.assertEqual(frame.widget_count, 0)
+
+    def test_input_wait(self):
+        instrumentation = RenderInstrumentation()
+        observer = mock.Mock(spec=AbstractRenderObserver)
+        screen = object()
+
+        # not measured without observer
+        instrumentation.input_started(screen)
+        instrumentation.add_observer(observer)
+        instrumentation.input_finished(screen)
+        observer.input_received.assert_not_called()
+
+        instrumentation.input_started(screen)
+        instrumentation.input_finished(screen)
+        observer.input_received.assert_called_once_with(screen, mock.ANY)
+
+    def test_remove_observer(self):
+        instrumentation = RenderInstrumentation()
+        observer = RenderHistogramObserver()
+        instrumentation.add_observer(observer)
+
+        self.assertTrue(instrumentation.remove_observer(observer))
+        self.assertFalse(instrumentation.remove_observer(observer))
+        self.assertFalse(instrumentation.enabled)
+
+
+@mock.patch('simpleline.input.input_handler.InputHandlerRequest._get_input')
+@mock.patch('sys.stdout', new_callable=StringIO)
+class ScreenInstrumentation_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        App.initialize()
+        self.observer = RenderHistogramObserver()
+        App.get_scheduler().instrumentation.add_observer(self.observer)
+
+    def tearDown(self):
+        App.initialize()
+
+    def _get(self, key):
+        return self.observer.get_histogram("ListScreen", key)
+
+    def test_phases(self, _, in_mock):
+        in_mock.return_value = Prompt.CONTINUE
+        App.get_scheduler().schedule_screen(ListScreen())
+        App.run()
+
+        for phase in RenderPhase:
+            self.assertEqual(self._get(phase).count, 1, phase)
+
+        # window, list container and its 3 items
+        self.assertEqual(self._get("widgets").min, 5)
+        self.assertEqual(self._get("lines").min, 3)
+
+    def test_more_frames(self, _, in_mock):
+        in_mock.side_effect = [Prompt.REFRESH, Prompt.CONTINUE]
+        App.get_scheduler().schedule_screen(ListScreen())
+        App.run()
+
+        self.assertEqual(self._get(RenderPhase.SETUP).count, 1)
+        self.assertEqual(self._get(RenderPhase.REFRESH).count, 2)
+        self.assertEqual(self._get(RenderPhase.INPUT_WAIT).count, 2)
+
+        self.observer.clear()
+        self.assertEqual(self.observer.histograms, {})
+
+
+class ListScreen(UIScreen):
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        container = ListRowContainer(1)
+        for i in range(3):
+            container.add(TextWidget("Item {}".format(i)))
+
+        self.window.add(container)
@@ -0,0 +1,228 @@
+# Output sinks test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+import tempfile
+import threading
+import unittest
+from io import StringIO
+from unittest import mock
+
+from simpleline import App
+from simpleline.render.output_sinks import TTYOutputSink, MemoryOutputSink, FileOutputSink
+from simpleline.render.screen import UIScreen
+from simpleline.render.widgets import TextWidget
+
+from .. import UtilityMixin
+
+
+class TTYOutputSink_TestCase(unittest.TestCase):
+
+    def test_frame_written_at_once(self):
+        stream = mock.MagicMock()
+        sink = TTYOutputSink(stream)
+
+        sink.begin_frame()
+        sink.write("a\n")
+        sink.write("b\n")
+        stream.write.assert_not_called()
+
+        self.assertEqual(sink.end_frame(), "a\nb\n")
+        stream.write.assert_called_once_with("a\nb\n")
+        stream.flush.assert_called_once()
+        self.assertFalse(sink.frame_started)
+
+    def test_write_outside_of_frame(self):
+        stream = StringIO()
+        sink = TTYOutputSink(stream)
+
+        sink.write("prompt: ")
+        self.assertEqual(stream.getvalue(), "prompt: ")
+
+    def test_write_from_other_thread(self):
+        stream = StringIO()
+        sink = TTYOutputSink(stream)
+
+        sink.begin_frame()
+        sink.write("frame\n")
+        thread = threading.Thread(target=sink.write, args=("prompt: ",))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(stream.getvalue(), "prompt: ")
+        sink.end_frame()
+        self.assertEqual(stream.getvalue(), "prompt: frame\n")
+
+    def test_capture(self):
+        stream = StringIO()
+        sink = TTYOutputSink(stream)
+
+        sink.begin_capture()
+        sink.write("page\n")
+        sink.begin_frame()
+        sink.write("frame\n")
+        sink.begin_capture()
+        sink.write("inner\n")
+        self.assertEqual(sink.end_capture(), "inner\n")
+        thread = threading.Thread(target=sink.write, args=("prompt: ",))
+        thread.start()
+        thread.join()
+        sink.end_frame()
+
+        self.assertEqual(sink.end_capture(), "page\nframe\ninner\n")
+        self.assertEqual(stream.getvalue(), "page\nprompt: frame\ninner\n")
+
+    @mock.patch('sys.stdout', new_callable=StringIO)
+    def test_default_stream(self, stdout_mock):
+        sink = TTYOutputSink()
+
+        sink.write("text")
+        self.assertEqual(stdout_mock.getvalue(), "text")
+
+
+class MemoryOutputSink_TestCase(unittest.TestCase):
+
+    def test_frames(self):
+        sink = MemoryOutputSink()
+
+        sink.begin_frame()
+        sink.write("first\n")
+        sink.end_frame()
+        sink.write("prompt: ")
+        sink.begin_frame()
+        sink.write("second\n")
+        sink.flush_frame()
+
+        self.assertEqual(sink.frames, ["first\n", "second\n"])
+        self.assertEqual(sink.getvalue(), "first\nprompt: second\n")
+
+    def test_empty_frame(self):
+        sink = MemoryOutputSink()
+
+        sink.begin_frame()
+        self.assertEqual(sink.end_frame(), "")
+        self.assertEqual(sink.frames, [])
+
+    def test_clear(self):
+        sink = MemoryOutputSink()
+        sink.begin_frame()
+        sink.write("text")
+        sink.end_frame()
+
+        sink.clear()
+        self.assertEqual(sink.frames, [])
+        self.assertEqual(sink.getvalue(), "")
+
+
+class FileOutputSink_TestCase(unittest.TestCase):
+
+    def test_file_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "output.txt")
+            sink = FileOutputSink(path)
+            sink.begin_frame()
+            sink.write("line\n")
+            sink.end_frame()
+            sink.close()
+
+            with open(path, "rt", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "line\n")
+
+    def test_file_object(self):
+        stream = StringIO()
+        sink = FileOutputSink(stream)
+
+        sink.write("line\n")
+        sink.close()
+
+        self.assertFalse(stream.closed)
+        self.assertEqual(stream.getvalue(), "line\n")
+
+
+class OutputSinkScreen_TestCase(unittest.TestCase, UtilityMixin):
+
+    def setUp(self):
+        App.initialize()
+        self.sink = MemoryOutputSink()
+        App.get_configuration().output_sink = self.sink
+
+    def tearDown(self):
+        App.initialize()
+
+    @mock.patch('sys.stdout', new_callable=StringIO)
+    def test_screen_written_to_sink(self, stdout_mock):
+        App.get_scheduler().schedule_screen(TextScreen())
+        App.run()
+
+        expected = self.calculate_separator() + "Hello\n"
+        self.assertEqual(self.sink.frames, [expected])
+        self.assertEqual(stdout_mock.getvalue(), "")
+
+    @mock.patch('sys.stdout', new_callable=StringIO)
+    def test_differential_output_written_to_sink(self, stdout_mock):
+        App.get_configuration().differential_output = True
+        App.get_scheduler().schedule_screen(TextScreen())
+        App.run()
+
+        self.assertEqual(self.sink.getvalue(), self.calculate_separator() + "Hello\n")
+        self.assertEqual(stdout_mock.getvalue(), "")
+
+
+    @mock.patch('sys.stdout', new_callable=StringIO)
+    def test_screen_print_kept_in_order(self, stdout_mock):
+        App.get_configuration().output_sink = TTYOutputSink()
+        App.get_scheduler().schedule_screen(PrintingScreen())
+        App.run()
+
+        expected = self.calculate_separator() + "Before\nHello\nAfter\n"
+        self.assertEqual(stdout_mock.getvalue(), expected)
+
+    @mock.patch('sys.stdout', new_callable=StringIO)
+    def test_screen_print_with_differential_output(self, stdout_mock):
+        App.get_configuration().differential_output = True
+        App.get_scheduler().schedule_screen(PrintingScreen())
+        App.run()
+
+        expected = self.calculate_separator() + "Before\nHello\nAfter\n"
+        self.assertEqual(self.sink.frames, [expected])
+        self.assertEqual(stdout_mock.getvalue(), "")
+
+
+class TextScreen(UIScreen):
+
+    def __init__(self):
+        super().__init__()
+        self.input_required = False
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        self.window.add(TextWidget("Hello"))
+
+    def show_all(self):
+        super().show_all()
+        self.close()
+
+
+class PrintingScreen(TextScreen):
+
+    def show_all(self):
+        print("Before")
+        super().show_all()
+        print("After")
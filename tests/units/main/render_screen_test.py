@@ -19,6 +19,7 @@
 #
 
 
+import threading
 import unittest
 from io import StringIO
 from unittest import mock
@@ -188,6 +189,15 @@ class InputProcessing_TestCase(unittest.TestCase):
 
     def setUp(self):
         App.initialize()
+        self._input_released = threading.Event()
+
+    def tearDown(self):
+        # unblock the reader thread of timed out inputs
+        self._input_released.set()
+
+    def _blocking_input(self):
+        self._input_released.wait(5)
+        return "late"
 
     def test_basic_input(self, input_mock, mock_stdout):
         input_mock.return_value = "a"
@@ -216,6 +226,17 @@ class InputProcessing_TestCase(unittest.TestCase):
 
         self.assertTrue(screen.input_processed)
 
+    def test_input_timeout(self, input_mock, mock_stdout):
+        input_mock.side_effect = self._blocking_input
+        screen = InputScreenMock()
+        screen.input_timeout = 0.01
+        screen.default_input = "a"
+
+        App.get_scheduler().schedule_screen(screen)
+        App.run()
+
+        self.assertTrue(screen.input_processed)
+
     def test_quit_input(self, mock_stdin, mock_stdout):
         mock_stdin.return_value = "q"
         screen = UIScreen()
@@ -314,6 +335,15 @@ class InputProcessing_TestCase(unittest.TestCase):
         out = out.split("\n")[-1].strip()
         self.assertEqual(out, prompt_message)
 
+    def test_blocking_input_timeout(self, mock_stdin, mock_stdout):
+        mock_stdin.side_effect = self._blocking_input
+        screen = BlockingInputTestScreenMock("test prompt", False, timeout=0.01, default="yes")
+
+        App.get_scheduler().schedule_screen(screen)
+        App.run()
+
+        self.assertEqual(screen.input_returned, "yes")
+
     @mock.patch('simpleline.global_configuration.GlobalConfiguration.password_function')
     def test_blocking_password_input(self, mock_getpass, mock_stdin, mock_stdout):
         prompt_message = "test prompt"
@@ -545,14 +575,17 @@ class ExceptionTestScreenMock(UIScreen):
 
 class BlockingInputTestScreenMock(EmptyScreenMock):
 
-    def __init__(self, prompt_message, hidden):
+    def __init__(self, prompt_message, hidden, timeout=None, default=""):
         super().__init__()
         self._prompt_message = prompt_message
         self._hidden = hidden
+        self._timeout = timeout
+        self._default = default
         self.input_returned = None
 
     def show_all(self):
-        self.input_returned = self.get_user_input(self._prompt_message, self._hidden)
+        self.input_returned = self.get_user_input(self._prompt_message, self._hidden,
+                                                  self._timeout, self._default)
         super().show_all()
 
 
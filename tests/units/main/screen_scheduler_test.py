@@ -23,8 +23,13 @@ import unittest
 from io import StringIO
 from unittest import mock
 
+from simpleline import App
+from simpleline.render import ModalResultNotReadyError
+from simpleline.render.adv_widgets import YesNoDialog
+from simpleline.render.prompt import Prompt
 from simpleline.render.screen import UIScreen
 from simpleline.render.screen_handler import ScreenHandler
+from simpleline.render.screen_scheduler import ModalResult
 
 from .. import UtilityMixin
 
@@ -109,6 +114,177 @@ class ScreenScheduler_TestCase(unittest.TestCase, UtilityMixin):
         self.assertEqual(self.create_output_with_separators(expected), mock_stdout.getvalue())
 
 
+@mock.patch('sys.stdout', new_callable=StringIO)
+class AsyncModalScreen_TestCase(unittest.TestCase, UtilityMixin):
+
+    def test_result_returned_immediately(self, _):
+        modal_screen = AnswerScreen("answer")
+        screen = AsyncModalParentScreen(modal_screen)
+
+        self.schedule_screen_and_run(screen)
+
+        self.assertFalse(screen.done_after_push)
+        self.assertEqual(screen.answers, ["answer"])
+        # the parent is shown again after the modal screen was closed
+        self.assertEqual(screen.counter, 2)
+
+    def test_deep_modal_chain(self, _):
+        # deeper than the recursion limit would allow for nested loops
+        depth = 1500
+        screen = ChainScreen(depth)
+
+        self.schedule_screen_and_run(screen)
+
+        self.assertEqual(ChainScreen.closed_count, depth + 1)
+
+    def test_replace_modal_screen(self, _):
+        replacement = AnswerScreen("replaced")
+        modal_screen = AnswerScreen("original", replace_with=replacement)
+        screen = AsyncModalParentScreen(modal_screen)
+
+        self.schedule_screen_and_run(screen)
+
+        self.assertEqual(screen.answers, ["replaced"])
+
+    @mock.patch('simpleline.input.input_handler.InputHandlerRequest._get_input')
+    def test_quit_screen_declined(self, in_mock, _):
+        in_mock.side_effect = [Prompt.QUIT, "no", Prompt.CONTINUE]
+        screen = InputCounterScreen()
+
+        App.initialize()
+        App.get_scheduler().quit_screen = YesNoDialog("Quit?")
+        App.get_scheduler().schedule_screen(screen)
+        App.run()
+
+        self.assertEqual(screen.counter, 2)
+        self.assertTrue(screen.closed_called)
+
+    @mock.patch('simpleline.input.input_handler.InputHandlerRequest._get_input')
+    def test_quit_screen_accepted(self, in_mock, _):
+        in_mock.side_effect = [Prompt.QUIT, "yes"]
+        screen = InputCounterScreen()
+
+        App.initialize()
+        App.get_scheduler().quit_screen = YesNoDialog("Quit?")
+        App.get_scheduler().schedule_screen(screen)
+        App.run()
+
+        self.assertEqual(screen.counter, 1)
+        self.assertFalse(screen.closed_called)
+
+
+class ModalResult_TestCase(unittest.TestCase):
+
+    def test_not_ready(self):
+        result = ModalResult(AnswerScreen("answer"))
+
+        self.assertFalse(result.done())
+        with self.assertRaises(ModalResultNotReadyError):
+            result.result()
+
+    def test_resolve(self):
+        results = []
+        result = ModalResult(AnswerScreen("answer"))
+        result.add_done_callback(lambda r: results.append(r.result()))
+
+        result.resolve()
+        result.resolve()
+        self.assertTrue(result.done())
+        self.assertEqual(results, ["answer"])
+
+        # already resolved
+        result.add_done_callback(lambda r: results.append(r.result()))
+        self.assertEqual(results, ["answer", "answer"])
+
+    def test_screen_without_answer(self):
+        result = ModalResult(UIScreen())
+        result.resolve()
+
+        self.assertIsNone(result.result())
+
+
+class AnswerScreen(UIScreen):
+
+    def __init__(self, answer, replace_with=None):
+        super().__init__()
+        self.answer = answer
+        self._replace_with = replace_with
+        self.input_required = False
+
+    def show_all(self):
+        super().show_all()
+        if self._replace_with is not None:
+            ScreenHandler.replace_screen(self._replace_with)
+        else:
+            self.close()
+
+
+class AsyncModalParentScreen(UIScreen):
+
+    def __init__(self, modal_screen):
+        super().__init__()
+        self._modal_screen = modal_screen
+        self.input_required = False
+        self.counter = 0
+        self.answers = []
+        self.done_after_push = None
+
+    def show_all(self):
+        super().show_all()
+        self.counter += 1
+
+        if self._modal_screen is not None:
+            result = ScreenHandler.push_screen_modal_async(self._modal_screen)
+            self.done_after_push = result.done()
+            result.add_done_callback(lambda r: self.answers.append(r.result()))
+            self._modal_screen = None
+        else:
+            self.close()
+
+
+class ChainScreen(UIScreen):
+
+    closed_count = 0
+
+    def __init__(self, depth):
+        super().__init__()
+        self._depth = depth
+        self._pushed = False
+        self.input_required = False
+        ChainScreen.closed_count = 0
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        if self._depth > 0 and not self._pushed:
+            self._pushed = True
+            result = ScreenHandler.push_screen_modal_async(ChainScreen(self._depth - 1))
+            result.add_done_callback(self._child_closed)
+        else:
+            self.close()
+
+    def _child_closed(self, result):
+        ChainScreen.closed_count += 1
+
+    def closed(self):
+        if self._depth == 0:
+            ChainScreen.closed_count += 1
+
+
+class InputCounterScreen(UIScreen):
+
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.closed_called = False
+
+    def show_all(self):
+        super().show_all()
+        self.counter += 1
+
+    def closed(self):
+        self.closed_called = True
+
+
 class ShowedCounterScreen(UIScreen):
 
     def __init__(self, switch_to_screen=None, replace_screen=None):
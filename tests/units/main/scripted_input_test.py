@@ -0,0 +1,183 @@
+# Scripted input reader test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import gzip
+import os
+import tempfile
+import threading
+import unittest
+
+from unittest.mock import Mock
+
+from simpleline import App
+from simpleline.input.input_threading import InputThreadManager
+from simpleline.input.scripted_input import ScriptedInputReader
+from simpleline.render.output_sinks import MemoryOutputSink
+from simpleline.render.screen import UIScreen, InputState
+from simpleline.render.session_recorder import SessionRecorder
+
+
+class ScriptedInputReader_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        App.initialize()
+        self.sink = MemoryOutputSink()
+        App.get_configuration().output_sink = self.sink
+
+    def tearDown(self):
+        App.initialize()
+
+    def _run(self, reader, *screens):
+        InputThreadManager.get_instance().reader = reader
+        for screen in screens:
+            App.get_scheduler().schedule_screen(screen)
+
+        App.run()
+
+    def test_answers(self):
+        screen = CountingScreen()
+        reader = ScriptedInputReader(["a", "b", "c"])
+
+        self._run(reader, screen)
+
+        self.assertEqual(screen.inputs, ["a", "b", "c"])
+        self.assertEqual(reader.stats.screen_count, 3)
+        self.assertEqual(reader.stats.screen_times["CountingScreen"].count, 3)
+        self.assertGreater(reader.stats.screens_per_second, 0)
+
+    def test_echo(self):
+        self._run(ScriptedInputReader(["c"]), UIScreen())
+
+        self.assertIn("'c' to continue", self.sink.getvalue())
+        self.assertTrue(self.sink.getvalue().endswith(": c\n"))
+
+    def test_no_echo(self):
+        self._run(ScriptedInputReader(["c"], echo=False), UIScreen())
+
+        self.assertNotIn("'c' to continue", self.sink.getvalue())
+
+    def test_exhausted_answers_end_loop(self):
+        screen = CountingScreen()
+        reader = ScriptedInputReader(["a"])
+
+        self._run(reader, screen)
+
+        self.assertEqual(screen.inputs, ["a"])
+
+    def test_no_thread_started(self):
+        threads = threading.active_count()
+
+        self._run(ScriptedInputReader(["a", "b"]), CountingScreen(), CountingScreen())
+
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_blocking_input(self):
+        screen = BlockingInputScreen()
+
+        self._run(ScriptedInputReader(["secret"]), screen)
+
+        self.assertEqual(screen.value, "secret")
+        # hidden input is not echoed
+        self.assertNotIn("secret", self.sink.getvalue())
+
+    def test_blocking_input_stats(self):
+        reader = ScriptedInputReader(["secret"])
+
+        self._run(reader, BlockingInputScreen())
+
+        self.assertEqual(list(reader.stats.screen_times), ["BlockingInputScreen"])
+
+    def test_echo_without_prompt(self):
+        request = Mock(requester_source=None, line_input=True)
+        request.text_prompt.return_value = None
+
+        ScriptedInputReader(["a"]).start(request)
+
+        self.assertEqual(self.sink.getvalue(), "a\n")
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "answers.txt")
+            with open(path, "wt", encoding="utf-8") as f:
+                f.write("a\n\nb\n")
+
+            reader = ScriptedInputReader.from_file(path)
+
+        screen = CountingScreen()
+        self._run(reader, screen)
+
+        self.assertEqual(screen.inputs, ["a", "", "b"])
+
+    def test_from_session(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "session.log.gz")
+            for answers in (["a"], ["b", "c"]):
+                with SessionRecorder(path) as recorder:
+                    for answer in answers:
+                        recorder.input_received(object(), answer)
+
+            reader = ScriptedInputReader.from_session(path, session=0)
+
+            with self.assertRaises(ValueError):
+                ScriptedInputReader.from_session(path, session=2)
+
+        screen = CountingScreen()
+        self._run(reader, screen)
+
+        self.assertEqual(screen.inputs, ["a"])
+
+    def test_from_invalid_session(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "session.log.gz")
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                f.write('{"type":"input","t":0,"screen":"object","data":"a"}\n')
+
+            with self.assertRaises(ValueError):
+                ScriptedInputReader.from_session(path)
+
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                f.write('{"type":"frame","t":0,"screen":"object","height":0,"changes":[]}\n')
+
+            with self.assertRaises(ValueError):
+                ScriptedInputReader.from_session(path)
+
+
+class CountingScreen(UIScreen):
+
+    def __init__(self):
+        super().__init__()
+        self.inputs = []
+
+    def input(self, args, key):
+        self.inputs.append(key)
+        return InputState.PROCESSED_AND_REDRAW
+
+
+class BlockingInputScreen(UIScreen):
+
+    def __init__(self):
+        super().__init__()
+        self.input_required = False
+        self.value = None
+
+    def show_all(self):
+        super().show_all()
+        self.value = self.get_user_input("Password: ", hidden=True)
+        self.close()
@@ -0,0 +1,222 @@
+# Session recorder test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from io import StringIO
+from unittest.mock import patch
+
+from simpleline import App
+from simpleline.input.input_threading import InputThreadManager
+from simpleline.input.scripted_input import ScriptedInputReader
+from simpleline.render.output_sinks import MemoryOutputSink
+from simpleline.render.screen import UIScreen, InputState
+from simpleline.render.session_recorder import SessionRecorder, read_session, replay_frames
+from simpleline.render.widgets import TextWidget
+
+
+class SessionRecorder_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self._tmp_dir, "session.log.gz")
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def _records(self, record_type=None):
+        return [r for r in read_session(self.path)
+                if record_type is None or r["type"] == record_type]
+
+    def test_frame_diff(self):
+        screen = object()
+        with SessionRecorder(self.path) as recorder:
+            recorder.frame_drawn(screen, ["a", "b", "c"])
+            recorder.frame_drawn(screen, ["a", "x", "c", "d"])
+            recorder.frame_drawn(screen, ["a"])
+
+        frames = self._records("frame")
+        self.assertEqual(frames[0]["changes"], [[0, "a"], [1, "b"], [2, "c"]])
+        self.assertEqual(frames[1]["changes"], [[1, "x"], [3, "d"]])
+        self.assertEqual(frames[2]["changes"], [])
+        self.assertEqual(frames[2]["height"], 1)
+        self.assertEqual(frames[2]["screen"], "object")
+
+        replayed = [lines for _t, _screen, lines in replay_frames(self._records())]
+        self.assertEqual(replayed, [["a", "b", "c"], ["a", "x", "c", "d"], ["a"]])
+
+    def test_input(self):
+        screen = object()
+        with SessionRecorder(self.path) as recorder:
+            recorder.input_received(screen, "1")
+            recorder.input_received(screen, "secret", hidden=True)
+
+        inputs = self._records("input")
+        self.assertEqual([r["data"] for r in inputs], ["1", None])
+        self.assertLessEqual(inputs[0]["t"], inputs[1]["t"])
+
+    def test_record_hidden_input(self):
+        with SessionRecorder(self.path, record_hidden_input=True) as recorder:
+            recorder.input_received(object(), "secret", hidden=True)
+
+        self.assertEqual(self._records("input")[0]["data"], "secret")
+
+    def test_buffered_writes(self):
+        with SessionRecorder(self.path, buffer_size=3) as recorder:
+            recorder.input_received(object(), "1")
+            self.assertFalse(os.path.exists(self.path))
+
+            # session record and two inputs fill the buffer
+            recorder.input_received(object(), "2")
+            self.assertEqual(len(self._records()), 3)
+
+        recorder.input_received(object(), "3")
+        recorder.flush()
+        self.assertTrue(recorder.closed)
+        self.assertEqual(len(self._records()), 3)
+
+    def test_sessions_appended(self):
+        for data in ("1", "2"):
+            with SessionRecorder(self.path) as recorder:
+                recorder.input_received(object(), data)
+
+        records = self._records()
+        self.assertEqual([r["type"] for r in records], ["session", "input", "session", "input"])
+        self.assertEqual(records[0]["version"], 1)
+
+
+class RecordedSession_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self._tmp_dir, "session.log.gz")
+        App.initialize()
+        App.get_configuration().output_sink = MemoryOutputSink()
+
+    def tearDown(self):
+        App.initialize()
+        shutil.rmtree(self._tmp_dir)
+
+    def _run(self, reader, recorder, screen=None):
+        with recorder:
+            App.get_scheduler().recorder = recorder
+            InputThreadManager.get_instance().reader = reader
+            App.get_scheduler().schedule_screen(screen or CounterScreen())
+            App.run()
+
+    def test_record_and_replay(self):
+        self._run(ScriptedInputReader(["a", "b"]), SessionRecorder(self.path))
+
+        records = list(read_session(self.path))
+        self.assertEqual([r["data"] for r in records if r["type"] == "input"], ["a", "b"])
+
+        frames = list(replay_frames(records))
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(frames[0][1], "CounterScreen")
+        self.assertIn("Counter: 2", frames[2][2])
+
+        # only the counter line changed in the second frame
+        frame_records = [r for r in records if r["type"] == "frame"]
+        self.assertEqual(len(frame_records[1]["changes"]), 1)
+
+        # replay the recorded answers
+        App.initialize()
+        App.get_configuration().output_sink = MemoryOutputSink()
+        replay_path = os.path.join(self._tmp_dir, "replay.log.gz")
+        self._run(ScriptedInputReader.from_session(self.path), SessionRecorder(replay_path))
+
+        replayed = [lines for _t, _screen, lines in replay_frames(read_session(replay_path))]
+        self.assertEqual(replayed, [lines for _t, _screen, lines in frames])
+
+    def test_blocking_input_recorded(self):
+        self._run(ScriptedInputReader(["a", "Joe", "b", "Ann"]), SessionRecorder(self.path),
+                  NameScreen())
+
+        inputs = [r for r in read_session(self.path) if r["type"] == "input"]
+        self.assertEqual([r["data"] for r in inputs], ["a", "Joe", "b", "Ann"])
+        self.assertEqual({r["screen"] for r in inputs}, {"NameScreen"})
+
+    def test_written_lines_recorded(self):
+        self._run(ScriptedInputReader(["a"]), SessionRecorder(self.path), PrintingScreen())
+
+        lines = list(replay_frames(read_session(self.path)))[0][2]
+        separator = App.get_configuration().width * "="
+        self.assertEqual(lines[:2], [separator, separator])
+        self.assertEqual(lines[2:], ["Counter: 0", "Printed"])
+
+    def test_flushed_when_app_ends(self):
+        with SessionRecorder(self.path) as recorder:
+            App.get_scheduler().recorder = recorder
+            InputThreadManager.get_instance().reader = ScriptedInputReader(["a"])
+            App.get_scheduler().schedule_screen(CounterScreen())
+            App.run()
+
+            self.assertFalse(recorder.closed)
+            inputs = [r for r in read_session(self.path) if r["type"] == "input"]
+            self.assertEqual(len(inputs), 1)
+
+    @patch("sys.excepthook")
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_flushed_when_app_killed(self, _stdout_mock, _excepthook_mock):
+        with SessionRecorder(self.path) as recorder:
+            App.get_scheduler().recorder = recorder
+            InputThreadManager.get_instance().reader = ScriptedInputReader(["a", "fail"])
+            App.get_scheduler().schedule_screen(CounterScreen())
+
+            with self.assertRaises(SystemExit):
+                App.run()
+
+            inputs = [r["data"] for r in read_session(self.path) if r["type"] == "input"]
+            self.assertEqual(inputs, ["a", "fail"])
+
+
+class CounterScreen(UIScreen):
+
+    def __init__(self):
+        super().__init__()
+        self._counter = 0
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        self.window.add(TextWidget("Counter: {}".format(self._counter)))
+
+    def input(self, args, key):
+        if key == "fail":
+            raise ValueError("Input failed")
+
+        self._counter += 1
+        return InputState.PROCESSED_AND_REDRAW
+
+
+class PrintingScreen(CounterScreen):
+
+    def show_all(self):
+        super().show_all()
+        print("Printed")
+
+
+class NameScreen(CounterScreen):
+
+    def input(self, args, key):
+        self.get_user_input("Name: ")
+        return super().input(args, key)
@@ -0,0 +1,122 @@
+# Event loop tracing test classes.
+#
+# This file is part of Simpleline Text UI library.
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# Simpleline is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Simpleline is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from io import StringIO
+
+from simpleline.event_loop import AbstractSignal
+from simpleline.event_loop.main_loop import MainLoop
+from simpleline.event_loop.tracing import EventLoopTracer
+
+
+class EventLoopTracer_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = MainLoop()
+        self.tracer = EventLoopTracer()
+        self.loop.tracer = self.tracer
+
+    def _slow_handler(self, signal, data):
+        time.sleep(0.01)
+
+    def _events(self, phase):
+        return [e for e in self.tracer.events if e["ph"] == phase]
+
+    def test_disabled(self):
+        self.loop.tracer = None
+        signal = SignalMock()
+
+        self.loop.enqueue_signal(signal)
+        self.loop.process_signals()
+
+        self.assertIsNone(signal.enqueue_time)
+        self.assertEqual(self.tracer.events, [])
+
+    def test_queue_wait(self):
+        signal = SignalMock()
+        self.loop.enqueue_signal(signal)
+        self.assertIsNotNone(signal.enqueue_time)
+        time.sleep(0.01)
+        self.loop.process_signals()
+
+        begin, end = self._events("b") + self._events("e")
+        self.assertEqual(begin["name"], "SignalMock")
+        self.assertEqual(begin["cat"], "queue")
+        self.assertEqual(begin["id"], end["id"])
+        self.assertGreaterEqual(end["ts"] - begin["ts"], 10000)
+
+    def test_handler_time(self):
+        self.loop.register_signal_handler(SignalMock, self._slow_handler)
+
+        self.loop.enqueue_signal(SignalMock())
+        self.loop.process_signals()
+
+        handler_events = self._events("X")
+        self.assertEqual(len(handler_events), 1)
+        self.assertEqual(handler_events[0]["name"], "EventLoopTracer_TestCase._slow_handler")
+        self.assertEqual(handler_events[0]["args"]["signal"], "SignalMock")
+        self.assertGreaterEqual(handler_events[0]["dur"], 10000)
+
+    def test_batch(self):
+        signals = [SignalMock(), SignalMock()]
+
+        self.loop.enqueue_signals(signals)
+        self.loop.process_signals()
+
+        self.assertTrue(all(s.enqueue_time is not None for s in signals))
+        self.assertEqual(len(self._events("b")), 2)
+
+    def test_max_events(self):
+        self.loop.tracer = EventLoopTracer(max_events=2)
+        for _ in range(3):
+            self.loop.enqueue_signal(SignalMock())
+        self.loop.process_signals()
+
+        self.assertEqual(len(self.loop.tracer.events), 2)
+
+    def test_dump(self):
+        self.loop.register_signal_handler(SignalMock, self._slow_handler)
+        self.loop.enqueue_signal(SignalMock())
+        self.loop.process_signals()
+
+        stream = StringIO()
+        self.tracer.dump(stream)
+        data = json.loads(stream.getvalue())
+        self.assertEqual(len(data["traceEvents"]), 3)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trace.json")
+            self.tracer.dump(path)
+            with open(path, "rt", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), data)
+
+        self.tracer.clear()
+        self.assertEqual(self.tracer.events, [])
+
+
+class SignalMock(AbstractSignal):
+
+    def __init__(self):
+        # ignore source
+        super().__init__(None)
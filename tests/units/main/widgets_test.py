@@ -18,16 +18,19 @@
 # along with Simpleline.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import threading
+import time
 import unittest
 
 from io import StringIO
 from unittest.mock import patch
 
 from simpleline import App
+from simpleline.event_loop.signals import ProgressSignal
 from simpleline.render.prompt import Prompt
 from simpleline.render.screen import UIScreen
 from simpleline.render.widgets import TextWidget, SeparatorWidget, CheckboxWidget, CenterWidget, \
-    ColumnWidget, EntryWidget
+    ColumnWidget, EntryWidget, ProgressWidget, wrap_words, wrap_cache_info, clear_wrap_cache
 
 
 class BaseWidgets_TestCase(unittest.TestCase):
@@ -240,6 +243,213 @@ class Widgets_TestCase(BaseWidgets_TestCase):
         self.evaluate_result(w.get_lines(), expected_result=expected_result)
 
 
+class DirtyTracking_TestCase(unittest.TestCase):
+
+    def test_widget_rendered_only_when_dirty(self):
+        w = TextWidget("Text")
+
+        self.assertTrue(w.is_dirty)
+        self.assertTrue(w.render_if_dirty(20))
+        self.assertFalse(w.is_dirty)
+        self.assertFalse(w.render_if_dirty(20))
+
+        # different width needs a new render
+        self.assertTrue(w.render_if_dirty(10))
+
+    def test_text_change_marks_dirty(self):
+        w = TextWidget("Text")
+        w.render_if_dirty(20)
+
+        w.text = "New text"
+        self.assertTrue(w.is_dirty)
+        self.assertTrue(w.render_if_dirty(20))
+        self.assertEqual(w.get_lines(), ["New text"])
+
+    def test_entry_value_change(self):
+        w = EntryWidget("Title", "Value")
+        w.render_if_dirty(20)
+
+        w.value = "Changed"
+        self.assertTrue(w.render_if_dirty(20))
+        self.assertEqual(w.get_lines(), ["Title", "Changed"])
+
+    def test_not_tracking_widget_is_always_dirty(self):
+        w = ColumnWidget([(10, [TextWidget("Text")])])
+        w.render(20)
+
+        self.assertTrue(w.is_dirty)
+        self.assertTrue(w.render_if_dirty(20))
+
+    def test_tracking_is_not_inherited(self):
+        class CustomTextWidget(TextWidget):
+            pass
+
+        class TrackingTextWidget(TextWidget):
+            tracks_changes = True
+
+        w = CustomTextWidget("Text")
+        w.render_if_dirty(20)
+        self.assertTrue(w.is_dirty)
+        self.assertTrue(w.render_if_dirty(20))
+
+        w = TrackingTextWidget("Text")
+        w.render_if_dirty(20)
+        self.assertFalse(w.render_if_dirty(20))
+
+    def test_center_widget_dirty_by_child(self):
+        text = TextWidget("Text")
+        w = CenterWidget(text)
+        w.render_if_dirty(20)
+        self.assertFalse(w.is_dirty)
+
+        text.text = "Longer text"
+        self.assertTrue(w.is_dirty)
+        w.render_if_dirty(20)
+        self.assertEqual(w.get_lines(), ["    Longer text"])
+
+    def test_checkbox_change_marks_dirty(self):
+        w = CheckboxWidget(title="Title", completed=False)
+        w.render_if_dirty(20)
+
+        w.completed = True
+        self.assertTrue(w.render_if_dirty(20))
+        self.assertEqual(w.get_lines(), ["[x] Title"])
+
+
+class WrapCache_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        clear_wrap_cache()
+
+    def tearDown(self):
+        clear_wrap_cache()
+
+    def test_wrap_words(self):
+        # full width line is wrapped later by the width based wrapping logic
+        self.assertEqual(wrap_words("aaa bbb ccc", 7), "aaa bbbccc")
+        self.assertEqual(wrap_words("aaa bbb ccc", 8), "aaa bbb\nccc")
+        self.assertEqual(wrap_words("aaa\nbbb ccc", 5), "aaa\nbbb\nccc")
+
+    def test_cache_shared_by_widgets(self):
+        TextWidget("Some long text to wrap").render(10)
+        TextWidget("Some long text to wrap").render(10)
+
+        info = wrap_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_width_is_part_of_key(self):
+        w = TextWidget("Some long text to wrap")
+        w.render(10)
+        lines_10 = w.get_lines()
+        w.render(15)
+
+        self.assertEqual(wrap_cache_info().misses, 2)
+        self.assertNotEqual(lines_10, w.get_lines())
+
+    def test_clear_cache(self):
+        wrap_words("text", 10)
+        clear_wrap_cache()
+
+        info = wrap_cache_info()
+        self.assertEqual(info.currsize, 0)
+        self.assertEqual(info.misses, 0)
+
+
+class ProgressWidget_TestCase(unittest.TestCase):
+
+    def setUp(self):
+        App.initialize()
+
+    def tearDown(self):
+        App.initialize()
+
+    def test_render(self):
+        w = ProgressWidget(total=10)
+        w.update(5, "Installing")
+        w.render(20)
+
+        self.assertEqual(w.get_lines(), ["[######------]   50%", "Installing"])
+
+    def test_render_without_message(self):
+        w = ProgressWidget(total=4)
+        w.update(10)
+        w.render(16)
+
+        self.assertEqual(w.value, 4)
+        self.assertEqual(w.get_lines(), ["[########]  100%"])
+
+    def test_updates_folded_to_one_signal(self):
+        received = []
+        loop = App.get_event_loop()
+        loop.register_signal_handler(ProgressSignal,
+                                     lambda signal, data: received.append(signal.source))
+
+        w = ProgressWidget()
+        for i in range(100):
+            w.update(i)
+        loop.process_signals()
+
+        self.assertEqual(received, [w])
+
+    def test_dropped_updates(self):
+        w = ProgressWidget()
+        for i in range(10):
+            w.update(i)
+        w.render(40)
+        w.update(20)
+        w.render(40)
+        # nothing new to show
+        w.render(40)
+
+        self.assertEqual(w.update_count, 11)
+        self.assertEqual(w.render_count, 2)
+        self.assertEqual(w.dropped_count, 9)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_rate_limited_redraw(self, _):
+        screen = ProgressScreen(total=500, max_fps=50)
+
+        App.get_scheduler().schedule_screen(screen)
+        App.run()
+
+        w = screen.widget
+        self.assertEqual(w.update_count, 500)
+        self.assertLess(w.render_count, 100)
+        self.assertEqual(w.render_count + w.dropped_count, w.update_count)
+        # the last state was shown
+        self.assertIn("100%", screen.last_lines[0])
+
+
+class ProgressScreen(UIScreen):
+
+    def __init__(self, total, max_fps):
+        super().__init__()
+        self.input_required = False
+        self.widget = ProgressWidget(total, max_fps)
+        self.last_lines = None
+
+    def setup(self, args):
+        super().setup(args)
+        threading.Thread(target=self._work, daemon=True).start()
+        return True
+
+    def _work(self):
+        for i in range(self.widget.total):
+            self.widget.update(i + 1)
+            time.sleep(0.0005)
+
+    def refresh(self, args=None):
+        super().refresh(args)
+        self.window.add(self.widget)
+
+    def show_all(self):
+        super().show_all()
+        self.last_lines = self.widget.get_lines()
+        if self.widget.value == self.widget.total:
+            self.close()
+
+
 @patch('simpleline.input.input_handler.InputHandlerRequest._get_input')
 @patch('sys.stdout', new_callable=StringIO)
 class WidgetProcessing_TestCase(unittest.TestCase):